@@ -1,169 +1,187 @@
 """Tool management for LLM API - file operation tools and execution framework"""
+import copy
 from pathlib import Path
-from typing import Dict, Any, List, Callable
+from typing import Dict, Any, List, Callable, Tuple
+
+# Files larger than this are refused by read/edit tools instead of loaded into memory
+_MAX_FILE_SIZE = 10 * 1024 * 1024
+
+# Success-path message prefixes (concatenated with the filepath)
+_MSG_CREATE_OK = "Successfully created file: "
+_MSG_EDIT_OK = "Successfully edited file: "
+_MSG_REMOVE_OK = "Successfully removed file: "
+
+# OpenAI-compatible schema for the file tools; built once, and handed out as
+# copies so a caller editing its schema cannot change later requests
+_FILE_TOOLS_SCHEMA: List[Dict[str, Any]] = [
+    {
+        "type": "function",
+        "function": {
+            "name": "create_file",
+            "description": "Create a new file with the specified content. Returns success message or error.",
+            "parameters": {
+                "type": "object",
+                "properties": {
+                    "filepath": {
+                        "type": "string",
+                        "description": "Path where the file should be created (relative or absolute)"
+                    },
+                    "content": {
+                        "type": "string",
+                        "description": "Content to write to the file"
+                    }
+                },
+                "required": ["filepath", "content"]
+            }
+        }
+    },
+    {
+        "type": "function",
+        "function": {
+            "name": "edit_file",
+            "description": "Edit an existing file by replacing the first occurrence of old content with new content. Returns success message or error.",
+            "parameters": {
+                "type": "object",
+                "properties": {
+                    "filepath": {
+                        "type": "string",
+                        "description": "Path to the file to edit"
+                    },
+                    "old_content": {
+                        "type": "string",
+                        "description": "Content to find and replace (must match exactly)"
+                    },
+                    "new_content": {
+                        "type": "string",
+                        "description": "New content to replace the old content with"
+                    }
+                },
+                "required": ["filepath", "old_content", "new_content"]
+            }
+        }
+    },
+    {
+        "type": "function",
+        "function": {
+            "name": "remove_file",
+            "description": "Delete a file from the filesystem. Returns success message or error.",
+            "parameters": {
+                "type": "object",
+                "properties": {
+                    "filepath": {
+                        "type": "string",
+                        "description": "Path to the file to remove"
+                    }
+                },
+                "required": ["filepath"]
+            }
+        }
+    },
+    {
+        "type": "function",
+        "function": {
+            "name": "read_file",
+            "description": "Read the contents of a file. Returns file content or error.",
+            "parameters": {
+                "type": "object",
+                "properties": {
+                    "filepath": {
+                        "type": "string",
+                        "description": "Path to the file to read"
+                    }
+                },
+                "required": ["filepath"]
+            }
+        }
+    }
+]
 
 
 class ToolManager:
     """Manages tool definitions and execution for file operations"""
 
     def __init__(self):
-        self._tools: Dict[str, Callable] = {}
+        self._tools: Dict[str, Tuple[Callable[..., str], Tuple[str, ...]]] = {}
         self._initialize_file_tools()
 
     def _initialize_file_tools(self):
-        """Initialize file operation tools."""
+        """Initialize file operation tools as (function, argument names) pairs."""
         self._tools = {
-            "create_file": self._tool_create_file,
-            "edit_file": self._tool_edit_file,
-            "remove_file": self._tool_remove_file,
-            "read_file": self._tool_read_file,
+            "create_file": (self._tool_create_file, ("filepath", "content")),
+            "edit_file": (self._tool_edit_file, ("filepath", "old_content", "new_content")),
+            "remove_file": (self._tool_remove_file, ("filepath",)),
+            "read_file": (self._tool_read_file, ("filepath",)),
         }
 
     def get_file_tools_schema(self) -> List[Dict[str, Any]]:
-        """Get OpenAI-compatible tool schema for file operations."""
-        return [
-            {
-                "type": "function",
-                "function": {
-                    "name": "create_file",
-                    "description": "Create a new file with the specified content. Returns success message or error.",
-                    "parameters": {
-                        "type": "object",
-                        "properties": {
-                            "filepath": {
-                                "type": "string",
-                                "description": "Path where the file should be created (relative or absolute)"
-                            },
-                            "content": {
-                                "type": "string",
-                                "description": "Content to write to the file"
-                            }
-                        },
-                        "required": ["filepath", "content"]
-                    }
-                }
-            },
-            {
-                "type": "function",
-                "function": {
-                    "name": "edit_file",
-                    "description": "Edit an existing file by replacing old content with new content. Returns success message or error.",
-                    "parameters": {
-                        "type": "object",
-                        "properties": {
-                            "filepath": {
-                                "type": "string",
-                                "description": "Path to the file to edit"
-                            },
-                            "old_content": {
-                                "type": "string",
-                                "description": "Content to find and replace (must match exactly)"
-                            },
-                            "new_content": {
-                                "type": "string",
-                                "description": "New content to replace the old content with"
-                            }
-                        },
-                        "required": ["filepath", "old_content", "new_content"]
-                    }
-                }
-            },
-            {
-                "type": "function",
-                "function": {
-                    "name": "remove_file",
-                    "description": "Delete a file from the filesystem. Returns success message or error.",
-                    "parameters": {
-                        "type": "object",
-                        "properties": {
-                            "filepath": {
-                                "type": "string",
-                                "description": "Path to the file to remove"
-                            }
-                        },
-                        "required": ["filepath"]
-                    }
-                }
-            },
-            {
-                "type": "function",
-                "function": {
-                    "name": "read_file",
-                    "description": "Read the contents of a file. Returns file content or error.",
-                    "parameters": {
-                        "type": "object",
-                        "properties": {
-                            "filepath": {
-                                "type": "string",
-                                "description": "Path to the file to read"
-                            }
-                        },
-                        "required": ["filepath"]
-                    }
-                }
-            }
-        ]
+        """Get OpenAI-compatible tool schema for file operations (a fresh copy)."""
+        return copy.deepcopy(_FILE_TOOLS_SCHEMA)
 
     def _tool_create_file(self, filepath: str, content: str) -> str:
         """Tool function to create a file."""
-        try:
-            file_path = Path(filepath)
-            # Create parent directories if they don't exist
-            file_path.parent.mkdir(parents=True, exist_ok=True)
-            # Write content to file
-            file_path.write_text(content)
-            return f"Successfully created file: {filepath}"
-        except Exception as e:
-            return f"Error creating file {filepath}: {str(e)}"
+        file_path = Path(filepath)
+        # Create parent directories if they don't exist
+        file_path.parent.mkdir(parents=True, exist_ok=True)
+        # Write content to file (encode once, no text-mode wrapper)
+        file_path.write_bytes(content.encode("utf-8"))
+        return _MSG_CREATE_OK + filepath
 
     def _tool_edit_file(self, filepath: str, old_content: str, new_content: str) -> str:
         """Tool function to edit a file."""
-        try:
-            file_path = Path(filepath)
-            if not file_path.exists():
-                return f"Error: File {filepath} does not exist"
+        file_path = Path(filepath)
+        if not file_path.exists():
+            return f"Error: File {filepath} does not exist"
+        if file_path.stat().st_size > _MAX_FILE_SIZE:
+            return f"Error: File {filepath} is too large to edit"
 
-            current_content = file_path.read_text()
+        current_content = file_path.read_bytes().decode("utf-8")
+        # Single scan: str.replace returns the same object when nothing
+        # matched (or old == new), so only then check membership
+        updated_content = current_content.replace(old_content, new_content, 1)
+        if updated_content is current_content:
             if old_content not in current_content:
                 return f"Error: Old content not found in {filepath}"
+            return _MSG_EDIT_OK + filepath
 
-            updated_content = current_content.replace(old_content, new_content)
-            file_path.write_text(updated_content)
-            return f"Successfully edited file: {filepath}"
-        except Exception as e:
-            return f"Error editing file {filepath}: {str(e)}"
+        file_path.write_bytes(updated_content.encode("utf-8"))
+        return _MSG_EDIT_OK + filepath
 
     def _tool_remove_file(self, filepath: str) -> str:
         """Tool function to remove a file."""
-        try:
-            file_path = Path(filepath)
-            if not file_path.exists():
-                return f"Error: File {filepath} does not exist"
+        file_path = Path(filepath)
+        if not file_path.exists():
+            return f"Error: File {filepath} does not exist"
 
-            file_path.unlink()
-            return f"Successfully removed file: {filepath}"
-        except Exception as e:
-            return f"Error removing file {filepath}: {str(e)}"
+        file_path.unlink()
+        return _MSG_REMOVE_OK + filepath
 
     def _tool_read_file(self, filepath: str) -> str:
         """Tool function to read a file."""
-        try:
-            file_path = Path(filepath)
-            if not file_path.exists():
-                return f"Error: File {filepath} does not exist"
+        file_path = Path(filepath)
+        if not file_path.exists():
+            return f"Error: File {filepath} does not exist"
+        if file_path.stat().st_size > _MAX_FILE_SIZE:
+            return f"Error: File {filepath} is too large to read"
 
-            content = file_path.read_text()
-            return f"Content of {filepath}:\n{content}"
-        except Exception as e:
-            return f"Error reading file {filepath}: {str(e)}"
+        content = file_path.read_text()
+        return f"Content of {filepath}:\n{content}"
 
     def execute_tool(self, tool_name: str, arguments: Dict[str, Any]) -> str:
         """Execute a tool by name with given arguments."""
-        if tool_name not in self._tools:
+        entry = self._tools.get(tool_name)
+        if entry is None:
             return f"Error: Unknown tool '{tool_name}'"
 
-        tool_func = self._tools[tool_name]
+        tool_func, arg_names = entry
+        try:
+            # Positional call avoids building a kwargs dict per invocation
+            args = [arguments[name] for name in arg_names]
+        except KeyError as e:
+            return f"Error executing tool {tool_name}: missing argument {e}"
+
+        # Tool functions are straight-line code; failures are reported here
         try:
-            return tool_func(**arguments)
+            return tool_func(*args)
         except Exception as e:
-            return f"Error executing tool {tool_name}: {str(e)}"
+            filepath = arguments.get("filepath", "?")
+            return f"Error executing tool {tool_name} on {filepath}: {str(e)}"
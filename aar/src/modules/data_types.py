@@ -32,6 +32,7 @@ class FixReport:
     fixes_applied: List[str]
     summary: str
     success: bool
+    remaining_violations: List[Dict[str, Any]] = field(default_factory=list)
 
 
 @dataclass
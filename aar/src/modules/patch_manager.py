@@ -1,10 +1,13 @@
 """Patch manager module for safe patch application"""
 
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional
+from typing import Dict, List, Optional, Union
+import itertools
+import os
 import shutil
 import logging
-from datetime import datetime
+import time
 
 from modules.data_types import PatchToon
 
@@ -24,6 +27,7 @@ class PatchManager:
         """
         self.create_backups = create_backups
         self._base_dir = Path.cwd()
+        self._backup_counter = itertools.count()
 
     def _resolve_file_path(self, file_path: str) -> Path:
         """
@@ -71,6 +75,24 @@ class PatchManager:
             logger.error(f"Target file not found: {target_path}")
             return False
 
+        try:
+            content = target_path.read_text()
+        except Exception as e:
+            logger.error(f"Failed to read {target_path}: {e}")
+            return False
+
+        # No-op patch: skip backup and write when the target lines already
+        # hold new_code and old_code is not left to replace anywhere else
+        target_lines = content.split("\n")
+        target_start, target_end = patch.line_range[0] - 1, patch.line_range[1]
+        if (
+            0 <= target_start < target_end <= len(target_lines)
+            and "\n".join(target_lines[target_start:target_end]) == patch.new_code
+            and (patch.old_code == patch.new_code or patch.old_code not in content)
+        ):
+            logger.info(f"Patch already applied to {target_path}, skipping write")
+            return True
+
         backup_path = None
         if self.create_backups:
             backup_path = self.create_backup(target_path)
@@ -78,7 +100,6 @@ class PatchManager:
                 logger.warning(f"Failed to create backup for {target_path}")
 
         try:
-            content = target_path.read_text()
             lines = content.split("\n")
 
             start_idx = patch.line_range[0] - 1
@@ -153,6 +174,42 @@ class PatchManager:
                 self.restore_backup(backup_path, target_path)
             return False
 
+    def apply_patches_parallel(self, patches: List[PatchToon]) -> List[bool]:
+        """
+        Apply multiple patches, running different target files concurrently
+
+        Patches targeting the same file are applied serially in the given
+        order; distinct files are dispatched to a thread pool since patch
+        application is IO-bound.
+
+        Args:
+            patches: Patches to apply
+
+        Returns:
+            List of per-patch results, in the same order as ``patches``
+        """
+        groups: Dict[Path, List[int]] = {}
+        for index, patch in enumerate(patches):
+            target_path = self._resolve_file_path(patch.file_path)
+            groups.setdefault(target_path, []).append(index)
+
+        results = [False] * len(patches)
+
+        def apply_group(indices: List[int]) -> None:
+            for index in indices:
+                results[index] = self.apply_patch(patches[index])
+
+        if len(groups) <= 1:
+            for indices in groups.values():
+                apply_group(indices)
+            return results
+
+        max_workers = min(32, (os.cpu_count() or 1) * 4, len(groups))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            list(executor.map(apply_group, groups.values()))
+
+        return results
+
     def create_backup(self, target_path: Path) -> Optional[Path]:
         """
         Create backup of target file before patch application
@@ -164,8 +221,11 @@ class PatchManager:
             Path to backup file, or None if failed
         """
         try:
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            backup_name = f"backup_{timestamp}_{target_path.name}"
+            # time_ns + counter keeps names unique and sortable, even for
+            # patches applied in the same second or from parallel threads
+            backup_name = (
+                f"backup_{time.time_ns()}_{next(self._backup_counter)}_{target_path.name}"
+            )
             backup_dir = target_path.parent / ".repair_backups"
             backup_dir.mkdir(exist_ok=True)
             backup_path = backup_dir / backup_name
@@ -197,20 +257,29 @@ class PatchManager:
             logger.error(f"Failed to restore backup: {e}")
             return False
 
-    def atomic_write(self, target_path: Path, content: str) -> None:
+    def atomic_write(self, target_path: Path, content: Union[str, bytes]) -> None:
         """
-        Atomically write content to file (POSIX-safe)
+        Atomically write content to file (POSIX and Windows safe)
 
         Args:
             target_path: Path to write to
-            content: Content to write
+            content: Content to write; str is encoded to UTF-8 once
 
         Raises:
             IOError: If write fails
         """
+        encoded = content.encode("utf-8") if isinstance(content, str) else content
         tmp_path = target_path.with_suffix(".tmp")
-        tmp_path.write_text(content)
-        tmp_path.rename(target_path)
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            view = memoryview(encoded)
+            while view:
+                written = os.write(fd, view)
+                view = view[written:]
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+        os.replace(tmp_path, target_path)
         logger.debug(f"Atomically wrote to {target_path}")
 
     def verify_patch(self, target_path: Path, patch: PatchToon) -> bool:
@@ -1,7 +1,9 @@
 """Static fixer module using Ruff for auto-fixing"""
 
+import json
 import subprocess
 from pathlib import Path
+from typing import Any, Dict, List, Tuple
 import logging
 
 from modules.data_types import FixReport
@@ -15,6 +17,8 @@ class StaticFixer:
 
     def __init__(self, ruff_rules: str = "E,F,W"):
         self.ruff_rules = ruff_rules
+        # target path -> (mtime_ns after autofix, report)
+        self._last_reports: Dict[str, Tuple[int, FixReport]] = {}
 
     def execute_autofix(self, target_path: Path) -> FixReport:
         """
@@ -39,11 +43,13 @@ class StaticFixer:
                 "ruff",
                 "check",
                 "--fix",
+                "--output-format=json",
                 "--select",
                 self.ruff_rules,
                 str(target_path),
             ]
 
+            before = target_path.read_bytes()
             result = subprocess.run(
                 cmd,
                 capture_output=True,
@@ -51,24 +57,8 @@ class StaticFixer:
                 timeout=60,
             )
 
-            if result.returncode == 0:
-                stdout = result.stdout.strip()
-                if "fixed" in stdout.lower() or result.stderr:
-                    fixes = self._parse_fixes(stdout + result.stderr)
-                    return FixReport(
-                        target_path=str(target_path),
-                        fixes_applied=fixes,
-                        summary=f"Applied {len(fixes)} fixes",
-                        success=True,
-                    )
-                else:
-                    return FixReport(
-                        target_path=str(target_path),
-                        fixes_applied=[],
-                        summary="No fixes needed",
-                        success=True,
-                    )
-            else:
+            # Exit code 1 only means violations remain; 2 is a Ruff error
+            if result.returncode not in (0, 1):
                 return FixReport(
                     target_path=str(target_path),
                     fixes_applied=[],
@@ -76,6 +66,31 @@ class StaticFixer:
                     success=False,
                 )
 
+            remaining = self._parse_diagnostics(result.stdout)
+            fixes = self._parse_fixes(result.stderr)
+            if not fixes and target_path.read_bytes() != before:
+                fixes = [f"Fixed violations in {target_path.name}"]
+
+            if fixes:
+                summary = f"Applied {len(fixes)} fixes"
+            else:
+                summary = "No fixes needed"
+            if remaining:
+                summary += f", {len(remaining)} violations remaining"
+
+            report = FixReport(
+                target_path=str(target_path),
+                fixes_applied=fixes,
+                summary=summary,
+                success=not remaining,
+                remaining_violations=remaining,
+            )
+            self._last_reports[str(target_path)] = (
+                target_path.stat().st_mtime_ns,
+                report,
+            )
+            return report
+
         except FileNotFoundError:
             return FixReport(
                 target_path=str(target_path),
@@ -109,9 +124,24 @@ class StaticFixer:
 
         return fixes
 
+    def _parse_diagnostics(self, output: str) -> List[Dict[str, Any]]:
+        """Parse Ruff JSON output into the list of remaining violations"""
+        if not output.strip():
+            return []
+        try:
+            diagnostics = json.loads(output)
+        except json.JSONDecodeError:
+            logger.warning("Could not parse Ruff JSON output")
+            return []
+        return diagnostics if isinstance(diagnostics, list) else []
+
     def validate_fixes(self, target_path: Path) -> bool:
         """
-        Validate that fixes were successful by running Ruff check again
+        Validate that fixes were successful
+
+        Reuses the diagnostics from the last execute_autofix run on the same
+        file when it has not been modified since; otherwise runs Ruff check
+        again.
 
         Args:
             target_path: Path to validate
@@ -119,6 +149,15 @@ class StaticFixer:
         Returns:
             True if no errors found, False otherwise
         """
+        cached = self._last_reports.get(str(target_path))
+        if cached is not None:
+            mtime_ns, report = cached
+            try:
+                if target_path.stat().st_mtime_ns == mtime_ns:
+                    return not report.remaining_violations
+            except OSError:
+                return False
+
         try:
             cmd = [
                 "ruff",
@@ -10,11 +10,16 @@ Usage:
 """
 
 import argparse
+import heapq
+import itertools
 import logging
 import sys
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import partial
 from pathlib import Path
 from datetime import datetime
-from typing import Dict, Any, List
+from operator import itemgetter
+from typing import Dict, Any, List, Optional, Tuple
 
 # Add tools directory and src/modules to path
 sys.path.insert(0, str(Path(__file__).parent / 'tools'))
@@ -27,6 +32,10 @@ from radon_metrics import RadonMetrics
 from modules.toon_utils import ToonSerializer
 
 
+# Complexity grades reported as critical issues
+_BAD_GRADES = frozenset(("F", "D"))
+
+
 class CodeQualityChecker:
     """Main analyzer that orchestrates all quality checking tools."""
 
@@ -36,7 +45,9 @@ class CodeQualityChecker:
         pattern: str = "**/*.py",
         verbose: bool = False,
         max_issues: int = 50,
-        filtered: bool = False
+        filtered: bool = False,
+        changed_files: Optional[List[str]] = None,
+        use_cache: bool = True
     ):
         """
         Initialize code quality checker.
@@ -47,12 +58,15 @@ class CodeQualityChecker:
             verbose: Enable verbose logging
             max_issues: Maximum number of issues to display per category
             filtered: Filter results to top issues (default: False/unfiltered)
+            changed_files: Limit mypy to these files (non-.py entries ignored)
+            use_cache: Reuse cached ruff/radon results for unchanged files
         """
         self.workspace = Path(workspace).resolve()
         self.pattern = pattern
         self.verbose = verbose
         self.max_issues = max_issues
         self.filtered = filtered
+        self.changed_files = [f for f in changed_files or [] if f.endswith('.py')]
 
         # Setup logging
         log_level = logging.DEBUG if verbose else logging.INFO
@@ -64,10 +78,10 @@ class CodeQualityChecker:
         self.logger = logging.getLogger(__name__)
 
         # Initialize checkers
-        self.ruff = RuffChecker(str(self.workspace))
+        self.ruff = RuffChecker(str(self.workspace), use_cache=use_cache)
         self.mypy = MypyAnalyzer(str(self.workspace))
         self.semgrep = SemgrepScanner(str(self.workspace))
-        self.radon = RadonMetrics(str(self.workspace))
+        self.radon = RadonMetrics(str(self.workspace), use_cache=use_cache)
 
         # Results storage
         self.results = {
@@ -84,21 +98,31 @@ class CodeQualityChecker:
         """
         self.logger.info(f"Starting code quality check of {self.workspace}")
 
-        # Stage 1: Ruff linting
-        self.logger.info("=== Stage 1: Ruff Linting ===")
-        ruff_results = self.ruff.check(self.pattern)
-
-        # Stage 2: Mypy type checking
-        self.logger.info("=== Stage 2: Mypy Type Checking ===")
-        mypy_results = self.mypy.analyze(self.pattern)
-
-        # Stage 3: Semgrep security scanning
-        self.logger.info("=== Stage 3: Semgrep Security Scanning ===")
-        semgrep_results = self.semgrep.scan(self.pattern)
-
-        # Stage 4: Radon complexity analysis
-        self.logger.info("=== Stage 4: Radon Complexity Analysis ===")
-        radon_results = self.radon.measure(self.pattern)
+        # Stages 1-4 are independent subprocess-bound tools; run them concurrently
+        stages = {
+            'ruff': ("Stage 1: Ruff Linting", self.ruff.check),
+            'mypy': (
+                "Stage 2: Mypy Type Checking",
+                partial(self.mypy.analyze, changed_files=self.changed_files),
+            ),
+            'semgrep': ("Stage 3: Semgrep Security Scanning", self.semgrep.scan),
+            'radon': ("Stage 4: Radon Complexity Analysis", self.radon.measure),
+        }
+        stage_results: Dict[str, Dict[str, Any]] = {}
+        with ThreadPoolExecutor(max_workers=len(stages)) as executor:
+            futures = {}
+            for name, (label, func) in stages.items():
+                self.logger.info(f"=== {label} (submitted) ===")
+                futures[executor.submit(func, self.pattern)] = name
+            for future in as_completed(futures):
+                name = futures[future]
+                stage_results[name] = future.result()
+                self.logger.info(f"=== {stages[name][0]} (completed) ===")
+
+        ruff_results = stage_results['ruff']
+        mypy_results = stage_results['mypy']
+        semgrep_results = stage_results['semgrep']
+        radon_results = stage_results['radon']
 
         # Stage 5: Synthesis
         self.logger.info("=== Stage 5: Synthesis ===")
@@ -116,11 +140,23 @@ class CodeQualityChecker:
     ):
         """Synthesize all results into TOON-compatible structure."""
 
+        # Bind values shared by score, gates and recommendations once
+        severity_counts = semgrep['severity_counts']
+        sev_err = severity_counts.get('ERROR', 0)
+        sev_warn = severity_counts.get('WARNING', 0)
+        type_cov = mypy.get('type_coverage', 100)
+        ruff_total = ruff['total']
+
         # Calculate total issues
-        total_issues = ruff["total"] + mypy["total"] + semgrep["total"]
+        total_issues = ruff_total + mypy["total"] + semgrep["total"]
+
+        # Walk each tool's findings once for issues, fixes and deductions
+        synthesis = self._single_pass_synthesize(ruff, mypy, semgrep, radon)
 
         # Calculate quality score (0-100)
-        quality_score = self._calculate_quality_score(ruff, mypy, semgrep, radon)
+        quality_score = self._calculate_quality_score(
+            sev_err, sev_warn, type_cov, ruff_total, synthesis['complexity_deduction']
+        )
 
         # Build summary section
         self.results['summary'] = {
@@ -131,13 +167,15 @@ class CodeQualityChecker:
         }
 
         # Build quality gates
-        max_complexity = max([h['complexity'] for h in radon['complexity_hotspots']], default=0)
+        # RadonMetrics returns hotspots sorted by complexity, highest first
+        hotspots = radon['complexity_hotspots']
+        max_complexity = hotspots[0]['complexity'] if hotspots else 0
         self.results['quality_gates'] = [
             {
                 'gate': 'linting_errors',
                 'threshold': '<50',
-                'actual': ruff['total'],
-                'status': 'PASS' if ruff['total'] < 50 else 'FAIL'
+                'actual': ruff_total,
+                'status': 'PASS' if ruff_total < 50 else 'FAIL'
             },
             {
                 'gate': 'type_coverage',
@@ -148,8 +186,8 @@ class CodeQualityChecker:
             {
                 'gate': 'security_critical',
                 'threshold': '0',
-                'actual': semgrep['severity_counts'].get('ERROR', 0),
-                'status': 'PASS' if semgrep['severity_counts'].get('ERROR', 0) == 0 else 'FAIL'
+                'actual': sev_err,
+                'status': 'PASS' if sev_err == 0 else 'FAIL'
             },
             {
                 'gate': 'max_complexity',
@@ -160,7 +198,7 @@ class CodeQualityChecker:
         ]
 
         # Build critical issues list (filtered or unfiltered)
-        self.results['critical_issues'] = self._build_critical_issues(ruff, mypy, semgrep, radon)
+        self.results['critical_issues'] = synthesis['critical_issues']
 
         # Store tool-specific results
         self.results['ruff'] = self._format_ruff_results(ruff)
@@ -169,88 +207,157 @@ class CodeQualityChecker:
         self.results['radon'] = self._format_radon_results(radon)
 
         # Generate recommendations
-        self.results['immediate_fixes'] = self._generate_immediate_fixes(ruff, mypy, semgrep, radon)
+        self.results['immediate_fixes'] = synthesis['immediate_fixes']
         self.results['next_steps'] = self._generate_next_steps(ruff, mypy, semgrep, radon)
 
-    def _calculate_quality_score(self, ruff: Dict, mypy: Dict, semgrep: Dict, radon: Dict) -> int:
+    def _calculate_quality_score(
+        self,
+        sev_err: int,
+        sev_warn: int,
+        type_cov: float,
+        ruff_total: int,
+        complexity_deduction: int
+    ) -> int:
         """Calculate overall quality score (0-100)."""
         score = 100
 
         # Deduct for linting issues
-        score -= min(20, ruff['total'] // 5)
+        score -= min(20, ruff_total // 5)
 
         # Deduct for type coverage
-        type_cov = mypy.get('type_coverage', 100)
         score -= max(0, (100 - type_cov) // 5)
 
         # Deduct for security issues
-        score -= semgrep['severity_counts'].get('ERROR', 0) * 10
-        score -= semgrep['severity_counts'].get('WARNING', 0) * 5
+        score -= sev_err * 10
+        score -= sev_warn * 5
 
-        # Deduct for complexity
-        for hotspot in radon['complexity_hotspots'][:5]:
-            if hotspot['complexity'] > 20:
-                score -= 5
+        # Deduct for complexity (top 5 hotspots over 20, see _single_pass_synthesize)
+        score -= complexity_deduction
 
         return max(0, min(100, score))
 
-    def _build_critical_issues(self, ruff: Dict, mypy: Dict, semgrep: Dict, radon: Dict) -> List[Dict]:
-        """Build prioritized list of critical issues."""
-        issues = []
-
-        # Add security errors (highest priority)
-        for finding in semgrep['findings']:
-            if finding['severity'] == 'ERROR':
-                issues.append({
-                    'severity': 'ERROR',
-                    'tool': 'semgrep',
-                    'file': finding['file'],
-                    'line': finding['line'],
-                    'issue': f"{finding['category']}: {finding['message']}"
-                })
+    def _single_pass_synthesize(self, ruff: Dict, mypy: Dict, semgrep: Dict, radon: Dict) -> Dict[str, Any]:
+        """
+        Build critical issues, immediate fixes and complexity deductions
+        walking each tool's result list exactly once.
 
-        # Add critical complexity issues
-        for hotspot in radon['complexity_hotspots']:
-            if hotspot['grade'] in ['F', 'D']:
-                issues.append({
-                    'severity': 'ERROR' if hotspot['grade'] == 'F' else 'WARNING',
-                    'tool': 'radon',
-                    'file': hotspot['file'],
-                    'line': 0,
-                    'issue': f"Complexity {hotspot['complexity']} ({hotspot['grade']}-grade) in {hotspot['function']}"
-                })
+        Returns:
+            Dictionary with 'critical_issues', 'immediate_fixes' and
+            'complexity_deduction'
+        """
+        filtered = self.filtered
+        # (severity rank, issue) pairs; ERROR=0, WARNING=1
+        ranked: List[Tuple[int, Dict]] = []
+        fixes: List[Dict] = []
+        priority = 1
 
-        # Add critical mypy errors
-        mypy_limit = 5 if self.filtered else len(mypy['errors'])
-        for error in mypy['errors'][:mypy_limit]:
-            if error['severity'] == 'error':
-                issues.append({
-                    'severity': 'ERROR',
-                    'tool': 'mypy',
-                    'file': error['file'],
-                    'line': error['line'],
-                    'issue': error['message']
-                })
+        # Auto-fixable linting
+        if ruff['auto_fixable'] > 0:
+            fixes.append({
+                'priority': priority,
+                'action': 'Run: ruff check --fix src/',
+                'effort': '2min'
+            })
+            priority += 1
 
-        # Add critical ruff errors
-        for issue in ruff['issues']:
-            if issue['severity'] == 'error' and issue['code'].startswith('F'):
-                issues.append({
-                    'severity': 'ERROR',
-                    'tool': 'ruff',
-                    'file': issue['file'],
-                    'line': issue['line'],
-                    'issue': f"{issue['code']}: {issue['message']}"
+        # Security errors (highest priority)
+        findings = semgrep['findings']
+        fix_limit = 5 if filtered else len(findings)
+        collect_fixes = True
+        for index, finding in enumerate(findings):
+            if finding['severity'] != 'ERROR':
+                continue
+            category = finding['category']
+            file_path = finding['file']
+            line = finding['line']
+            ranked.append((0, {
+                'severity': 'ERROR',
+                'tool': 'semgrep',
+                'file': file_path,
+                'line': line,
+                'issue': f"{category}: {finding['message']}"
+            }))
+            if collect_fixes and index < fix_limit:
+                fixes.append({
+                    'priority': priority,
+                    'action': f"Fix {category}: {file_path}:{line}",
+                    'effort': '10min'
                 })
+                priority += 1
+                if filtered and priority > 5:
+                    collect_fixes = False
+
+        # Complexity: critical issues, refactor fixes and score deductions
+        hotspots = radon['complexity_hotspots']
+        hotspot_limit = 5 if filtered else len(hotspots)
+        complexity_deduction = 0
+        collect_fixes = True
+        for index, hotspot in enumerate(hotspots):
+            complexity = hotspot['complexity']
+            grade = hotspot['grade']
+            if index < 5 and complexity > 20:
+                complexity_deduction += 5
+            if grade not in _BAD_GRADES:
+                continue
+            is_f = grade == 'F'
+            ranked.append((0 if is_f else 1, {
+                'severity': 'ERROR' if is_f else 'WARNING',
+                'tool': 'radon',
+                'file': hotspot['file'],
+                'line': 0,
+                'issue': f"Complexity {complexity} ({grade}-grade) in {hotspot['function']}"
+            }))
+            if is_f and collect_fixes and index < hotspot_limit:
+                fixes.append({
+                    'priority': priority,
+                    'action': f"Refactor: {hotspot['file']} (complexity {complexity}→<15)",
+                    'effort': '2hrs'
+                })
+                priority += 1
+                if filtered and priority > 5:
+                    collect_fixes = False
+
+        # Critical mypy and ruff errors only feed critical issues, so they
+        # stay lazy generators and are never materialized when filtered
+        mypy_limit = 5 if filtered else len(mypy['errors'])
+        mypy_gen = (
+            (0, {
+                'severity': 'ERROR',
+                'tool': 'mypy',
+                'file': error.file,
+                'line': error.line,
+                'issue': error.message
+            })
+            for error in itertools.islice(mypy['errors'], mypy_limit)
+            if error.severity == 'error'
+        )
+        ruff_gen = (
+            (0, {
+                'severity': 'ERROR',
+                'tool': 'ruff',
+                'file': issue.file,
+                'line': issue.line,
+                'issue': f"{issue.code}: {issue.message}"
+            })
+            for issue in ruff['issues']
+            if issue.severity == 'error' and issue.code.startswith('F')
+        )
+        issue_gen = itertools.chain(ranked, mypy_gen, ruff_gen)
 
-        # Sort by severity and return top N (or all if not filtered)
-        severity_order = {'ERROR': 0, 'WARNING': 1, 'INFO': 2}
-        issues.sort(key=lambda x: severity_order.get(x['severity'], 3))
-
-        if self.filtered:
-            return issues[:self.max_issues]
+        # Stable selection on the precomputed rank (C-level key, no lambda):
+        # top-N via a bounded heap when filtered, full sort otherwise
+        rank_key = itemgetter(0)
+        if filtered:
+            top = heapq.nsmallest(self.max_issues, issue_gen, key=rank_key)
         else:
-            return issues
+            top = sorted(issue_gen, key=rank_key)
+        critical_issues = [issue for _, issue in top]
+
+        return {
+            'critical_issues': critical_issues,
+            'immediate_fixes': fixes,
+            'complexity_deduction': complexity_deduction,
+        }
 
     def _format_ruff_results(self, ruff: Dict) -> Dict:
         """Format ruff results for TOON output."""
@@ -264,7 +371,7 @@ class CodeQualityChecker:
         else:
             result['by_category'] = ruff['categories']
             result['severity_counts'] = ruff['severity_counts']
-            result['all_issues'] = ruff['issues']
+            result['all_issues'] = [issue._asdict() for issue in ruff['issues']]
         
         return result
 
@@ -281,7 +388,7 @@ class CodeQualityChecker:
             result['by_error'] = mypy['by_error']
             result['files_checked'] = mypy.get('files_checked', 0)
             result['files_with_errors'] = mypy.get('files_with_errors', 0)
-            result['all_errors'] = mypy['errors']
+            result['all_errors'] = [error._asdict() for error in mypy['errors']]
         
         return result
 
@@ -315,49 +422,6 @@ class CodeQualityChecker:
         
         return result
 
-    def _generate_immediate_fixes(self, ruff: Dict, mypy: Dict, semgrep: Dict, radon: Dict) -> List[Dict]:
-        """Generate immediate fix recommendations."""
-        fixes = []
-
-        priority = 1
-
-        # Auto-fixable linting
-        if ruff['auto_fixable'] > 0:
-            fixes.append({
-                'priority': priority,
-                'action': 'Run: ruff check --fix src/',
-                'effort': '2min'
-            })
-            priority += 1
-
-        # Security fixes
-        fix_limit = 5 if self.filtered else len(semgrep['findings'])
-        for finding in semgrep['findings'][:fix_limit]:
-            if finding['severity'] == 'ERROR':
-                fixes.append({
-                    'priority': priority,
-                    'action': f"Fix {finding['category']}: {finding['file']}:{finding['line']}",
-                    'effort': '10min'
-                })
-                priority += 1
-                if self.filtered and priority > 5:
-                    break
-
-        # Critical complexity
-        hotpot_limit = 5 if self.filtered else len(radon['complexity_hotspots'])
-        for hotspot in radon['complexity_hotspots'][:hotpot_limit]:
-            if hotspot['grade'] == 'F':
-                fixes.append({
-                    'priority': priority,
-                    'action': f"Refactor: {hotspot['file']} (complexity {hotspot['complexity']}→<15)",
-                    'effort': '2hrs'
-                })
-                priority += 1
-                if self.filtered and priority > 5:
-                    break
-
-        return fixes
-
     def _generate_next_steps(self, ruff: Dict, mypy: Dict, semgrep: Dict, radon: Dict) -> List[str]:
         """Generate next steps recommendations."""
         steps = []
@@ -367,7 +431,7 @@ class CodeQualityChecker:
             steps.append(f"Add type annotations to reach 80% coverage (currently {mypy.get('type_coverage', 0)}%)")
 
         # Complexity
-        high_complexity = len([h for h in radon['complexity_hotspots'] if h['grade'] in ['F', 'D']])
+        high_complexity = sum(1 for h in radon['complexity_hotspots'] if h['grade'] in _BAD_GRADES)
         if high_complexity > 0:
             steps.append(f"Refactor {high_complexity} high-complexity functions (F/D grade)")
 
@@ -417,6 +481,17 @@ def main():
         action='store_true',
         help='Filter results to top issues (default: unfiltered)'
     )
+    parser.add_argument(
+        '--changed-files',
+        nargs='+',
+        metavar='FILE',
+        help='Type-check only these files, relative to the workspace, e.g. $(git diff --name-only HEAD~1)'
+    )
+    parser.add_argument(
+        '--no-cache',
+        action='store_true',
+        help='Re-run ruff and radon on every file, ignoring <workspace>/.aar_cache'
+    )
 
     args = parser.parse_args()
 
@@ -426,7 +501,9 @@ def main():
         pattern=args.pattern,
         verbose=args.verbose,
         max_issues=args.max_issues,
-        filtered=args.filtered
+        filtered=args.filtered,
+        changed_files=args.changed_files,
+        use_cache=not args.no_cache
     )
 
     try:
@@ -4,16 +4,64 @@ Mypy type checker integration for Python type analysis.
 Runs mypy with JSON output and parses type checking errors.
 """
 
-import json
+import os
+import re
 import subprocess
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Any
+from typing import Dict, List, Any, NamedTuple, Optional
 import logging
 
+try:
+    import orjson as _json
+except ImportError:
+    import json as _json
+
+
+# Directories never worth descending into when counting source files
+_SKIP_DIRS = frozenset(("__pycache__", ".venv", ".git"))
+
+# mypy severities kept in the report
+_VALID_SEVERITY = frozenset(("error", "note"))
+
+
+def _count_python_files_in(root: str) -> int:
+    """Count .py files under root with a stack-based os.scandir walk."""
+    count = 0
+    stack = [root]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        if entry.name not in _SKIP_DIRS:
+                            stack.append(entry.path)
+                    elif entry.name.endswith(".py") and entry.is_file(follow_symlinks=False):
+                        count += 1
+        except OSError:
+            continue
+    return count
+
+
+class MypyError(NamedTuple):
+    """Single mypy diagnostic (compact tuple; use _asdict() for output)."""
+
+    file: str
+    line: int
+    column: int
+    code: str
+    severity: str
+    message: str
+
 
 class MypyAnalyzer:
     """Wrapper for mypy type checker."""
 
+    # Trailing "[error-code]" of a mypy message; anchored so messages without
+    # a code fail fast
+    _CODE_RE = re.compile(r'\[([a-z][a-z0-9-]*)\]\s*$')
+
     def __init__(self, workspace: str):
         """
         Initialize mypy analyzer.
@@ -23,13 +71,22 @@ class MypyAnalyzer:
         """
         self.workspace = Path(workspace)
         self.logger = logging.getLogger(__name__)
+        self._py_file_count: Optional[int] = None
 
-    def analyze(self, pattern: str = "**/*.py") -> Dict[str, Any]:
+    def analyze(
+        self,
+        pattern: str = "**/*.py",
+        changed_files: Optional[List[str]] = None
+    ) -> Dict[str, Any]:
         """
         Run mypy type checking on workspace.
 
         Args:
             pattern: File pattern to check (currently uses whole workspace)
+            changed_files: Only check these files (mypy's incremental cache
+                covers their unchanged dependencies); whole workspace if empty.
+                Relative paths are taken relative to the workspace, and files
+                that no longer exist are skipped
 
         Returns:
             Dictionary with type checking results
@@ -49,32 +106,63 @@ class MypyAnalyzer:
             version = version_result.stdout.strip()
 
             # Run mypy with JSON output
-            cmd = [
-                "mypy",
-                str(self.workspace),
-                "--output=json",
-                "--no-error-summary"
-            ]
-
-            result = subprocess.run(
+            targets = None
+            if changed_files:
+                targets = self._resolve_changed(changed_files)
+                if not targets:
+                    return self._process_results([], version, 0)
+                cmd = [
+                    "mypy",
+                    *targets,
+                    "--output=json",
+                    "--no-error-summary",
+                    "--follow-imports=silent",
+                    "--incremental",
+                    f"--cache-dir={self.workspace / '.mypy_cache'}"
+                ]
+            else:
+                cmd = [
+                    "mypy",
+                    str(self.workspace),
+                    "--output=json",
+                    "--no-error-summary"
+                ]
+
+            # Stream output (one JSON object per line) so peak memory stays
+            # at one line instead of the full report; lines stay bytes since
+            # both orjson and json accept them without a separate decode
+            errors = []
+            proc = subprocess.Popen(
                 cmd,
-                capture_output=True,
-                text=True,
-                timeout=180
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL
             )
+            timer = threading.Timer(180, proc.kill)
+            timer.start()
+            try:
+                for line in proc.stdout:
+                    line = line.strip()
+                    if not line:
+                        continue
+                    try:
+                        errors.append(_json.loads(line))
+                    except _json.JSONDecodeError:
+                        continue
+                proc.wait()
+            finally:
+                timed_out = not timer.is_alive()
+                timer.cancel()
+                if proc.poll() is None:
+                    proc.kill()
+                    proc.wait()
 
-            # Parse JSON output (one JSON object per line)
-            errors = []
-            if result.stdout:
-                for line in result.stdout.strip().split('\n'):
-                    if line:
-                        try:
-                            errors.append(json.loads(line))
-                        except json.JSONDecodeError:
-                            continue
+            if timed_out:
+                raise subprocess.TimeoutExpired(cmd, 180)
 
-            # Process results
-            return self._process_results(errors, version)
+            # Process results; a scoped run is measured against its own files
+            return self._process_results(
+                errors, version, len(targets) if targets is not None else None
+            )
 
         except subprocess.TimeoutExpired:
             self.logger.error("mypy check timed out")
@@ -83,8 +171,26 @@ class MypyAnalyzer:
             self.logger.error(f"mypy check failed: {e}")
             return self._empty_results()
 
-    def _process_results(self, errors: List[Dict], version: str) -> Dict[str, Any]:
-        """Process raw mypy results into structured format."""
+    def _resolve_changed(self, changed_files: List[str]) -> List[str]:
+        """Existing changed files as paths, relative ones resolved against the workspace."""
+        targets = []
+        for name in changed_files:
+            path = self.workspace / name
+            if path.is_file():
+                targets.append(str(path))
+        return targets
+
+    def _process_results(
+        self, errors: List[Dict], version: str, total_files: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """
+        Process raw mypy results into structured format (errors as MypyError).
+
+        Args:
+            errors: Raw mypy JSON diagnostics
+            version: mypy version string
+            total_files: Files checked; the workspace's .py count if None
+        """
         # Count by error code
         error_counts = {}
 
@@ -94,19 +200,27 @@ class MypyAnalyzer:
         # Track files with errors
         files_with_errors = set()
 
-        # Track total files checked (approximate)
-        python_files = list(self.workspace.rglob("*.py"))
-        total_files = len(python_files)
+        # Track total files checked (approximate for whole-workspace runs)
+        if total_files is None:
+            total_files = self._count_python_files()
+
+        # Workspace prefix for cheap relative paths without a Path per error
+        ws_prefix = str(self.workspace) + os.sep
+        ws_prefix_len = len(ws_prefix)
 
+        extract_code = self._extract_error_code
         for error in errors:
+            # Read every field once up front through a bound .get
+            get = error.get
+            severity = get("severity", "error")
             # Only process actual errors, not notes
-            severity = error.get("severity", "error")
-            if severity not in ["error", "note"]:
+            if severity not in _VALID_SEVERITY:
                 continue
+            message = get("message", "")
+            file_path = get("file", "")
 
             # Extract error code (e.g., "attr-defined")
-            message = error.get("message", "")
-            code = self._extract_error_code(message)
+            code = extract_code(message)
 
             if severity == "error":
                 if code not in error_counts:
@@ -114,22 +228,25 @@ class MypyAnalyzer:
                 error_counts[code] += 1
 
             # Track file
-            file_path = error.get("file", "")
             if file_path:
-                try:
-                    rel_path = str(Path(file_path).relative_to(self.workspace))
+                if file_path.startswith(ws_prefix):
+                    rel_path = file_path[ws_prefix_len:]
                     files_with_errors.add(rel_path)
-                except ValueError:
-                    rel_path = file_path
-
-                all_errors.append({
-                    "file": rel_path,
-                    "line": error.get("line", 0),
-                    "column": error.get("column", 0),
-                    "code": code,
-                    "severity": severity,
-                    "message": message
-                })
+                else:
+                    try:
+                        rel_path = str(Path(file_path).relative_to(self.workspace))
+                        files_with_errors.add(rel_path)
+                    except ValueError:
+                        rel_path = file_path
+
+                all_errors.append(MypyError(
+                    rel_path,
+                    get("line", 0),
+                    get("column", 0),
+                    code,
+                    severity,
+                    message
+                ))
 
         # Build error code details with descriptions
         error_descriptions = {
@@ -159,7 +276,7 @@ class MypyAnalyzer:
         else:
             type_coverage = 0
 
-        total_errors = sum(1 for e in all_errors if e["severity"] == "error")
+        total_errors = sum(1 for e in all_errors if e.severity == "error")
 
         return {
             "version": version,
@@ -171,15 +288,44 @@ class MypyAnalyzer:
             "errors": all_errors
         }
 
+    def _count_python_files(self) -> int:
+        """
+        Count .py files under the workspace (memoized after first call).
+
+        Top-level subdirectories are walked on a thread pool when there are
+        enough of them; directory reads release the GIL, which pays off on
+        cold caches and network filesystems.
+        """
+        if self._py_file_count is not None:
+            return self._py_file_count
+
+        count = 0
+        subdirs = []
+        try:
+            with os.scandir(self.workspace) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        if entry.name not in _SKIP_DIRS:
+                            subdirs.append(entry.path)
+                    elif entry.name.endswith(".py") and entry.is_file(follow_symlinks=False):
+                        count += 1
+        except OSError:
+            subdirs = []
+
+        if len(subdirs) < 4:
+            count += sum(_count_python_files_in(path) for path in subdirs)
+        else:
+            with ThreadPoolExecutor(max_workers=min(8, len(subdirs))) as executor:
+                count += sum(executor.map(_count_python_files_in, subdirs))
+
+        self._py_file_count = count
+        return count
+
     def _extract_error_code(self, message: str) -> str:
         """Extract error code from mypy message."""
         # Mypy messages often end with [error-code]
-        if "[" in message and "]" in message:
-            start = message.rfind("[")
-            end = message.rfind("]")
-            if start < end:
-                return message[start + 1:end]
-        return "general"
+        match = self._CODE_RE.search(message)
+        return match.group(1) if match else "general"
 
     def _empty_results(self) -> Dict[str, Any]:
         """Return empty results structure."""
@@ -4,24 +4,121 @@ Radon complexity metrics integration for code complexity analysis.
 Runs radon to measure cyclomatic complexity and maintainability index.
 """
 
-import json
+import heapq
+import multiprocessing
+import os
 import subprocess
+from concurrent.futures import ProcessPoolExecutor
+from importlib import metadata
+from operator import itemgetter
 from pathlib import Path
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Optional, Tuple
 import logging
 
+try:
+    import orjson as _json
+except ImportError:
+    import json as _json
+
+from scan_cache import ScanCache, collect_source_files
+
+try:
+    from radon.complexity import cc_visit
+    from radon.metrics import mi_visit
+    from radon.visitors import Function
+except ImportError:
+    cc_visit = None
+    mi_visit = None
+    Function = None
+
+
+# Radon block types reported as complexity hotspots
+_FUNCTION_TYPES = frozenset(("function", "method"))
+
+# Below this many files the process pool startup costs more than it saves
+_MIN_FILES_FOR_POOL = 16
+
+# Letter grade indexed by complexity: A <= 5, B <= 10, C <= 20, D <= 30, else F
+_COMPLEXITY_GRADES = "A" * 6 + "B" * 5 + "C" * 10 + "D" * 10 + "F"
+
+# Maintainability grade indexed by int(mi), one band per 20 points
+_MI_LABELS = ("Critical", "Poor", "Moderate", "Good", "Excellent")
+_MI_GRADES = tuple(_MI_LABELS[min(i, 80) // 20] for i in range(101))
+
+
+def _block_type(block: Any) -> str:
+    """Map a radon block object to the type name used in its JSON output."""
+    if isinstance(block, Function):
+        return "method" if block.is_method else "function"
+    return "class"
+
+
+def _analyze_one(path: str) -> Optional[Tuple[str, List[Dict[str, Any]], float]]:
+    """
+    Run radon's cc and mi visitors on a single file.
+
+    Module-level so it can be pickled into worker processes.
+
+    Args:
+        path: File to analyze
+
+    Returns:
+        (path, blocks, mi) tuple, or None if the file could not be analyzed
+    """
+    try:
+        with open(path, encoding="utf-8") as f:
+            source = f.read()
+        blocks = cc_visit(source)
+        mi_value = mi_visit(source, multi=True)
+    except Exception:
+        return None
+
+    return path, [
+        {
+            "type": _block_type(block),
+            "name": block.name,
+            "complexity": block.complexity
+        }
+        for block in blocks
+    ], mi_value
+
+
+def _pool_context():
+    """
+    Start method for the radon pool.
+
+    The pool is created while other threads run tool subprocesses and
+    timers, and forking a multithreaded process can deadlock the child on
+    a lock one of them held. Workers are started from a clean process
+    instead.
+    """
+    if "forkserver" in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context("forkserver")
+    return multiprocessing.get_context("spawn")
+
+
+def _pool_workers() -> int:
+    """Worker count for the radon pool, capped by the NPROCS environment variable."""
+    workers = os.cpu_count() or 1
+    nprocs = os.environ.get("NPROCS")
+    if nprocs and nprocs.isdigit() and int(nprocs) > 0:
+        workers = min(workers, int(nprocs))
+    return workers
+
 
 class RadonMetrics:
     """Wrapper for radon complexity analyzer."""
 
-    def __init__(self, workspace: str):
+    def __init__(self, workspace: str, use_cache: bool = True):
         """
         Initialize radon metrics analyzer.
 
         Args:
             workspace: Root directory to analyze
+            use_cache: Reuse per-file results for unchanged files
         """
         self.workspace = Path(workspace)
+        self.use_cache = use_cache
         self.logger = logging.getLogger(__name__)
 
     def measure(self, pattern: str = "**/*.py") -> Dict[str, Any]:
@@ -36,23 +133,32 @@ class RadonMetrics:
         """
         try:
             # Check if radon is installed
-            version_result = subprocess.run(
-                ["radon", "--version"],
-                capture_output=True,
-                text=True,
-                timeout=10
-            )
-            if version_result.returncode != 0:
+            version = self._get_version()
+            if version is None:
                 self.logger.error("radon not installed")
                 return self._empty_results()
 
-            version = version_result.stdout.strip()
+            if cc_visit is not None:
+                # Library available: analyze in-process, no fork or JSON round-trip
+                complexity_results, mi_results = self._analyze_in_process(pattern, version)
+                return self._process_results(complexity_results, mi_results, version)
 
-            # Get complexity metrics
-            complexity_results = self._run_complexity()
+            # radon cc and radon mi are independent: start both, then collect
+            procs = []
+            try:
+                procs.append(self._run_complexity())
+                procs.append(self._run_maintainability())
+
+                # Get complexity metrics
+                complexity_results = self._collect_json(procs[0], "radon cc")
 
-            # Get maintainability index
-            mi_results = self._run_maintainability()
+                # Get maintainability index
+                mi_results = self._collect_json(procs[1], "radon mi")
+            finally:
+                for proc in procs:
+                    if proc.poll() is None:
+                        proc.kill()
+                        proc.wait()
 
             # Process and combine results
             return self._process_results(complexity_results, mi_results, version)
@@ -61,54 +167,123 @@ class RadonMetrics:
             self.logger.error(f"radon analysis failed: {e}")
             return self._empty_results()
 
-    def _run_complexity(self) -> List[Dict]:
-        """Run cyclomatic complexity analysis."""
+    def _get_version(self) -> Optional[str]:
+        """Get radon version from package metadata, falling back to the CLI."""
+        try:
+            return f"radon {metadata.version('radon')}"
+        except metadata.PackageNotFoundError:
+            pass
+
         try:
-            cmd = [
-                "radon", "cc",
-                str(self.workspace),
-                "-j",  # JSON output
-                "-a",  # Average
-                "-s"   # Show complexity
-            ]
-
-            result = subprocess.run(
-                cmd,
+            version_result = subprocess.run(
+                ["radon", "--version"],
                 capture_output=True,
                 text=True,
-                timeout=60
+                timeout=10
             )
+        except (OSError, subprocess.TimeoutExpired):
+            return None
+        if version_result.returncode != 0:
+            return None
+        return version_result.stdout.strip()
 
-            if result.stdout:
-                return json.loads(result.stdout)
-            return {}
+    def _analyze_in_process(self, pattern: str, version: str) -> Tuple[Dict, Dict]:
+        """
+        Run radon's cc and mi visitors directly on each matching file.
 
-        except Exception as e:
-            self.logger.error(f"radon cc failed: {e}")
-            return {}
+        Args:
+            pattern: File pattern to analyze
+            version: radon version, part of the cache key
 
-    def _run_maintainability(self) -> Dict:
-        """Run maintainability index analysis."""
+        Returns:
+            (complexity, maintainability) dicts shaped like radon's JSON output
+        """
+        # Mirror the CLI's defaults: skip hidden and cache directories
+        paths = collect_source_files(self.workspace, pattern)
+
+        cache = ScanCache(str(self.workspace), "radon", version) if self.use_cache else None
+        per_file = {}
+        pending = []
+        for path in paths:
+            cached = cache.lookup(path) if cache else None
+            if cached is None:
+                pending.append(path)
+            else:
+                per_file[path] = cached
+
+        # The visitors are CPU-bound, so fan out across processes, not threads
+        workers = _pool_workers()
+        if workers > 1 and len(pending) >= _MIN_FILES_FOR_POOL:
+            with ProcessPoolExecutor(max_workers=workers, mp_context=_pool_context()) as executor:
+                results = list(executor.map(_analyze_one, pending, chunksize=32))
+        else:
+            results = [_analyze_one(path) for path in pending]
+
+        for result in results:
+            if result is None:
+                continue
+            path, blocks, mi_value = result
+            per_file[path] = [blocks, mi_value]
+            if cache:
+                cache.store(path, per_file[path])
+
+        if cache:
+            cache.save()
+
+        complexity = {}
+        maintainability = {}
+        for path in paths:
+            entry = per_file.get(path)
+            if entry is None:
+                continue
+            complexity[path] = entry[0]
+            maintainability[path] = {"mi": entry[1]}
+
+        return complexity, maintainability
+
+    def _run_complexity(self) -> subprocess.Popen:
+        """Start cyclomatic complexity analysis."""
+        cmd = [
+            "radon", "cc",
+            str(self.workspace),
+            "-j",  # JSON output
+            "-a",  # Average
+            "-s"   # Show complexity
+        ]
+        return subprocess.Popen(
+            cmd,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE
+        )
+
+    def _run_maintainability(self) -> subprocess.Popen:
+        """Start maintainability index analysis."""
+        cmd = [
+            "radon", "mi",
+            str(self.workspace),
+            "-j"  # JSON output
+        ]
+        return subprocess.Popen(
+            cmd,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE
+        )
+
+    def _collect_json(self, proc: subprocess.Popen, name: str) -> Dict:
+        """Wait for a radon process and parse its JSON output (bytes, not decoded first)."""
         try:
-            cmd = [
-                "radon", "mi",
-                str(self.workspace),
-                "-j"  # JSON output
-            ]
-
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                timeout=60
-            )
-
-            if result.stdout:
-                return json.loads(result.stdout)
+            stdout, _ = proc.communicate(timeout=60)
+            if stdout:
+                return _json.loads(stdout)
             return {}
 
+        except subprocess.TimeoutExpired:
+            proc.kill()
+            proc.communicate()
+            self.logger.error(f"{name} timed out")
+            return {}
         except Exception as e:
-            self.logger.error(f"radon mi failed: {e}")
+            self.logger.error(f"{name} failed: {e}")
             return {}
 
     def _process_results(self, complexity: Dict, maintainability: Dict, version: str) -> Dict[str, Any]:
@@ -116,33 +291,33 @@ class RadonMetrics:
         hotspots = []
         mi_scores = []
 
+        # Paths are reported under the workspace as given; strip it as a string prefix
+        prefix = str(self.workspace) + os.sep
+        prefix_len = len(prefix)
+
+        # Running totals so the average needs no second pass
+        complexity_total = 0
+
         # Process complexity results
         for file_path, data in complexity.items():
-            try:
-                rel_path = str(Path(file_path).relative_to(self.workspace))
-            except ValueError:
-                rel_path = file_path
+            rel_path = file_path[prefix_len:] if file_path.startswith(prefix) else file_path
 
             # Extract function/method complexity
             if isinstance(data, list):
                 for item in data:
-                    if item.get("type") in ["function", "method"]:
+                    if item.get("type") in _FUNCTION_TYPES:
                         complexity_value = item.get("complexity", 0)
-                        grade = self._complexity_to_grade(complexity_value)
+                        complexity_total += complexity_value
 
                         hotspots.append({
                             "file": rel_path,
                             "function": item.get("name", "unknown"),
-                            "complexity": complexity_value,
-                            "grade": grade
+                            "complexity": complexity_value
                         })
 
         # Process maintainability results
         for file_path, data in maintainability.items():
-            try:
-                rel_path = str(Path(file_path).relative_to(self.workspace))
-            except ValueError:
-                rel_path = file_path
+            rel_path = file_path[prefix_len:] if file_path.startswith(prefix) else file_path
 
             mi_value = data.get("mi", 0)
             grade = self._mi_to_grade(mi_value)
@@ -153,15 +328,19 @@ class RadonMetrics:
                 "grade": grade
             })
 
-        # Sort by complexity (highest first)
-        hotspots.sort(key=lambda x: x["complexity"], reverse=True)
+        # Top 10 by complexity (highest first); O(n log 10) instead of a full sort
+        top_hotspots = heapq.nlargest(10, hotspots, key=itemgetter("complexity"))
 
-        # Sort MI by score (lowest first - worst maintainability)
-        mi_scores.sort(key=lambda x: x["mi_score"])
+        # Bottom 10 by MI (lowest first - worst maintainability)
+        worst_mi = heapq.nsmallest(10, mi_scores, key=itemgetter("mi_score"))
+
+        # Grade only the hotspots that are reported
+        for hotspot in top_hotspots:
+            hotspot["grade"] = self._complexity_to_grade(hotspot["complexity"])
 
         # Calculate average complexity
         if hotspots:
-            avg_complexity = sum(h["complexity"] for h in hotspots) / len(hotspots)
+            avg_complexity = complexity_total / len(hotspots)
         else:
             avg_complexity = 0
 
@@ -169,35 +348,17 @@ class RadonMetrics:
             "version": version,
             "avg_complexity": round(avg_complexity, 1),
             "total_functions": len(hotspots),
-            "complexity_hotspots": hotspots[:10],  # Top 10
-            "maintainability": mi_scores[:10]  # Bottom 10 (worst)
+            "complexity_hotspots": top_hotspots,  # Top 10
+            "maintainability": worst_mi  # Bottom 10 (worst)
         }
 
     def _complexity_to_grade(self, complexity: int) -> str:
         """Convert complexity score to letter grade."""
-        if complexity <= 5:
-            return "A"
-        elif complexity <= 10:
-            return "B"
-        elif complexity <= 20:
-            return "C"
-        elif complexity <= 30:
-            return "D"
-        else:
-            return "F"
+        return _COMPLEXITY_GRADES[min(max(complexity, 0), len(_COMPLEXITY_GRADES) - 1)]
 
     def _mi_to_grade(self, mi: float) -> str:
         """Convert maintainability index to descriptive grade."""
-        if mi >= 80:
-            return "Excellent"
-        elif mi >= 60:
-            return "Good"
-        elif mi >= 40:
-            return "Moderate"
-        elif mi >= 20:
-            return "Poor"
-        else:
-            return "Critical"
+        return _MI_GRADES[min(max(int(mi), 0), 100)]
 
     def _empty_results(self) -> Dict[str, Any]:
         """Return empty results structure."""
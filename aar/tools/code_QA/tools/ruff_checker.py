@@ -4,69 +4,106 @@ Ruff linter integration for Python code quality checking.
 Runs ruff with JSON output and parses linting issues.
 """
 
-import json
+import hashlib
+import os
 import subprocess
+from collections import Counter
+from importlib import metadata
 from pathlib import Path
-from typing import Dict, List, Any
+from typing import Dict, List, Any, NamedTuple, Optional
 import logging
 
+try:
+    import orjson as _json
+except ImportError:
+    import json as _json
+
+from scan_cache import ScanCache
+
+try:
+    from ruff import find_ruff_bin
+except ImportError:
+    find_ruff_bin = None
+
+try:
+    import tomllib
+except ImportError:
+    tomllib = None
+
+
+# Severity by the first letter of a rule code; anything else is "info"
+_SEVERITY_BY_PREFIX = {"E": "error", "F": "error", "W": "warning", "C": "warning"}
+
+# Config files whose content feeds the cache key, in ruff's precedence order
+_CONFIG_FILES = (".ruff.toml", "ruff.toml", "pyproject.toml")
+
+
+def _extended_config(path: Path, content: bytes) -> Optional[Path]:
+    """The config file a ruff config's "extend" setting points to, if any."""
+    if tomllib is None:
+        return None
+    try:
+        data = tomllib.loads(content.decode("utf-8"))
+    except (UnicodeDecodeError, tomllib.TOMLDecodeError):
+        return None
+    if path.name == "pyproject.toml":
+        data = data.get("tool", {}).get("ruff", {})
+    extend = data.get("extend")
+    if not isinstance(extend, str):
+        return None
+    return (path.parent / os.path.expanduser(extend)).resolve()
+
+
+class RuffIssue(NamedTuple):
+    """Single ruff diagnostic (compact tuple; use _asdict() for output)."""
+
+    file: str
+    line: int
+    column: int
+    code: str
+    message: str
+    severity: str
+    fixable: bool
+
 
 class RuffChecker:
     """Wrapper for ruff linter."""
 
-    def __init__(self, workspace: str):
+    def __init__(self, workspace: str, use_cache: bool = True):
         """
         Initialize ruff checker.
 
         Args:
             workspace: Root directory to analyze
+            use_cache: Reuse per-file results for unchanged files
         """
         self.workspace = Path(workspace)
+        self.use_cache = use_cache
         self.logger = logging.getLogger(__name__)
 
     def check(self, pattern: str = "**/*.py") -> Dict[str, Any]:
         """
         Run ruff linting on workspace.
 
+        Both modes lint the files ruff itself discovers in the workspace.
+
         Args:
-            pattern: File pattern to check
+            pattern: File pattern to check (ruff's own file discovery applies)
 
         Returns:
             Dictionary with linting results
         """
         try:
             # Check if ruff is installed
-            version_result = subprocess.run(
-                ["ruff", "--version"],
-                capture_output=True,
-                text=True,
-                timeout=10
-            )
-            if version_result.returncode != 0:
+            ruff_bin = self._ruff_bin()
+            version = self._get_version(ruff_bin)
+            if version is None:
                 self.logger.error("ruff not installed")
                 return self._empty_results()
 
-            version = version_result.stdout.strip()
-
-            # Run ruff with JSON output
-            cmd = [
-                "ruff", "check",
-                str(self.workspace),
-                "--output-format=json"
-            ]
-
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                timeout=120
-            )
-
-            # Parse JSON output
-            if result.stdout:
-                issues = json.loads(result.stdout)
-            else:
-                issues = []
+            issues = self._check_incremental(ruff_bin, version) if self.use_cache else None
+            if issues is None:
+                issues = self._run_ruff(ruff_bin, [str(self.workspace)])
 
             # Process and categorize results
             return self._process_results(issues, version)
@@ -74,20 +111,221 @@ class RuffChecker:
         except subprocess.TimeoutExpired:
             self.logger.error("ruff check timed out")
             return self._empty_results()
-        except json.JSONDecodeError as e:
+        except _json.JSONDecodeError as e:
             self.logger.error(f"Failed to parse ruff JSON output: {e}")
             return self._empty_results()
         except Exception as e:
             self.logger.error(f"ruff check failed: {e}")
             return self._empty_results()
 
+    def _config_args(self, root: Path) -> List[str]:
+        """Explicit --config for the workspace-level ruff config, if there is one."""
+        config_path = self._find_config(root)
+        if config_path is None:
+            return []
+        # Explicit config skips ruff's per-directory discovery
+        return ["--config", str(config_path)]
+
+    def _run_ruff(self, ruff_bin: str, targets: List[str]) -> List[Dict]:
+        """Run ruff with JSON output on the given paths and parse the issues."""
+        root = self.workspace.resolve()
+        cmd = [
+            ruff_bin, "check",
+            *targets,
+            "--output-format=json",
+            "--exit-zero",      # Violations are data here, not a failure
+            "--force-exclude"   # Honor excludes for explicitly listed files
+        ]
+        if self.use_cache:
+            # Our cache is authoritative; skip ruff's own cache walk
+            cmd.append("--no-cache")
+        cmd.extend(self._config_args(root))
+
+        # stdout stays bytes: both orjson and json parse it without a decode pass.
+        # Relative paths in an explicit --config resolve against the cwd
+        result = subprocess.run(
+            cmd,
+            capture_output=True,
+            timeout=120,
+            cwd=str(root)
+        )
+
+        # Parse JSON output
+        if result.stdout:
+            return _json.loads(result.stdout)
+        return []
+
+    def _list_files(self, ruff_bin: str, root: Path) -> Optional[List[str]]:
+        """The files a plain run over the workspace lints, or None if ruff cannot list them."""
+        result = subprocess.run(
+            [ruff_bin, "check", str(root), "--show-files", *self._config_args(root)],
+            capture_output=True,
+            text=True,
+            timeout=120,
+            cwd=str(root)
+        )
+        if result.returncode != 0:
+            return None
+        return [line for line in result.stdout.splitlines() if line]
+
+    def _check_incremental(self, ruff_bin: str, version: str) -> Optional[List[Dict]]:
+        """
+        Run ruff only on files whose cached results are stale.
+
+        Covers the same files as a run over the whole workspace, so cached
+        and uncached runs report the same issues.
+
+        Args:
+            ruff_bin: ruff executable
+            version: ruff version, part of the cache key
+
+        Returns:
+            Issues for all linted files, in ruff's (file, location) order,
+            or None to fall back to a plain run
+        """
+        root = self.workspace.resolve()
+        paths = self._list_files(ruff_bin, root)
+        if paths is None:
+            return None
+        # Findings depend on the path too (per-file-ignores, __init__.py
+        # rules, package checks), so results are keyed by path as well
+        cache = ScanCache(
+            str(root), "ruff", version + self._config_fingerprint(root, paths), by_path=True
+        )
+
+        issues = []
+        misses = []
+        for path in paths:
+            cached = cache.lookup(path)
+            if cached is None:
+                misses.append(path)
+            else:
+                issues.extend(dict(issue, filename=path) for issue in cached)
+
+        if misses:
+            # A cold cache checks the whole tree in one run
+            targets = [str(root)] if len(misses) == len(paths) else misses
+            by_file: Dict[str, List[Dict]] = {path: [] for path in misses}
+            for issue in self._run_ruff(ruff_bin, targets):
+                by_file.setdefault(issue.get("filename", ""), []).append(issue)
+
+            for path in misses:
+                # The key carries the path; results are cached without the filename
+                cache.store(path, [
+                    {key: value for key, value in issue.items() if key != "filename"}
+                    for issue in by_file[path]
+                ])
+                issues.extend(by_file[path])
+            cache.save()
+
+        issues.sort(key=lambda issue: (
+            issue.get("filename", ""),
+            issue.get("location", {}).get("row", 0),
+            issue.get("location", {}).get("column", 0)
+        ))
+        return issues
+
+    def _find_config(self, root: Path) -> Optional[Path]:
+        """Return the workspace-level ruff config file, if any."""
+        for name in _CONFIG_FILES:
+            path = root / name
+            if not path.is_file():
+                continue
+            if name == "pyproject.toml" and "[tool.ruff" not in path.read_text(encoding="utf-8"):
+                continue
+            return path
+        return None
+
+    def _config_fingerprint(self, root: Path, paths: List[str]) -> str:
+        """
+        Hash every ruff configuration that can apply, so config edits invalidate the cache.
+
+        Covers config files in the linted files' directories and all their
+        parents, the user config, the files they extend, and the
+        workspace's top-level modules, which decide first-party imports.
+        Config paths are hashed relative to the workspace.
+        """
+        directories = {root, *root.parents}
+        for path in paths:
+            parent = Path(path).parent
+            while parent not in directories:
+                directories.add(parent)
+                parent = parent.parent
+
+        config_home = os.environ.get("XDG_CONFIG_HOME") or os.path.join(
+            os.path.expanduser("~"), ".config"
+        )
+        queue = [directory / name for directory in sorted(directories) for name in _CONFIG_FILES]
+        queue.extend(Path(config_home) / "ruff" / name for name in _CONFIG_FILES)
+
+        hasher = hashlib.sha256()
+        seen = set()
+        while queue:
+            config = queue.pop(0)
+            if config in seen:
+                continue
+            seen.add(config)
+            try:
+                content = config.read_bytes()
+            except OSError:
+                continue
+            hasher.update(os.path.relpath(config, root).encode("utf-8") + b"\0" + content)
+            extended = _extended_config(config, content)
+            if extended is not None:
+                queue.append(extended)
+
+        for source_root in (root, root / "src"):
+            try:
+                names = sorted(
+                    entry.name for entry in os.scandir(source_root)
+                    if entry.name.endswith(".py") or entry.is_dir()
+                )
+            except OSError:
+                continue
+            hasher.update(repr((source_root.name, names)).encode("utf-8"))
+        return hasher.hexdigest()
+
+    def _ruff_bin(self) -> str:
+        """Locate the ruff executable, preferring the one bundled with the ruff package."""
+        if find_ruff_bin is not None:
+            try:
+                return str(find_ruff_bin())
+            except FileNotFoundError:
+                pass
+        return "ruff"
+
+    def _get_version(self, ruff_bin: str) -> Optional[str]:
+        """Get ruff version from package metadata, falling back to the CLI."""
+        try:
+            return f"ruff {metadata.version('ruff')}"
+        except metadata.PackageNotFoundError:
+            pass
+
+        try:
+            version_result = subprocess.run(
+                [ruff_bin, "--version"],
+                capture_output=True,
+                text=True,
+                timeout=10
+            )
+        except (OSError, subprocess.TimeoutExpired):
+            return None
+        if version_result.returncode != 0:
+            return None
+        return version_result.stdout.strip()
+
     def _process_results(self, issues: List[Dict], version: str) -> Dict[str, Any]:
         """Process raw ruff results into structured format."""
+        # Extract the code column once; severity and category key off its first letter
+        codes = [issue.get("code") or "" for issue in issues]
+        severities = [_SEVERITY_BY_PREFIX.get(code[:1], "info") for code in codes]
+
         # Count by severity
         severity_counts = {"error": 0, "warning": 0, "info": 0}
+        severity_counts.update(Counter(severities))
 
         # Count by category (first letter of code)
-        category_counts = {}
+        category_counts = Counter(code[:1] or "?" for code in codes)
 
         # Track fixable issues
         fixable_count = 0
@@ -95,39 +333,28 @@ class RuffChecker:
         # Collect all issues with details
         all_issues = []
 
-        for issue in issues:
-            code = issue.get("code", "")
-
-            # Determine severity based on code
-            if code.startswith(("E", "F")):
-                severity = "error"
-            elif code.startswith(("W", "C")):
-                severity = "warning"
-            else:
-                severity = "info"
-
-            severity_counts[severity] += 1
+        # ruff reports absolute paths; strip the workspace as a string prefix
+        prefix = str(self.workspace.resolve()) + os.sep
+        prefix_len = len(prefix)
 
-            # Track category
-            category_prefix = code[0] if code else "?"
-            if category_prefix not in category_counts:
-                category_counts[category_prefix] = 0
-            category_counts[category_prefix] += 1
-
-            # Track fixable
-            if issue.get("fix"):
-                fixable_count += 1
+        for issue, code, severity in zip(issues, codes, severities):
+            file_path = issue.get("filename", "")
+            if file_path.startswith(prefix):
+                file_path = file_path[prefix_len:]
+            fixable = bool(issue.get("fix"))
+            fixable_count += fixable
+            location = issue.get("location", {})
 
             # Store issue details
-            all_issues.append({
-                "file": str(Path(issue.get("filename", "")).relative_to(self.workspace) if "filename" in issue else ""),
-                "line": issue.get("location", {}).get("row", 0),
-                "column": issue.get("location", {}).get("column", 0),
-                "code": code,
-                "message": issue.get("message", ""),
-                "severity": severity,
-                "fixable": bool(issue.get("fix"))
-            })
+            all_issues.append(RuffIssue(
+                file_path,
+                location.get("row", 0),
+                location.get("column", 0),
+                code,
+                issue.get("message", ""),
+                severity,
+                fixable
+            ))
 
         # Build category details
         category_names = {
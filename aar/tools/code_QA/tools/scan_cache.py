@@ -0,0 +1,199 @@
+"""
+Incremental result cache for the code quality tools.
+
+Per-file analyzer results are stored on disk so unchanged files are not
+re-analyzed. Lookups use a cheap (mtime, size) stat check first and fall
+back to a content hash, so touched-but-identical files still hit.
+"""
+
+import hashlib
+import os
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Set
+import logging
+
+try:
+    import orjson as _json
+except ImportError:
+    import json as _json
+
+try:
+    from blake3 import blake3 as _hasher
+except ImportError:
+    _hasher = hashlib.blake2b
+
+
+# Cache directory created inside the analyzed workspace
+CACHE_DIR_NAME = ".aar_cache"
+
+# Results older than this are re-analyzed even if the content matches
+_TTL_SECONDS = 24 * 60 * 60
+
+# Oldest results are evicted beyond this many entries, or twice the number
+# of files used in the run if that is larger, so big repos do not thrash
+_MAX_ENTRIES = 2000
+
+
+def collect_source_files(root: Path, pattern: str) -> List[str]:
+    """
+    List files matching pattern under root, skipping hidden and cache directories.
+
+    Args:
+        root: Directory to search
+        pattern: Glob pattern relative to root
+
+    Returns:
+        Matching file paths as strings, in glob order
+    """
+    paths = []
+    for path in root.glob(pattern):
+        rel_parts = path.relative_to(root).parts
+        if any(part.startswith(".") or part == "__pycache__" for part in rel_parts[:-1]):
+            continue
+        paths.append(str(path))
+    return paths
+
+
+class ScanCache:
+    """Two-tier (stat, content hash) cache of per-file analyzer results."""
+
+    def __init__(self, workspace: str, namespace: str, ruleset: str, by_path: bool = False):
+        """
+        Load the cache for one analyzer.
+
+        Args:
+            workspace: Root directory being analyzed
+            namespace: Analyzer name; each gets its own cache file
+            ruleset: Tool version and configuration; a change invalidates the cache
+            by_path: Results depend on the file's location as well as its
+                content; they are keyed by digest and workspace-relative path
+        """
+        self.workspace = str(workspace)
+        self.by_path = by_path
+        self.path = Path(workspace) / CACHE_DIR_NAME / f"qa_{namespace}.json"
+        self.ruleset = hashlib.sha256(ruleset.encode("utf-8")).hexdigest()
+        self.logger = logging.getLogger(__name__)
+
+        # path -> [mtime_ns, size, digest]
+        self._files: Dict[str, List[Any]] = {}
+        # result key (digest, or digest:relpath) -> [stored_at, result]
+        self._results: Dict[str, List[Any]] = {}
+        # Stat/digest computed by lookup(), reused by store()
+        self._pending: Dict[str, List[Any]] = {}
+        # Files looked up or stored in this run; sizes the eviction limit
+        self._used: Set[str] = set()
+        self._dirty = False
+
+        self._load()
+
+    def _load(self) -> None:
+        """Read the cache file, ignoring it if missing, corrupt or for another ruleset."""
+        try:
+            data = _json.loads(self.path.read_bytes())
+        except (OSError, ValueError):
+            return
+
+        if not isinstance(data, dict) or data.get("ruleset") != self.ruleset:
+            return
+
+        self._files = data.get("files", {})
+        self._results = data.get("results", {})
+
+    def _result_key(self, path: str, digest: str) -> str:
+        """Key of a file's result: its digest, plus its relative path if by_path."""
+        if not self.by_path:
+            return digest
+        return f"{digest}:{Path(os.path.relpath(path, self.workspace)).as_posix()}"
+
+    def _hash_file(self, path: str) -> str:
+        """Hash file content."""
+        with open(path, "rb") as f:
+            return _hasher(f.read()).hexdigest()
+
+    def lookup(self, path: str) -> Optional[Any]:
+        """
+        Get the cached result for a file.
+
+        Args:
+            path: File to look up
+
+        Returns:
+            Cached result, or None on a miss
+        """
+        self._used.add(path)
+        try:
+            stat = os.stat(path)
+            entry = self._files.get(path)
+            if entry and entry[0] == stat.st_mtime_ns and entry[1] == stat.st_size:
+                digest = entry[2]
+            else:
+                digest = self._hash_file(path)
+        except OSError:
+            return None
+
+        meta = [stat.st_mtime_ns, stat.st_size, digest]
+        hit = self._results.get(self._result_key(path, digest))
+        if hit is None or time.time() - hit[0] > _TTL_SECONDS:
+            self._pending[path] = meta
+            return None
+
+        if entry != meta:
+            self._files[path] = meta
+            self._dirty = True
+        return hit[1]
+
+    def store(self, path: str, result: Any) -> None:
+        """
+        Record the result for a file that missed in lookup().
+
+        Args:
+            path: Analyzed file
+            result: JSON-serializable analyzer result
+        """
+        self._used.add(path)
+        meta = self._pending.pop(path, None)
+        if meta is None:
+            try:
+                stat = os.stat(path)
+                meta = [stat.st_mtime_ns, stat.st_size, self._hash_file(path)]
+            except OSError:
+                return
+
+        self._files[path] = meta
+        self._results[self._result_key(path, meta[2])] = [time.time(), result]
+        self._dirty = True
+
+    def save(self) -> None:
+        """Evict expired and excess entries, then write the cache file atomically."""
+        if not self._dirty:
+            return
+
+        cutoff = time.time() - _TTL_SECONDS
+        results = {
+            digest: hit for digest, hit in self._results.items() if hit[0] >= cutoff
+        }
+        limit = max(_MAX_ENTRIES, 2 * len(self._used))
+        if len(results) > limit:
+            newest = sorted(results.items(), key=lambda item: item[1][0], reverse=True)
+            results = dict(newest[:limit])
+        files = {
+            path: meta for path, meta in self._files.items()
+            if self._result_key(path, meta[2]) in results
+        }
+
+        payload = {"ruleset": self.ruleset, "files": files, "results": results}
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.path.with_suffix(".tmp")
+            data = _json.dumps(payload)
+            # orjson returns bytes, json returns str
+            tmp_path.write_bytes(data if isinstance(data, bytes) else data.encode("utf-8"))
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            self.logger.warning(f"Failed to write cache {self.path}: {e}")
+            return
+
+        self._results = results
+        self._files = files
+        self._dirty = False
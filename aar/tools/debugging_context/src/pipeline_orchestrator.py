@@ -1,6 +1,7 @@
 import logging
 import sys
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).parent))
@@ -24,6 +25,8 @@ class RepairWorkflowEngine:
         self.runner = TestSuiteExecutor()
         self.mapper = FailureContextMapper()
         self.builder = ToonPayloadGenerator()
+        # code_QA's run_QA module, imported on first use (False if unavailable)
+        self._qa_module = None
     
     def _ensure_structure_toon(self, workspace: Path) -> Path:
         structure_path = workspace / "structure.toon"
@@ -36,6 +39,7 @@ class RepairWorkflowEngine:
                 "--workspace", str(workspace.resolve()),
                 "--output", str(structure_path.resolve())
             ]
+            # code_analyzer is only reachable through its CLI
             result = subprocess.run(cmd, capture_output=True, text=True)
             if result.returncode != 0:
                 logger.error(f"code_analyzer failed: {result.stderr}")
@@ -43,34 +47,67 @@ class RepairWorkflowEngine:
             logger.info(f"Generated structure.toon at {structure_path}")
         return structure_path
 
+    def _load_code_qa(self):
+        if self._qa_module is None:
+            code_qa_dir = str((Path(__file__).parent.parent / ".." / "code_QA").resolve())
+            if code_qa_dir not in sys.path:
+                sys.path.insert(0, code_qa_dir)
+            try:
+                import run_QA
+            except ImportError as e:
+                logger.warning(f"code_QA not importable, falling back to subprocess: {e}")
+                self._qa_module = False
+            else:
+                self._qa_module = run_QA
+        return self._qa_module or None
+
     def _ensure_qa_report_toon(self, workspace: Path) -> Path:
         quality_path = workspace / "qa_report.toon"
         if not quality_path.exists():
             logger.info("qa_report.toon not found, running code_QA...")
-            code_qa_path = Path(__file__).parent.parent / ".." / "code_QA" / "run_QA.py"
-            cmd = [
-                sys.executable,
-                str(code_qa_path),
-                "--workspace", str(workspace.resolve()),
-                "--output", str(quality_path.resolve())
-            ]
-            result = subprocess.run(cmd, capture_output=True, text=True)
-            if result.returncode != 0:
-                logger.error(f"code_QA failed: {result.stderr}")
-                raise RuntimeError("Failed to generate qa_report.toon")
+            run_qa = self._load_code_qa()
+            if run_qa is not None:
+                # In-process: ruff/radon stay imported across pipeline runs
+                try:
+                    results = run_qa.CodeQualityChecker(str(workspace.resolve())).analyze()
+                    run_qa.ToonSerializer(indent_size=2).dump(results, str(quality_path.resolve()))
+                except Exception as e:
+                    logger.error(f"code_QA failed: {e}")
+                    raise RuntimeError("Failed to generate qa_report.toon") from e
+            else:
+                code_qa_path = Path(__file__).parent.parent / ".." / "code_QA" / "run_QA.py"
+                cmd = [
+                    sys.executable,
+                    str(code_qa_path),
+                    "--workspace", str(workspace.resolve()),
+                    "--output", str(quality_path.resolve())
+                ]
+                result = subprocess.run(cmd, capture_output=True, text=True)
+                if result.returncode != 0:
+                    logger.error(f"code_QA failed: {result.stderr}")
+                    raise RuntimeError("Failed to generate qa_report.toon")
             logger.info(f"Generated qa_report.toon at {quality_path}")
         return quality_path
 
     def execute_pipeline(self, workspace: Path, test_case: str | None = None) -> Path:
         logger.info(f"Starting workflow for workspace: {workspace}")
         
-        structure_path = self._ensure_structure_toon(workspace)
-        quality_path = self._ensure_qa_report_toon(workspace)
-        output_path = workspace / "fix_payload.toon"
-        
         if test_case:
             logger.info(f"Running specific test case: {test_case}")
-        result = self.runner.trigger_verification(target_dir=workspace, test_case=test_case)
+        
+        # The two artifacts and the test run are independent inputs that only
+        # meet at load_static_context; run all three side by side. pytest only
+        # writes caches the analyzers skip (hidden dirs, __pycache__).
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            structure_future = executor.submit(self._ensure_structure_toon, workspace)
+            quality_future = executor.submit(self._ensure_qa_report_toon, workspace)
+            verification_future = executor.submit(
+                self.runner.trigger_verification, target_dir=workspace, test_case=test_case
+            )
+            structure_path = structure_future.result()
+            quality_path = quality_future.result()
+            result = verification_future.result()
+        output_path = workspace / "fix_payload.toon"
         
         if result.exit_code == 0:
             logger.info("All tests passed. Generating success notice.")
@@ -1,12 +1,23 @@
-import hashlib
+import re
 import sys
-import xml.etree.ElementTree as ET
 from pathlib import Path
 from typing import List
 import logging
 import subprocess
 import tempfile
 
+try:
+    from lxml import etree as ET
+    _HAS_LXML = True
+except ImportError:
+    import xml.etree.ElementTree as ET
+    _HAS_LXML = False
+
+try:
+    from blake3 import blake3 as _hasher
+except ImportError:
+    from hashlib import sha256 as _hasher
+
 sys.path.insert(0, str(Path(__file__).parent))
 
 from utils.data_structures import ExecutionResult, FailureData
@@ -14,6 +25,13 @@ from utils.path_utils import normalize_path
 
 logger = logging.getLogger(__name__)
 
+_RE_ERRTYPE = re.compile(r'^([A-Z]\w+Error):', re.MULTILINE)
+_RE_PYLINE = re.compile(r'([^/\\]+\.py):(\d+)')
+_RE_PYQUOTED = re.compile(r"'([^']+\.py)':(\d+)")
+_RE_FILE = re.compile(r'File "([^"]+)", line (\d+)')
+_RE_HEX_ADDR = re.compile(r'0x[0-9a-fA-F]+')
+_RE_BRACKETED = re.compile(r'\[.*?\]')
+
 
 class TestSuiteExecutor:
     
@@ -21,8 +39,9 @@ class TestSuiteExecutor:
         self.workspace_dir: Path | None = None
     
     def trigger_verification(self, target_dir: Path, test_case: str | None = None) -> ExecutionResult:
-        self.workspace_dir = normalize_path(target_dir)
-        normalized_dir = normalize_path(target_dir)
+        # A new run may follow filesystem changes; start from fresh resolutions
+        normalize_path.cache_clear()
+        self.workspace_dir = normalized_dir = normalize_path(target_dir)
         
         with tempfile.NamedTemporaryFile(suffix='.xml', delete=False) as tmp:
             report_path = Path(tmp.name)
@@ -38,18 +57,24 @@ class TestSuiteExecutor:
                 cwd=normalized_dir
             )
             
-            tree = ET.parse(report_path)
-            root = tree.getroot()
-            
-            testsuite = root.find('testsuite')
-            if testsuite is None:
-                total_tests = int(root.attrib.get('tests', 0))
-                failed_tests = int(root.attrib.get('failures', 0))
-                failed_tests += int(root.attrib.get('errors', 0))
-            else:
-                total_tests = int(testsuite.attrib.get('tests', 0))
-                failed_tests = int(testsuite.attrib.get('failures', 0))
-                failed_tests += int(testsuite.attrib.get('errors', 0))
+            # Counts live on the root or its first <testsuite>; stop reading there
+            with open(report_path, 'rb') as report:
+                events = ET.iterparse(report, events=('start',))
+                _, root = next(events)
+                testsuite = None
+                for _, elem in events:
+                    if elem.tag == 'testsuite':
+                        testsuite = elem
+                    break
+                
+                if testsuite is None:
+                    total_tests = int(root.attrib.get('tests', 0))
+                    failed_tests = int(root.attrib.get('failures', 0))
+                    failed_tests += int(root.attrib.get('errors', 0))
+                else:
+                    total_tests = int(testsuite.attrib.get('tests', 0))
+                    failed_tests = int(testsuite.attrib.get('failures', 0))
+                    failed_tests += int(testsuite.attrib.get('errors', 0))
             
             return ExecutionResult(
                 exit_code=result.returncode,
@@ -76,10 +101,17 @@ class TestSuiteExecutor:
         failures = []
         
         try:
-            tree = ET.parse(normalized_path)
-            root = tree.getroot()
+            # Stream testcases instead of building the whole report tree
+            if _HAS_LXML:
+                # lxml filters on the tag in C, skipping all other events
+                events = ET.iterparse(str(normalized_path), events=('end',), tag='testcase')
+            else:
+                events = ET.iterparse(normalized_path, events=('end',))
             
-            for test_case in root.iter('testcase'):
+            for _, test_case in events:
+                if test_case.tag != 'testcase':
+                    continue
+                
                 failure_elem = test_case.find('failure')
                 error_elem = test_case.find('error')
                 
@@ -102,29 +134,27 @@ class TestSuiteExecutor:
                         error_type = 'CollectionError'
                     
                     if error_type == 'UnknownError':
-                        import re
-                        match = re.search(r'^([A-Z]\w+Error):', traceback, re.MULTILINE)
+                        match = _RE_ERRTYPE.search(traceback)
                         if match:
                             error_type = match.group(1)
                         else:
-                            match = re.search(r'^([A-Z]\w+Error):', error_message)
+                            # match() anchors at the start of the message only
+                            match = _RE_ERRTYPE.match(error_message)
                             if match:
                                 error_type = match.group(1)
                     
                     if line_number == 0 and traceback:
-                        import re
                         lines = traceback.split('\n')
                         for i, line in enumerate(lines):
                             if '.py:' in line and 'test_' not in line.lower():
-                                match = re.search(r'([^/\\]+\.py):(\d+)', line)
+                                match = _RE_PYLINE.search(line)
                                 if match:
                                     file_path = match.group(1)
                                     line_number = int(match.group(2))
                                     break
                     
                     if not file_path and traceback and error_type == 'CollectionError':
-                        import re
-                        match = re.search(r"'([^']+\.py)':(\d+)", traceback)
+                        match = _RE_PYQUOTED.search(traceback)
                         if match:
                             file_path = match.group(1)
                             line_number = int(match.group(2))
@@ -136,8 +166,7 @@ class TestSuiteExecutor:
                         file_path = f"{test_id.replace('.', '/')}.py"
                     
                     if not file_path and traceback:
-                        import re
-                        match = re.search(r'File "([^"]+)", line (\d+)', traceback)
+                        match = _RE_FILE.search(traceback)
                         if match:
                             file_path = match.group(1)
                             line_number = int(match.group(2))
@@ -160,6 +189,12 @@ class TestSuiteExecutor:
                         signature=signature
                     )
                     failures.append(failure)
+                
+                test_case.clear()
+                if _HAS_LXML:
+                    # Also detach processed siblings so the root releases them
+                    while test_case.getprevious() is not None:
+                        del test_case.getparent()[0]
         except Exception as e:
             logger.error(f"Failed to parse report file: {e}")
         
@@ -167,11 +202,16 @@ class TestSuiteExecutor:
     
     def _generate_signature(self, error_type: str, error_message: str, traceback: str) -> str:
         normalized_traceback = self._normalize_traceback(traceback)
-        signature_string = f"{error_type}:{error_message}:{normalized_traceback}"
-        return hashlib.sha256(signature_string.encode()).hexdigest()
+        # Feed the parts separately rather than building one joined string
+        hasher = _hasher()
+        hasher.update(error_type.encode())
+        hasher.update(b':')
+        hasher.update(error_message.encode())
+        hasher.update(b':')
+        hasher.update(normalized_traceback.encode())
+        return hasher.hexdigest()
     
     def _normalize_traceback(self, traceback: str) -> str:
-        import re
-        normalized = re.sub(r'0x[0-9a-fA-F]+', '0xXXXX', traceback)
-        normalized = re.sub(r'\[.*?\]', '[XXX]', normalized)
+        normalized = _RE_HEX_ADDR.sub('0xXXXX', traceback)
+        normalized = _RE_BRACKETED.sub('[XXX]', normalized)
         return normalized
@@ -1,9 +1,21 @@
+import os
+from functools import lru_cache
 from pathlib import Path
 
 
-def normalize_path(path: Path | str) -> Path:
+@lru_cache(maxsize=1024)
+def _resolve_cached(path: str) -> Path:
     return Path(path).resolve()
 
 
+def normalize_path(path: Path | str) -> Path:
+    # Key on the cwd-joined form so a cwd change cannot hit a stale entry
+    return _resolve_cached(os.path.join(os.getcwd(), path))
+
+
+# Drop memoized resolutions, e.g. when symlinks may have changed
+normalize_path.cache_clear = _resolve_cached.cache_clear
+
+
 def ensure_dir_exists(path: Path) -> None:
     path.mkdir(parents=True, exist_ok=True)
@@ -7,61 +7,161 @@ using ruff, mypy, semgrep, and radon.
 """
 
 import argparse
+import hashlib
+import io
+import json
+import os
+import shutil
 import sys
-from pathlib import Path
-from textwrap import dedent
+import time
+from datetime import datetime
+from types import SimpleNamespace
+from typing import List, Optional
+
+# Report formats and their default file extensions. msgpack and cbor are
+# compact binary encodings for machine consumers; they need the optional
+# msgpack / cbor2 packages
+_FORMATS = {'toon': 'toon', 'msgpack': 'msgpack', 'cbor': 'cbor'}
+
+
+def _format_choice(value: str) -> str:
+    """Fast-path converter for --format; rejects unknown formats."""
+    if value not in _FORMATS:
+        raise ValueError(value)
+    return value
+
+
+# Flags understood by the fast path: option -> (dest, converter); a None
+# converter marks a store_true flag. Must mirror _build_parser().
+_FAST_OPTIONS = {
+    '--workspace': ('workspace', str),
+    '--pattern': ('pattern', str),
+    '--output': ('output', str),
+    '--verbose': ('verbose', None),
+    '--max-issues': ('max_issues', int),
+    '--filtered': ('filtered', None),
+    '--no-cache': ('no_cache', None),
+    '--jobs': ('jobs', int),
+    '--format': ('format', _format_choice),
+    '--since': ('since', str),
+    '--semgrep-config': ('semgrep_config', str),
+}
+
+_FAST_DEFAULTS = {
+    'pattern': '**/*.py',
+    'output': None,
+    'verbose': False,
+    'max_issues': 50,
+    'filtered': False,
+    'no_cache': False,
+    'jobs': 0,
+    'format': 'toon',
+    'since': None,
+    'semgrep_config': 'auto',
+}
+
+_VERSION = '0.1.0'
+
+# Informational flags answered before any parsing
+_HELP_FLAGS = frozenset(('-h', '--help'))
+_VERSION_FLAG = '--version'
+
+# Analyzer modules shipped alongside this file
+_TOOLS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'tools')
+
+# Reports from previous runs, keyed by the analyzed files' stat signature
+_CACHE_DIR = os.path.join(
+    os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache'),
+    'cdqa'
+)
+
+# Config files the analyzers also pick up from the workspace's parent
+# directories
+_CONFIG_FILES = (
+    'pyproject.toml', 'ruff.toml', '.ruff.toml', 'setup.cfg', 'ty.toml',
+    '.semgrep.yml', '.semgrepignore'
+)
+
+# Directories no analyzer reads from; ruff's cache is rewritten on every run
+_KEY_SKIP_DIRS = frozenset((
+    '.git', '.hg', '.svn', 'venv', '.venv', 'node_modules', '__pycache__',
+    '.ruff_cache', '.mypy_cache', '.pytest_cache', '.tox', '.nox', '.eggs',
+))
+
+# Analyzers whose versions a stored report must match to be reused
+_TOOLS = ('ruff', 'ty', 'semgrep', 'complexipy', 'skylos')
+
+# Registry semgrep rules change without any local file changing; reports
+# scanned with them are reused for this long only
+_REGISTRY_MAX_AGE = 24 * 3600
+
+# Stored reports kept; the least recently used beyond either bound are removed
+_CACHE_MAX_REPORTS = 32
+_CACHE_MAX_AGE = 14 * 24 * 3600
+
+# Help text, kept flush-left so it needs no dedent() at runtime
+_DESCRIPTION = '''
+CDQA - Code Quality Analysis
+
+Comprehensive Python code quality analysis tool that integrates:
+• Ruff: Fast Python linter (checks code style, finds bugs)
+• Mypy: Static type checker (ensures type safety)
+• Semgrep: Security and bug pattern scanner
+• Radon: Code complexity metrics analyzer
+
+Generates detailed quality reports in TOON format for optimal
+LLM consumption and human readability.
+'''
+
+_EPILOG = '''
+Examples:
+  # Basic analysis of current directory
+  cdqa --workspace .
+
+  # Analyze specific directory with verbose output
+  cdqa --workspace /path/to/project --verbose
+
+  # Filter to top issues only
+  cdqa --workspace . --filtered
+
+  # Custom output location
+  cdqa --workspace . --output /tmp/quality_report.toon
+
+  # Analyze only specific file pattern
+  cdqa --workspace . --pattern "src/**/*.py"
+
+  # Force a fresh analysis, ignoring all cached results
+  cdqa --workspace . --no-cache
+
+  # Only files changed since main, and the files importing them
+  cdqa --workspace . --since main
+
+  # Binary report for CI tools (requires msgpack)
+  cdqa --workspace . --format msgpack
+
+Output:
+  Creates a quality_report.toon file containing:
+  - Quality score (0-100)
+  - Critical issues prioritized by severity
+  - Quality gates (pass/fail checks)
+  - Immediate fix recommendations
+  - Tool-specific detailed findings
+
+Exit Codes:
+  0: Analysis completed successfully
+  1: Analysis failed or interrupted
+'''
+
+# Built on first use by create_parser()
+_PARSER: Optional[argparse.ArgumentParser] = None
 
-# Add tools directory to path for imports
-sys.path.insert(0, str(Path(__file__).parent))
 
-from run_QA import CodeQualityChecker, ToonSerializer
-
-
-def create_parser() -> argparse.ArgumentParser:
+def _build_parser() -> argparse.ArgumentParser:
     """Create and configure argument parser with comprehensive help."""
     parser = argparse.ArgumentParser(
         prog='cdqa',
-        description=dedent('''
-            CDQA - Code Quality Analysis
-
-            Comprehensive Python code quality analysis tool that integrates:
-            • Ruff: Fast Python linter (checks code style, finds bugs)
-            • Mypy: Static type checker (ensures type safety)
-            • Semgrep: Security and bug pattern scanner
-            • Radon: Code complexity metrics analyzer
-
-            Generates detailed quality reports in TOON format for optimal
-            LLM consumption and human readability.
-        '''),
-        epilog=dedent('''
-            Examples:
-              # Basic analysis of current directory
-              cdqa --workspace .
-
-              # Analyze specific directory with verbose output
-              cdqa --workspace /path/to/project --verbose
-
-              # Filter to top issues only
-              cdqa --workspace . --filtered
-
-              # Custom output location
-              cdqa --workspace . --output /tmp/quality_report.toon
-
-              # Analyze only specific file pattern
-              cdqa --workspace . --pattern "src/**/*.py"
-
-            Output:
-              Creates a quality_report.toon file containing:
-              - Quality score (0-100)
-              - Critical issues prioritized by severity
-              - Quality gates (pass/fail checks)
-              - Immediate fix recommendations
-              - Tool-specific detailed findings
-
-            Exit Codes:
-              0: Analysis completed successfully
-              1: Analysis failed or interrupted
-        '''),
+        description=_DESCRIPTION,
+        epilog=_EPILOG,
         formatter_class=argparse.RawDescriptionHelpFormatter
     )
 
@@ -107,19 +207,435 @@ def create_parser() -> argparse.ArgumentParser:
         help='Filter results to top priority issues only (reduces output size)'
     )
 
+    parser.add_argument(
+        '--jobs',
+        type=int,
+        default=0,
+        metavar='N',
+        help='Number of analyzers to run in parallel (default: 0, one per CPU)'
+    )
+
+    parser.add_argument(
+        '--format',
+        choices=tuple(_FORMATS),
+        default='toon',
+        help='Report format (default: toon); msgpack and cbor write binary reports'
+    )
+
+    parser.add_argument(
+        '--no-cache',
+        action='store_true',
+        help='Re-analyze everything instead of reusing cached reports and per-file results'
+    )
+
+    parser.add_argument(
+        '--since',
+        metavar='REF',
+        help='Only analyze files changed since a git ref and the files importing them'
+    )
+
+    parser.add_argument(
+        '--semgrep-config',
+        default='auto',
+        metavar='CONFIG',
+        help='Semgrep rules: registry name or local rule file/directory (default: auto); '
+             'local Python rules let files without any of their literals be skipped'
+    )
+
     parser.add_argument(
         '--version',
         action='version',
-        version='%(prog)s 0.1.0'
+        version=f'%(prog)s {_VERSION}'
     )
 
     return parser
 
 
+def create_parser() -> argparse.ArgumentParser:
+    """Return the argument parser, building it on the first call only."""
+    global _PARSER
+    if _PARSER is None:
+        _PARSER = _build_parser()
+    return _PARSER
+
+
+def _fast_parse(argv: List[str]) -> Optional[SimpleNamespace]:
+    """
+    Parse the common invocation without building the argparse parser.
+
+    Returns None for anything not handled exactly (help, version, unknown or
+    abbreviated flags, --opt=value, bad values, missing --workspace) so the
+    caller can fall back to argparse for full handling and error messages.
+    """
+    values = dict(_FAST_DEFAULTS)
+    index = 0
+    count = len(argv)
+    while index < count:
+        spec = _FAST_OPTIONS.get(argv[index])
+        if spec is None:
+            return None
+
+        dest, convert = spec
+        if convert is None:
+            values[dest] = True
+            index += 1
+            continue
+
+        if index + 1 >= count or argv[index + 1].startswith('-'):
+            return None
+        try:
+            values[dest] = convert(argv[index + 1])
+        except ValueError:
+            return None
+        index += 2
+
+    if 'workspace' not in values:
+        return None
+    return SimpleNamespace(**values)
+
+
+def _tool_versions() -> dict:
+    """
+    Version strings of the analyzers, queried in parallel.
+
+    Read the way the checkers read them, so they compare equal to the
+    versions a run records.
+    """
+    import subprocess
+    from concurrent.futures import ThreadPoolExecutor
+
+    def version(tool: str) -> str:
+        try:
+            result = subprocess.run(
+                [tool, '--version'], capture_output=True, text=True, timeout=10
+            )
+        except (OSError, subprocess.SubprocessError):
+            return 'unknown'
+        if result.returncode != 0:
+            return 'unknown'
+        return result.stdout.strip().split('\n')[0]
+
+    with ThreadPoolExecutor(max_workers=len(_TOOLS)) as pool:
+        return dict(zip(_TOOLS, pool.map(version, _TOOLS)))
+
+
+def _cache_key(args, output_file: str) -> str:
+    """
+    Hash the run options and the (path, mtime_ns, size) of every file the
+    analyzers can read.
+
+    The analyzers lint the whole workspace, not only files matching the
+    pattern, so every workspace file outside _KEY_SKIP_DIRS is hashed,
+    along with config files in parent directories, local semgrep rules
+    and CDQA's own sources. The report itself is left out so writing it
+    does not invalidate the entry. Analyzer versions are not part of the
+    key; they are checked only once a stored report matches it.
+    """
+    # Only needed here; the walker shares the analyzers' compiled glob
+    from pathlib import Path
+    from cdqa_utils import iter_glob_files
+    from semgrep_scanner import rule_files
+
+    workspace = Path(args.workspace).resolve()
+    hasher = hashlib.blake2b(digest_size=20)
+    hasher.update(repr((
+        _VERSION, str(workspace), args.pattern, args.max_issues, args.filtered,
+        args.format, args.semgrep_config
+    )).encode('utf-8'))
+
+    report = Path(output_file).resolve()
+    skipped = {report, report.with_name(report.name + '.tmp')}
+    paths = [
+        path for path in iter_glob_files(workspace, '**/*', _KEY_SKIP_DIRS)
+        if path not in skipped
+    ]
+    paths.extend(
+        parent / name for parent in workspace.parents for name in _CONFIG_FILES
+    )
+    paths.extend(rule_files(args.semgrep_config))
+    paths.append(Path(os.path.abspath(__file__)))
+    paths.extend(Path(_TOOLS_DIR).glob('*.py'))
+    paths.append(Path(_TOOLS_DIR).parent / 'run_QA.py')
+
+    entries = []
+    for path in paths:
+        try:
+            stat = path.stat()
+        except OSError:
+            continue
+        entries.append((str(path), stat.st_mtime_ns, stat.st_size))
+    entries.sort()
+
+    for entry in entries:
+        hasher.update(repr(entry).encode('utf-8'))
+    return hasher.hexdigest()
+
+
+def _atomic_write(data: bytes, target: str):
+    """Write data to target through a temporary file and an atomic rename."""
+    tmp_path = target + '.tmp'
+    try:
+        with open(tmp_path, 'wb') as fh:
+            fh.write(data)
+        os.replace(tmp_path, target)
+    except OSError:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+def _prune_cached_reports():
+    """Remove stored reports beyond the count and age bounds, oldest use first."""
+    now = time.time()
+    reports = []
+    try:
+        with os.scandir(_CACHE_DIR) as entries:
+            for entry in entries:
+                if entry.name.endswith('.report'):
+                    reports.append((entry.stat().st_mtime, entry.path[:-len('.report')]))
+    except OSError:
+        return
+    reports.sort(reverse=True)
+
+    for position, (mtime, stem) in enumerate(reports):
+        if position < _CACHE_MAX_REPORTS and now - mtime < _CACHE_MAX_AGE:
+            continue
+        for suffix in ('.report', '.json'):
+            try:
+                os.remove(stem + suffix)
+            except OSError:
+                pass
+
+
+def _store_cached_report(
+    key: str, output_file: str, summary: dict, versions: dict, registry: bool
+):
+    """
+    Save a finished report with its banner summary, the analyzer versions
+    that produced it and whether registry rules were used; failures are
+    not fatal.
+    """
+    entry = {
+        'summary': summary,
+        'versions': versions,
+        'registry': registry,
+        'stored_at': time.time(),
+    }
+    try:
+        os.makedirs(_CACHE_DIR, exist_ok=True)
+        report_path = os.path.join(_CACHE_DIR, f'{key}.report')
+        tmp_path = report_path + '.tmp'
+        shutil.copyfile(output_file, tmp_path)
+        os.replace(tmp_path, report_path)
+        _atomic_write(
+            json.dumps(entry).encode('utf-8'), os.path.join(_CACHE_DIR, f'{key}.json')
+        )
+    except OSError:
+        return
+    _prune_cached_reports()
+
+
+def _restamp(report: bytes, report_format: str) -> bytes:
+    """Replace a stored report's timestamp with the current time."""
+    timestamp = datetime.now().astimezone().isoformat()
+
+    if report_format == 'toon':
+        from toon_serializer import ToonSerializer
+
+        # The timestamp is always the report's first line
+        _, _, rest = report.partition(b'\n')
+        line = ToonSerializer(indent_size=2).dumps({'timestamp': timestamp})
+        return line.encode('utf-8') + b'\n' + rest
+
+    if report_format == 'msgpack':
+        import msgpack
+        results = msgpack.unpackb(report, raw=False)
+    else:
+        import cbor2
+        results = cbor2.loads(report)
+    results['timestamp'] = timestamp
+
+    stream = io.BytesIO()
+    _binary_encoder(report_format)(results, stream)
+    return stream.getvalue()
+
+
+def _load_cached_report(key: str, output_file: str, report_format: str) -> Optional[dict]:
+    """
+    Write a cached report to output_file and return its summary, or None on a miss.
+
+    A stored report is reused only while the analyzers report the versions
+    that produced it, and, for registry semgrep rules, for _REGISTRY_MAX_AGE.
+    The versions are only queried once an entry exists for the key.
+    """
+    report_path = os.path.join(_CACHE_DIR, f'{key}.report')
+    try:
+        with open(os.path.join(_CACHE_DIR, f'{key}.json'), encoding='utf-8') as fh:
+            entry = json.load(fh)
+        summary = entry['summary']
+        if entry['registry'] and time.time() - entry['stored_at'] > _REGISTRY_MAX_AGE:
+            return None
+        if entry['versions'] != _tool_versions():
+            return None
+        with open(report_path, 'rb') as fh:
+            report = fh.read()
+        _atomic_write(_restamp(report, report_format), output_file)
+        # Mark the entry as recently used for pruning
+        os.utime(report_path)
+    except (ImportError, KeyError, OSError, TypeError, ValueError):
+        return None
+    return summary
+
+
+def _binary_encoder(report_format: str):
+    """
+    Return a (results, stream) writer for a binary report format.
+
+    Returns None for TOON. Raises ImportError if the format's optional
+    package is not installed.
+    """
+    if report_format == 'msgpack':
+        import msgpack
+
+        def write(results, stream):
+            stream.write(msgpack.packb(results, use_bin_type=True))
+        return write
+
+    if report_format == 'cbor':
+        import cbor2
+
+        def write(results, stream):
+            cbor2.dump(results, stream)
+        return write
+
+    return None
+
+
+def _print_summary(output_file: str, summary: dict):
+    """Print the success banner in a single write."""
+    banner = (
+        f"\n✅ Quality check complete! Results written to: {output_file}\n"
+        f"\n📊 Summary:\n"
+        f"  Quality Score: {summary['quality_score']}/100\n"
+        f"  Total Issues: {summary['total_issues']}\n"
+        f"  Critical Issues: {summary['critical_issues']}\n"
+        f"  Quality Gates: {summary['failed_gates']} FAILED\n"
+    )
+
+    # Write the UTF-8 bytes straight to the descriptor, skipping the text
+    # layer's encoder; streams without a real descriptor take the normal path
+    try:
+        fd = sys.stdout.fileno()
+    except (AttributeError, OSError, ValueError):
+        sys.stdout.write(banner)
+        return
+
+    sys.stdout.flush()
+    data = banner.encode('utf-8')
+    try:
+        while data:
+            data = data[os.write(fd, data):]
+    except BrokenPipeError:
+        # Nobody reads the banner any more (e.g. piped into head); the
+        # report is already written
+        pass
+    except OSError:
+        # e.g. EAGAIN on a non-blocking stdout: the stream layer writes the rest
+        sys.stdout.buffer.write(data)
+        sys.stdout.flush()
+
+
+def _informational_flag(argv: List[str]) -> Optional[str]:
+    """
+    Return the first help or version flag in argv, if it is handled exactly.
+
+    Tokens after the first one that is not a plain flag or its value may be
+    errors argparse would report first, so only an argv made of known fast
+    options up to the informational flag is answered directly.
+    """
+    index = 0
+    count = len(argv)
+    while index < count:
+        token = argv[index]
+        if token in _HELP_FLAGS or token == _VERSION_FLAG:
+            return token
+        spec = _FAST_OPTIONS.get(token)
+        if spec is None:
+            return None
+        if spec[1] is None:
+            index += 1
+            continue
+        if index + 1 >= count or argv[index + 1].startswith('-'):
+            return None
+        try:
+            spec[1](argv[index + 1])
+        except ValueError:
+            return None
+        index += 2
+    return None
+
+
 def main():
     """Main CLI entry point."""
-    parser = create_parser()
-    args = parser.parse_args()
+    argv = sys.argv[1:]
+
+    # Answer --version without building the parser, and --help without
+    # running a parse first
+    flag = _informational_flag(argv)
+    if flag == _VERSION_FLAG:
+        sys.stdout.write(f'cdqa {_VERSION}\n')
+        return 0
+    if flag is not None:
+        sys.stdout.write(create_parser().format_help())
+        return 0
+
+    args = _fast_parse(argv)
+    if args is None:
+        args = create_parser().parse_args(argv)
+
+    # Determine output file
+    if args.output:
+        output_file = os.fspath(args.output)
+    else:
+        output_file = os.path.join(
+            args.workspace, f'quality_report.{_FORMATS[args.format]}'
+        )
+
+    # The bundled tools import each other by bare module name
+    sys.path.insert(0, _TOOLS_DIR)
+
+    # Unchanged files and analyzer versions since a previous run: reuse its
+    # report (registry semgrep rules only for a day). The file set of a
+    # --since run also depends on git history, so it is never reused
+    cache_key = None
+    if not args.no_cache and not args.since:
+        try:
+            cache_key = _cache_key(args, output_file)
+        except OSError:
+            cache_key = None
+    if cache_key is not None:
+        summary = _load_cached_report(cache_key, output_file, args.format)
+        if summary is not None:
+            _print_summary(output_file, summary)
+            return 0
+
+    # Fail before the analysis if a binary format's package is missing
+    try:
+        encoder = _binary_encoder(args.format)
+    except ImportError as e:
+        sys.stderr.write(f"cdqa: --format {args.format} requires the '{e.name}' package\n")
+        return 1
+
+    # Import the analysis stack only once a run is actually requested, so
+    # --help, --version and usage errors exit without loading it. Installed,
+    # this module lives in the cdqa package; run as a script, run_QA sits
+    # next to it on sys.path
+    if __package__:
+        from .run_QA import CodeQualityChecker, ToonSerializer
+    else:
+        from run_QA import CodeQualityChecker, ToonSerializer
 
     # Create checker
     checker = CodeQualityChecker(
@@ -127,29 +643,54 @@ def main():
         pattern=args.pattern,
         verbose=args.verbose,
         max_issues=args.max_issues,
-        filtered=args.filtered
+        filtered=args.filtered,
+        jobs=args.jobs,
+        use_cache=not args.no_cache,
+        since=args.since,
+        semgrep_config=args.semgrep_config
     )
 
+    # Write the report through a large buffer into a temporary file that
+    # replaces the output only once complete
+    tmp_file = output_file + '.tmp'
     try:
-        # Run analysis
-        results = checker.analyze()
-
-        # Determine output file
-        if args.output:
-            output_file = Path(args.output)
-        else:
-            output_file = Path(args.workspace) / 'quality_report.toon'
-
-        # Write results in TOON format
-        serializer = ToonSerializer(indent_size=2)
-        serializer.dump(results, str(output_file))
-
-        print(f"\n✅ Quality check complete! Results written to: {output_file}")
-        print("\n📊 Summary:")
-        print(f"  Quality Score: {results['summary']['quality_score']}/100")
-        print(f"  Total Issues: {results['summary']['total_issues']}")
-        print(f"  Critical Issues: {len(results['critical_issues'])}")
-        print(f"  Quality Gates: {sum(1 for g in results['quality_gates'] if g['status'] == 'FAIL')} FAILED")
+        with open(tmp_file, 'wb', buffering=1 << 20) as fh:
+            if encoder is not None:
+                results = checker.analyze()
+                encoder(results, fh)
+                # bool counts as 0/1: no per-item conditional in the generator
+                stats = {
+                    'critical_issues': len(results['critical_issues']),
+                    'failed_gates': sum(
+                        g['status'] == 'FAIL' for g in results['quality_gates']
+                    ),
+                }
+            else:
+                # TOON is streamed section by section as the analysis builds
+                # them; the serializer counts critical issues and failed
+                # gates on the way through
+                stats = ToonSerializer(indent_size=2).dump_to_stream(
+                    checker.iter_analysis(), fh
+                )
+            # Make sure the report is on disk before announcing it
+            fh.flush()
+        os.replace(tmp_file, output_file)
+
+        summary = {
+            'quality_score': checker.results['summary']['quality_score'],
+            'total_issues': checker.results['summary']['total_issues'],
+            'critical_issues': stats['critical_issues'],
+            'failed_gates': stats['failed_gates'],
+        }
+        if cache_key is not None:
+            from semgrep_scanner import rule_files
+
+            _store_cached_report(
+                cache_key, output_file, summary, checker.tool_versions,
+                registry=not rule_files(args.semgrep_config)
+            )
+
+        _print_summary(output_file, summary)
 
         return 0
 
@@ -162,6 +703,12 @@ def main():
             import traceback
             traceback.print_exc()
         return 1
+    finally:
+        # Left behind only by a failed or interrupted run
+        try:
+            os.remove(tmp_file)
+        except OSError:
+            pass
 
 
 if __name__ == '__main__':
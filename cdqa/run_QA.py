@@ -16,26 +16,155 @@ Usage:
 
 import argparse
 import logging
+import mmap
+import os
+import re
 import sys
+from array import array
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import ExitStack
 from pathlib import Path
 from datetime import datetime
-from typing import Dict, Any, List
+from functools import lru_cache
+from itertools import islice
+from typing import Any, Dict, FrozenSet, Iterator, List, NamedTuple, Optional, Tuple
 
 # Add tools directory to path
 sys.path.insert(0, str(Path(__file__).parent / "tools"))
 
-from ruff_checker import RuffChecker
-from ty_checker import TyChecker
-from semgrep_scanner import SemgrepScanner
-from complexipy_metrics import ComplexipyMetrics
-from skylos_analyzer import SkylosAnalyzer
-from pattern_analyzer import PatternAnalyzer
+# Checker modules are imported when a checker is built, so --help and
+# argument errors do not pay for them
+from cdqa_utils import iter_source_files
 from toon_serializer import ToonSerializer
 
 
+# Complexity grades counted as high
+_HIGH_GRADES = frozenset(("F", "D"))
+
+# Ruff code prefix reported as a critical error; ruff_checker grades every
+# code with it as an error, so the prefix alone selects them
+_PYFLAKES_PREFIX = "F"
+
+# Skylos confidence from which an unused function is a critical warning
+_DEAD_CODE_CONFIDENCE = 80
+
+# Line breaks as text mode's universal newlines sees them
+_NEWLINE = re.compile(rb"\r\n|\r|\n")
+
+
+class _IssueCandidate(NamedTuple):
+    """A possible critical issue: a compact tuple until it is selected."""
+
+    severity: str
+    tool: str
+    file: str
+    line: int
+    message: str
+    has_line: bool = True
+
+
+class _LineIndex(NamedTuple):
+    """A file's bytes and the [start, end) offsets of each of its lines."""
+
+    data: bytes
+    starts: array
+    ends: array
+
+
+@lru_cache(maxsize=256)
+def _index_file(path: str, mtime_ns: int, size: int) -> _LineIndex:
+    """
+    A file's bytes and line offsets.
+
+    Keyed by modification time and size as well, so repeated analyses in
+    one process reuse the index of files that have not changed.
+    """
+    with open(path, "rb") as f:
+        data = f.read()
+    starts = array("Q")
+    ends = array("Q")
+    start = 0
+    for match in _NEWLINE.finditer(data):
+        starts.append(start)
+        ends.append(match.start())
+        start = match.end()
+    if start < len(data):
+        # Final line without a trailing newline
+        starts.append(start)
+        ends.append(len(data))
+    return _LineIndex(data, starts, ends)
+
+
+class _FormatSpec(NamedTuple):
+    """A tool's report format, with its field lookups resolved."""
+
+    # (field, data key, default, append "%")
+    base_fields: Tuple[Tuple[str, str, Any, bool], ...]
+    # (field, list limit) in filtered reports
+    filtered_fields: Tuple[Tuple[str, int], ...]
+    unfiltered_fields: Tuple[str, ...]
+
+
+def _compile_format(config: Dict[str, Any]) -> _FormatSpec:
+    """
+    Resolve a format config once.
+
+    A base field value "get:key" reads key, defaulting to 0; any other value
+    is read as a key, defaulting to itself.
+    """
+    base_fields = []
+    for field, value in config.get("base_fields", {}).items():
+        if isinstance(value, str) and value.startswith("get:"):
+            base_fields.append((field, value[4:], 0, field == "type_coverage"))
+        else:
+            base_fields.append((field, value, value, False))
+    return _FormatSpec(
+        tuple(base_fields),
+        tuple(config.get("filtered_fields", {}).items()),
+        tuple(config.get("unfiltered_fields", [])),
+    )
+
+
 class CodeQualityChecker:
     """Main analyzer that orchestrates all quality checking tools."""
 
+    # Report format per tool
+    _FORMAT_CONFIGS = {
+        "ruff": _compile_format({
+            "base_fields": {"total": "total", "auto_fixable": "auto_fixable"},
+            "filtered_fields": {"by_category": 6},
+            "unfiltered_fields": ["severity_counts", "all_issues"],
+        }),
+        "ty": _compile_format({
+            "base_fields": {"total": "total", "type_coverage": "get:type_coverage"},
+            "filtered_fields": {"by_error": 5},
+            "unfiltered_fields": [
+                "files_checked",
+                "files_with_errors",
+                "all_errors",
+            ],
+        }),
+        "semgrep": _compile_format({
+            "base_fields": {"total": "total"},
+            "filtered_fields": {},
+            "unfiltered_fields": ["severity_counts", "all_findings"],
+        }),
+        "complexipy": _compile_format({
+            "base_fields": {},
+            "filtered_fields": {"complexity_hotspots": 10},
+            "unfiltered_fields": ["avg_complexity", "total_functions"],
+        }),
+        "skylos": _compile_format({
+            "base_fields": {
+                "total_dead_code": "total_dead_code",
+                "confidence_level": "confidence_level",
+            },
+            "filtered_fields": {"dead_functions": 10, "unused_imports": 10},
+            "unfiltered_fields": ["security_findings"],
+        }),
+    }
+
     def __init__(
         self,
         workspace: str,
@@ -43,6 +172,10 @@ class CodeQualityChecker:
         verbose: bool = False,
         max_issues: int = 50,
         filtered: bool = False,
+        jobs: int = 0,
+        use_cache: bool = True,
+        since: Optional[str] = None,
+        semgrep_config: str = "auto",
     ):
         """
         Initialize code quality checker.
@@ -53,12 +186,28 @@ class CodeQualityChecker:
             verbose: Enable verbose logging
             max_issues: Maximum number of issues to display per category
             filtered: Filter results to top issues (default: False/unfiltered)
+            jobs: Analyzers run in parallel (default: 0, one per CPU)
+            use_cache: Reuse per-file results for unchanged files
+            since: Git ref; only files changed since it, and files importing
+                them, are analyzed (default: None, the whole workspace)
+            semgrep_config: Semgrep rules: a registry name, or a local rule
+                file or directory (default: "auto")
         """
         self.workspace = Path(workspace).resolve()
+        self._workspace_str = str(self.workspace)
         self.pattern = pattern
         self.verbose = verbose
         self.max_issues = max_issues
         self.filtered = filtered
+        self.jobs = jobs if jobs > 0 else (os.cpu_count() or 1)
+        self.since = since
+        self._files: Optional[List[str]] = None
+        # Line offsets per report path, read once for all snippets of a file
+        # that has more than one; a file's first snippet only maps it
+        self._file_line_cache: Dict[str, Optional[_LineIndex]] = {}
+        self._snippet_files_seen = set()
+        # Enumerated files, known to exist without another stat
+        self._known_files: Optional[FrozenSet[str]] = None
 
         # Setup logging
         log_level = logging.DEBUG if verbose else logging.INFO
@@ -69,12 +218,28 @@ class CodeQualityChecker:
         self.logger = logging.getLogger(__name__)
 
         # Initialize checkers
-        self.ruff = RuffChecker(str(self.workspace))
+        from analysis_cache import AnalysisCache
+        from ruff_checker import RuffChecker
+        from ty_checker import TyChecker
+        from semgrep_scanner import SemgrepScanner
+        from complexipy_metrics import ComplexipyMetrics
+        from skylos_analyzer import SkylosAnalyzer
+        from pattern_analyzer import PatternAnalyzer
+
+        # Per-file results shared by the checkers that can use them
+        self.cache = AnalysisCache() if use_cache else None
+
+        self.ruff = RuffChecker(str(self.workspace), cache=self.cache)
         self.ty = TyChecker(str(self.workspace))
-        self.semgrep = SemgrepScanner(str(self.workspace))
+        self.semgrep = SemgrepScanner(
+            str(self.workspace), config=semgrep_config, cache=self.cache
+        )
         self.complexipy = ComplexipyMetrics(str(self.workspace))
         self.skylos = SkylosAnalyzer(str(self.workspace))
-        self.pattern_analyzer = PatternAnalyzer(str(self.workspace))
+        self.pattern_analyzer = PatternAnalyzer(str(self.workspace), cache=self.cache)
+
+        # Version each external analyzer reported, filled in by a run
+        self.tool_versions: Dict[str, str] = {}
 
         # Results storage
         self.results = {
@@ -89,47 +254,126 @@ class CodeQualityChecker:
         Returns:
             Dictionary with all quality check results
         """
-        self.logger.info(f"Starting code quality check of {self.workspace}")
+        for key, value in self.iter_analysis():
+            self.results[key] = value
+        return self.results
 
-        # Stage 1: Ruff linting
-        self.logger.info("=== Stage 1: Ruff Linting ===")
-        ruff_results = self.ruff.check(self.pattern)
+    def iter_analysis(self) -> Iterator[Tuple[str, Any]]:
+        """
+        Run the pipeline and yield the report's top-level sections in order.
 
-        # Stage 2: ty type checking
-        self.logger.info("=== Stage 2: ty Type Checking ===")
-        ty_results = self.ty.analyze(self.pattern)
+        Each section is yielded as soon as it is built and is not kept, so
+        a writer can stream the report without the whole document in
+        memory; only the summary is also stored in self.results.
 
-        # Stage 3: Semgrep security scanning
-        self.logger.info("=== Stage 3: Semgrep Security Scanning ===")
-        semgrep_results = self.semgrep.scan(self.pattern)
+        Yields:
+            (section name, section value) pairs
+        """
+        self.logger.info(f"Starting code quality check of {self.workspace}")
 
-        # Stage 4: Complexipy cognitive complexity
-        self.logger.info("=== Stage 4: Complexipy Cognitive Complexity ===")
-        complexipy_results = self.complexipy.measure(self.pattern)
+        if self.since:
+            self._restrict_to_impacted()
+
+        # Stages 1-6 are independent. The external tools run in subprocesses,
+        # so threads suffice for them; the pattern analyzer parses ASTs in
+        # Python and gets its own process so it does not contend for the GIL
+        subprocess_stages = {
+            "ruff": ("Stage 1: Ruff Linting", self.ruff.check),
+            "ty": ("Stage 2: ty Type Checking", self.ty.analyze),
+            "semgrep": ("Stage 3: Semgrep Security Scanning", self.semgrep.scan),
+            "complexipy": ("Stage 4: Complexipy Cognitive Complexity", self.complexipy.measure),
+            "skylos": ("Stage 5: Skylos Dead Code Detection", self.skylos.scan),
+        }
+        in_process_stages = {
+            "pattern": ("Stage 6: Pattern Consistency Analysis", self.pattern_analyzer.analyze),
+        }
 
-        # Stage 5: Skylos dead code detection
-        self.logger.info("=== Stage 5: Skylos Dead Code Detection ===")
-        skylos_results = self.skylos.scan(self.pattern)
+        results = {}
+        use_processes = self.jobs > 1
+        if use_processes:
+            from concurrent.futures import ProcessPoolExecutor
 
-        # Stage 6: Pattern consistency analysis
-        self.logger.info("=== Stage 6: Pattern Consistency Analysis ===")
-        pattern_results = self.pattern_analyzer.analyze(self.pattern)
+            # Semgrep runs beside the other stages; its share of the jobs
+            # keeps it from starting one worker per CPU on top of them
+            self.semgrep.jobs = max(
+                1, self.jobs // (len(subprocess_stages) + len(in_process_stages))
+            )
+        thread_workers = len(subprocess_stages) + (0 if use_processes else len(in_process_stages))
+        with ExitStack() as stack:
+            threads = stack.enter_context(
+                ThreadPoolExecutor(max_workers=min(self.jobs, thread_workers))
+            )
+            processes = (
+                stack.enter_context(ProcessPoolExecutor(max_workers=1))
+                if use_processes
+                else threads
+            )
+            # The workspace is walked once and the list handed to the
+            # analyzer. Its worker is forked before any tool subprocess
+            # starts, so it cannot inherit their pipes and hold them open
+            if self.pattern_analyzer.targets is None:
+                self.pattern_analyzer.targets = self._enumerate_files()
+                # ty checks all Python files; the same walk counts them
+                if self.pattern == "**/*.py":
+                    self.ty.source_files = self._enumerate_files()
+            futures = {}
+            for key, (name, stage) in in_process_stages.items():
+                self.logger.info(f"=== {name} ===")
+                futures[processes.submit(stage, self.pattern)] = key
+            for key, (name, stage) in subprocess_stages.items():
+                self.logger.info(f"=== {name} ===")
+                futures[threads.submit(stage, self.pattern)] = key
+
+            # Collected as they finish, merged by name so the order is fixed
+            for future in as_completed(futures):
+                results[futures[future]] = future.result()
+
+        self.tool_versions = {
+            key: results[key].get("version", "unknown") for key in subprocess_stages
+        }
 
         # Stage 7: Synthesis
         self.logger.info("=== Stage 7: Synthesis ===")
-        self._synthesize_results(
-            ruff_results,
-            ty_results,
-            semgrep_results,
-            complexipy_results,
-            skylos_results,
-            pattern_results,
+        yield "timestamp", self.results["timestamp"]
+        yield "workspace", self.results["workspace"]
+        yield from self._iter_sections(
+            results["ruff"],
+            results["ty"],
+            results["semgrep"],
+            results["complexipy"],
+            results["skylos"],
+            results["pattern"],
         )
 
         self.logger.info("Quality check complete!")
-        return self.results
 
-    def _synthesize_results(
+    def _restrict_to_impacted(self):
+        """
+        Limit the checkers to files changed since self.since and their importers.
+
+        Skylos keeps the whole workspace: dead code is only visible with
+        every caller in view.
+        """
+        from change_impact import impacted_files
+
+        targets = impacted_files(self.workspace, self.pattern, self.since, self.cache)
+        self.logger.info(f"{len(targets)} files impacted by changes since {self.since}")
+
+        for checker in (self.ruff, self.ty, self.semgrep, self.complexipy):
+            checker.targets = targets
+        self.pattern_analyzer.targets = targets
+
+    def _enumerate_files(self) -> List[str]:
+        """
+        Files matching the pattern, walked with os.scandir on first use only.
+
+        Non-source directories such as .git and virtualenvs are not entered.
+        """
+        if self._files is None:
+            self._files = [str(path) for path in iter_source_files(self.workspace, self.pattern)]
+        return self._files
+
+    def _iter_sections(
         self,
         ruff: Dict,
         ty: Dict,
@@ -137,8 +381,8 @@ class CodeQualityChecker:
         complexipy: Dict,
         skylos: Dict,
         pattern: Dict,
-    ):
-        """Synthesize all results into TOON-compatible structure."""
+    ) -> Iterator[Tuple[str, Any]]:
+        """Synthesize all results into TOON-compatible sections, in report order."""
 
         # Calculate total issues (including dead code and pattern inconsistencies)
         total_issues = (
@@ -149,10 +393,11 @@ class CodeQualityChecker:
             + pattern.get("total_inconsistencies", 0)
         )
 
+        # Counts and filtered findings shared by the sections below
+        index = self._index_findings(semgrep, complexipy)
+
         # Calculate quality score (0-100)
-        quality_score = self._calculate_quality_score(
-            ruff, ty, semgrep, complexipy, skylos
-        )
+        quality_score = self._calculate_quality_score(ruff, ty, skylos, index)
 
         # Build summary section
         self.results["summary"] = {
@@ -169,12 +414,13 @@ class CodeQualityChecker:
             ],
             "execution_time_ms": 0,  # Will be calculated if needed
         }
+        yield "summary", self.results["summary"]
 
         # Build quality gates
-        max_complexity = max(
-            [h["complexity"] for h in complexipy["complexity_hotspots"]], default=0
-        )
-        self.results["quality_gates"] = [
+        max_complexity = index["max_complexity"]
+        security_errors = index["security_errors"]
+        dead_functions = len(skylos["dead_functions"])
+        yield "quality_gates", [
             {
                 "gate": "linting_errors",
                 "threshold": "<50",
@@ -190,10 +436,8 @@ class CodeQualityChecker:
             {
                 "gate": "security_critical",
                 "threshold": "0",
-                "actual": semgrep["severity_counts"].get("ERROR", 0),
-                "status": "PASS"
-                if semgrep["severity_counts"].get("ERROR", 0) == 0
-                else "FAIL",
+                "actual": security_errors,
+                "status": "PASS" if security_errors == 0 else "FAIL",
             },
             {
                 "gate": "cognitive_complexity",
@@ -204,107 +448,92 @@ class CodeQualityChecker:
             {
                 "gate": "dead_code",
                 "threshold": "<5",
-                "actual": len(skylos["dead_functions"]),
-                "status": "PASS" if len(skylos["dead_functions"]) < 5 else "FAIL",
+                "actual": dead_functions,
+                "status": "PASS" if dead_functions < 5 else "FAIL",
             },
         ]
 
         # Build critical issues list (filtered or unfiltered)
-        self.results["critical_issues"] = self._build_critical_issues(
-            ruff, ty, semgrep, complexipy, skylos
-        )
-
-        # Store tool-specific results using generic formatter
-        self.results["ruff"] = self._format_tool_results(
-            ruff,
-            {
-                "base_fields": {"total": "total", "auto_fixable": "auto_fixable"},
-                "filtered_fields": {"by_category": 6},
-                "unfiltered_fields": ["severity_counts", "all_issues"],
-            },
-        )
-        self.results["ty"] = self._format_tool_results(
-            ty,
-            {
-                "base_fields": {"total": "total", "type_coverage": "get:type_coverage"},
-                "filtered_fields": {"by_error": 5},
-                "unfiltered_fields": [
-                    "files_checked",
-                    "files_with_errors",
-                    "all_errors",
-                ],
-            },
-        )
-        self.results["semgrep"] = self._format_tool_results(
-            semgrep,
-            {
-                "base_fields": {"total": "total"},
-                "filtered_fields": {},
-                "unfiltered_fields": ["severity_counts", "all_findings"],
-            },
-        )
-        self.results["complexipy"] = self._format_tool_results(
-            complexipy,
-            {
-                "base_fields": {},
-                "filtered_fields": {"complexity_hotspots": 10},
-                "unfiltered_fields": ["avg_complexity", "total_functions"],
-            },
-        )
-        self.results["skylos"] = self._format_tool_results(
-            skylos,
-            {
-                "base_fields": {
-                    "total_dead_code": "total_dead_code",
-                    "confidence_level": "confidence_level",
-                },
-                "filtered_fields": {"dead_functions": 10, "unused_imports": 10},
-                "unfiltered_fields": ["security_findings"],
-            },
-        )
+        critical_issues = self._build_critical_issues(ruff, ty, skylos, index)
+        yield "critical_issues", critical_issues
+
+        # Store tool-specific results using the precompiled formats
+        for tool, data in (
+            ("ruff", ruff),
+            ("ty", ty),
+            ("semgrep", semgrep),
+            ("complexipy", complexipy),
+            ("skylos", skylos),
+        ):
+            yield tool, self._format_tool_results(data, self._FORMAT_CONFIGS[tool])
 
         # Pattern consistency results (Priority 2)
-        self.results["consistency_issues"] = pattern.get("consistency_issues", [])
+        yield "consistency_issues", pattern.get("consistency_issues", [])
 
         # Issue clustering (Priority 3)
-        self.results["issue_clusters"] = self._cluster_issues(
-            self.results["critical_issues"], ruff, ty, semgrep, complexipy, skylos
-        )
+        yield "issue_clusters", self._cluster_issues(critical_issues, ty, skylos, index)
 
         # Generate recommendations
-        self.results["immediate_fixes"] = self._generate_immediate_fixes(
-            ruff, ty, semgrep, complexipy, skylos
-        )
-        self.results["next_steps"] = self._generate_next_steps(
-            ruff, ty, semgrep, complexipy, skylos
-        )
+        yield "immediate_fixes", self._generate_immediate_fixes(ruff, skylos, index)
+        yield "next_steps", self._generate_next_steps(ty, skylos, index)
 
-    def _format_tool_results(self, data: Dict, config: Dict[str, Any]) -> Dict:
-        """Format tool results for TOON output using configuration."""
+    def _format_tool_results(self, data: Dict, spec: _FormatSpec) -> Dict:
+        """Format tool results for TOON output using a compiled format."""
         result = {}
 
-        for field, value in config.get("base_fields", {}).items():
-            if isinstance(value, str) and value.startswith("get:"):
-                key = value[4:]
-                field_value = data.get(key, 0)
-                if field == "type_coverage":
-                    result[field] = f"{field_value}%"
-                else:
-                    result[field] = field_value
-            else:
-                result[field] = data.get(value, value)
+        for field, key, default, percent in spec.base_fields:
+            field_value = data.get(key, default)
+            result[field] = f"{field_value}%" if percent else field_value
 
         if self.filtered:
-            for field, limit in config.get("filtered_fields", {}).items():
+            for field, limit in spec.filtered_fields:
                 result[field] = data.get(field, [])[:limit]
         else:
-            for field in config.get("unfiltered_fields", []):
+            for field in spec.unfiltered_fields:
                 result[field] = data.get(field, [])
 
         return result
 
+    def _index_findings(self, semgrep: Dict, complexipy: Dict) -> Dict[str, Any]:
+        """
+        Compute the semgrep and complexity counts used across the synthesis,
+        and the filtered findings more than one section walks.
+
+        Each list is scanned once. Filtered findings are kept with their
+        position in the full list, for sections that only look at its head.
+        """
+        max_complexity = 0
+        complex_top5 = 0
+        high_hotspots = []
+        for position, hotspot in enumerate(complexipy["complexity_hotspots"]):
+            complexity = hotspot["complexity"]
+            if complexity > max_complexity:
+                max_complexity = complexity
+            if hotspot["grade"] in _HIGH_GRADES:
+                high_hotspots.append((position, hotspot))
+            # Cognitive complexity threshold, applied to the top five only
+            if position < 5 and complexity > 12:
+                complex_top5 += 1
+
+        semgrep_errors = [
+            (position, finding)
+            for position, finding in enumerate(semgrep["findings"])
+            if finding["severity"] == "ERROR"
+        ]
+
+        severity_counts = semgrep["severity_counts"]
+        return {
+            "max_complexity": max_complexity,
+            "high_complexity": len(high_hotspots),
+            "complex_top5": complex_top5,
+            "high_hotspots": high_hotspots,
+            "semgrep_errors": semgrep_errors,
+            "security_errors": severity_counts.get("ERROR", 0),
+            "security_warnings": severity_counts.get("WARNING", 0),
+        }
+
     def _calculate_quality_score(
-        self, ruff: Dict, ty: Dict, semgrep: Dict, complexipy: Dict, skylos: Dict
+        self, ruff: Dict, ty: Dict, skylos: Dict, index: Dict[str, Any]
     ) -> int:
         """Calculate overall quality score (0-100)."""
         score = 100
@@ -317,13 +546,11 @@ class CodeQualityChecker:
         score -= max(0, (100 - type_cov) // 5)
 
         # Deduct for security issues
-        score -= semgrep["severity_counts"].get("ERROR", 0) * 10
-        score -= semgrep["severity_counts"].get("WARNING", 0) * 5
+        score -= index["security_errors"] * 10
+        score -= index["security_warnings"] * 5
 
         # Deduct for cognitive complexity (stricter than cyclomatic)
-        for hotspot in complexipy["complexity_hotspots"][:5]:
-            if hotspot["complexity"] > 12:  # Cognitive complexity threshold
-                score -= 5
+        score -= index["complex_top5"] * 5
 
         # Deduct for dead code (new)
         score -= min(15, len(skylos["dead_functions"]) * 2)
@@ -339,8 +566,13 @@ class CodeQualityChecker:
         line: int,
         issue_msg: str,
         has_line: bool = True,
+        snippet: Optional[Dict[str, Any]] = None,
     ) -> Dict[str, Any]:
-        """Helper to create issue dict with optional snippet extraction."""
+        """
+        Helper to create issue dict with optional snippet extraction.
+
+        A snippet already extracted for the location may be passed in.
+        """
         result = {
             "severity": severity,
             "tool": tool,
@@ -350,7 +582,9 @@ class CodeQualityChecker:
         }
 
         if has_line:
-            result.update(self._extract_snippet(file_path, line))
+            if snippet is None:
+                snippet = self._extract_snippet(file_path, line)
+            result.update(snippet)
         else:
             result["snippet"] = ""
             result["context_before"] = []
@@ -359,83 +593,136 @@ class CodeQualityChecker:
         return result
 
     def _build_critical_issues(
-        self, ruff: Dict, ty: Dict, semgrep: Dict, complexipy: Dict, skylos: Dict
+        self, ruff: Dict, ty: Dict, skylos: Dict, index: Dict[str, Any]
     ) -> List[Dict]:
         """Build prioritized list of critical issues with code snippets."""
-        issues = []
+        # Candidates bucketed by severity as they are found; errors then
+        # warnings is the order a stable sort by severity would give. Only
+        # the kept ones become dicts, with snippets
+        errors = []
+        warnings = []
+
+        # Filtered reports keep the first max_issues errors and nothing after
+        # them, so each source is cut off at the room left; None is unbounded
+        def room(taken: int) -> Optional[int]:
+            return max(0, self.max_issues - taken) if self.filtered else None
+
+        def full() -> bool:
+            return room(len(errors)) == 0
 
         # Security errors
-        for finding in semgrep["findings"]:
-            if finding["severity"] == "ERROR":
-                issues.append(
-                    self._create_issue(
-                        "ERROR",
-                        "semgrep",
-                        finding["file"],
-                        finding["line"],
-                        f"{finding['category']}: {finding['message']}",
-                    )
-                )
+        errors.extend(
+            _IssueCandidate(
+                "ERROR",
+                "semgrep",
+                finding["file"],
+                finding["line"],
+                f"{finding['category']}: {finding['message']}",
+            )
+            for _, finding in islice(index["semgrep_errors"], room(len(errors)))
+        )
 
         # Complexity issues
-        for hotspot in complexipy["complexity_hotspots"]:
-            if hotspot["grade"] in ["F", "D"]:
-                severity = "ERROR" if hotspot["grade"] == "F" else "WARNING"
-                issues.append(
-                    self._create_issue(
-                        severity,
-                        "complexipy",
-                        hotspot["file"],
-                        0,
-                        f"Cognitive complexity {hotspot['complexity']} ({hotspot['grade']}-grade) in {hotspot['function']}",
-                        has_line=False,
-                    )
-                )
+        for _, hotspot in index["high_hotspots"]:
+            if full():
+                break
+            is_error = hotspot["grade"] == "F"
+            (errors if is_error else warnings).append(_IssueCandidate(
+                "ERROR" if is_error else "WARNING",
+                "complexipy",
+                hotspot["file"],
+                0,
+                f"Cognitive complexity {hotspot['complexity']} ({hotspot['grade']}-grade) in {hotspot['function']}",
+                has_line=False,
+            ))
 
         # Ty errors
         ty_limit = 5 if self.filtered else len(ty["errors"])
-        for error in ty["errors"][:ty_limit]:
-            if error["severity"] == "error":
-                issues.append(
-                    self._create_issue(
-                        "ERROR", "ty", error["file"], error["line"], error["message"]
-                    )
-                )
+        ty_errors = (error for error in ty["errors"][:ty_limit] if error["severity"] == "error")
+        errors.extend(
+            _IssueCandidate("ERROR", "ty", error["file"], error["line"], error["message"])
+            for error in islice(ty_errors, room(len(errors)))
+        )
 
-        # Ruff errors
-        for issue in ruff["issues"]:
-            if issue["severity"] == "error" and issue["code"].startswith("F"):
-                issues.append(
-                    self._create_issue(
-                        "ERROR",
-                        "ruff",
-                        issue["file"],
-                        issue["line"],
-                        f"{issue['code']}: {issue['message']}",
-                    )
-                )
+        # Ruff errors; the scan stops at the last one that fits
+        ruff_errors = (
+            issue for issue in ruff["issues"] if issue["code"].startswith(_PYFLAKES_PREFIX)
+        )
+        errors.extend(
+            _IssueCandidate(
+                "ERROR",
+                "ruff",
+                issue["file"],
+                issue["line"],
+                f"{issue['code']}: {issue['message']}",
+            )
+            for issue in islice(ruff_errors, room(len(errors)))
+        )
 
         # Dead code
-        for dead_func in skylos["dead_functions"]:
-            if dead_func["confidence"] >= 80:
-                issues.append(
-                    self._create_issue(
-                        "WARNING",
-                        "skylos",
-                        dead_func["file"],
-                        dead_func["line"],
-                        f"Unused function '{dead_func['function']}' (confidence: {dead_func['confidence']}%)",
-                    )
-                )
+        # Only warnings follow, so they stop once the selection is complete
+        dead_funcs = (
+            dead_func
+            for dead_func in skylos["dead_functions"]
+            if dead_func["confidence"] >= _DEAD_CODE_CONFIDENCE
+        )
+        warnings.extend(
+            _IssueCandidate(
+                "WARNING",
+                "skylos",
+                dead_func["file"],
+                dead_func["line"],
+                f"Unused function '{dead_func['function']}' (confidence: {dead_func['confidence']}%)",
+            )
+            for dead_func in islice(dead_funcs, room(len(errors) + len(warnings)))
+        )
+
+        # Most severe first, top N (or all if not filtered)
+        selected = errors + warnings
+        if self.filtered:
+            selected = selected[: self.max_issues]
 
-        # Sort by severity and return top N (or all if not filtered)
-        severity_order = {"ERROR": 0, "WARNING": 1, "INFO": 2}
-        issues.sort(key=lambda x: severity_order.get(x["severity"], 3))
+        snippets = self._extract_snippets(
+            [(issue.file, issue.line) for issue in selected if issue.has_line]
+        )
+        return [
+            self._create_issue(*issue, snippet=snippets.get((issue.file, issue.line)))
+            for issue in selected
+        ]
 
-        return issues[: self.max_issues] if self.filtered else issues
+    def _extract_snippets(
+        self, locations: List[Tuple[str, int]]
+    ) -> Dict[Tuple[str, int], Dict[str, Any]]:
+        """
+        Extract the snippets of many (file, line) locations.
+
+        Each file's locations are handled by one task, so a file is still
+        read at most once; files are spread over a thread pool, as the work
+        is I/O bound.
+
+        Returns:
+            Snippet dict per unique location
+        """
+        by_file: Dict[str, List[int]] = defaultdict(list)
+        for file_path, line in dict.fromkeys(locations):
+            by_file[file_path].append(line)
+        if self._known_files is None and self._files is not None:
+            self._known_files = frozenset(self._files)
+
+        def extract(item):
+            file_path, lines = item
+            return [((file_path, line), self._extract_snippet(file_path, line)) for line in lines]
+
+        workers = min(self.jobs, len(by_file))
+        if workers <= 1:
+            groups = list(map(extract, by_file.items()))
+        else:
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                groups = list(pool.map(extract, by_file.items()))
+        return {location: snippet for group in groups for location, snippet in group}
 
     def _generate_immediate_fixes(
-        self, ruff: Dict, ty: Dict, semgrep: Dict, complexipy: Dict, skylos: Dict
+        self, ruff: Dict, skylos: Dict, index: Dict[str, Any]
     ) -> List[Dict]:
         """Generate immediate fix recommendations."""
         fixes = []
@@ -459,23 +746,26 @@ class CodeQualityChecker:
                 }
             )
 
-        # Security fixes (multiple items)
-        fix_limit = 5 if self.filtered else len(semgrep["findings"])
-        for finding in semgrep["findings"][:fix_limit]:
-            if finding["severity"] == "ERROR":
-                fixes.append(
-                    {
-                        "priority": len(fixes) + 1,
-                        "action": f"Fix {finding['category']}: {finding['file']}:{finding['line']}",
-                        "effort": "10min",
-                    }
-                )
-                if self.filtered and len(fixes) >= 5:
-                    break
-
-        # Complexity fixes (multiple items)
-        hotpot_limit = 5 if self.filtered else len(complexipy["complexity_hotspots"])
-        for hotspot in complexipy["complexity_hotspots"][:hotpot_limit]:
+        # Security fixes (multiple items), among the first five findings
+        # when filtered
+        for position, finding in index["semgrep_errors"]:
+            if self.filtered and position >= 5:
+                break
+            fixes.append(
+                {
+                    "priority": len(fixes) + 1,
+                    "action": f"Fix {finding['category']}: {finding['file']}:{finding['line']}",
+                    "effort": "10min",
+                }
+            )
+            if self.filtered and len(fixes) >= 5:
+                break
+
+        # Complexity fixes (multiple items), among the first five hotspots
+        # when filtered
+        for position, hotspot in index["high_hotspots"]:
+            if self.filtered and position >= 5:
+                break
             if hotspot["grade"] == "F":
                 fixes.append(
                     {
@@ -504,25 +794,43 @@ class CodeQualityChecker:
             Dict with snippet, context_before, context_after
         """
         try:
-            full_path = self.workspace / file_path
-            if not full_path.exists():
+            # Convert to 0-indexed
+            idx = line - 1
+            if idx < 0:
                 return {"snippet": "", "context_before": [], "context_after": []}
 
-            with open(full_path, "r", encoding="utf-8", errors="ignore") as f:
-                lines = f.readlines()
+            # lines[0] is line number base + 1 of the file; only the lines
+            # around the issue are decoded
+            base = max(0, idx - context)
+            if file_path in self._file_line_cache or file_path in self._snippet_files_seen:
+                if file_path not in self._file_line_cache:
+                    self._file_line_cache[file_path] = self._index_lines(file_path)
+                index = self._file_line_cache[file_path]
+                lines = None if index is None else [
+                    index.data[start:end].decode("utf-8", errors="ignore")
+                    for start, end in zip(
+                        index.starts[base : idx + context + 1],
+                        index.ends[base : idx + context + 1],
+                    )
+                ]
+            else:
+                # Most files have a single issue; map it instead of reading it
+                self._snippet_files_seen.add(file_path)
+                lines = self._read_line_window(file_path, base, idx + context)
+            if lines is None:
+                return {"snippet": "", "context_before": [], "context_after": []}
 
-            # Convert to 0-indexed
-            idx = line - 1
-            if idx < 0 or idx >= len(lines):
+            pos = idx - base
+            if pos >= len(lines):
                 return {"snippet": "", "context_before": [], "context_after": []}
 
             # Extract snippet and context
-            snippet = lines[idx].rstrip()
+            snippet = lines[pos].rstrip()
             context_before = [
-                line.rstrip() for line in lines[max(0, idx - context) : idx]
+                line.rstrip() for line in lines[max(0, pos - context) : pos]
             ]
             context_after = [
-                line.rstrip() for line in lines[idx + 1 : idx + 1 + context]
+                line.rstrip() for line in lines[pos + 1 : pos + 1 + context]
             ]
 
             return {
@@ -531,17 +839,71 @@ class CodeQualityChecker:
                 "context_after": context_after,
             }
         except Exception as e:
-            self.logger.debug(f"Failed to extract snippet from {file_path}:{line}: {e}")
+            self.logger.debug("Failed to extract snippet from %s:%s: %s", file_path, line, e)
             return {"snippet": "", "context_before": [], "context_after": []}
 
+    def _source_path(self, file_path: str) -> Optional[str]:
+        """Absolute path of a reported file, or None if it does not exist."""
+        full_path = os.path.join(self._workspace_str, file_path)
+        if self._known_files is not None and full_path in self._known_files:
+            return full_path
+        return full_path if os.path.exists(full_path) else None
+
+    def _index_lines(self, file_path: str) -> Optional[_LineIndex]:
+        """
+        Read a source file once as bytes with the offsets of its lines, or
+        None if it does not exist.
+
+        Lines are split on the newlines text mode normalizes, so line
+        numbers agree with readlines(); nothing is decoded here.
+        """
+        full_path = self._source_path(file_path)
+        if full_path is None:
+            return None
+
+        stat = os.stat(full_path)
+        return _index_file(full_path, stat.st_mtime_ns, stat.st_size)
+
+    def _read_line_window(
+        self, file_path: str, first: int, last: int
+    ) -> Optional[List[str]]:
+        """
+        Read lines first..last (0-indexed, inclusive) of a source file.
+
+        The file is memory-mapped and scanned only up to the last wanted
+        line; only the wanted lines are decoded. Returns None if the file
+        does not exist, and fewer lines if it ends early.
+        """
+        full_path = self._source_path(file_path)
+        if full_path is None:
+            return None
+
+        wanted = []
+        with open(full_path, "rb") as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                return wanted
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                number = 0
+                start = 0
+                for match in _NEWLINE.finditer(mapped):
+                    if number >= first:
+                        wanted.append(mapped[start:match.start()])
+                    number += 1
+                    start = match.end()
+                    if number > last:
+                        break
+                else:
+                    # Final line without a trailing newline
+                    if start < len(mapped) and first <= number <= last:
+                        wanted.append(mapped[start:])
+        return [raw.decode("utf-8", errors="ignore") for raw in wanted]
+
     def _cluster_issues(
         self,
         critical_issues: List[Dict],
-        ruff: Dict,
         ty: Dict,
-        semgrep: Dict,
-        complexipy: Dict,
         skylos: Dict,
+        index: Dict[str, Any],
     ) -> List[Dict]:
         """
         Cluster related issues for easier bulk fixing.
@@ -552,21 +914,18 @@ class CodeQualityChecker:
         clusters = []
 
         # File-based clusters
-        file_issues: Dict[str, List[Dict]] = {}
+        file_issues: Dict[str, List[Dict]] = defaultdict(list)
         for issue in critical_issues:
-            file_key = issue.get("file", "unknown")
-            if file_key not in file_issues:
-                file_issues[file_key] = []
-            file_issues[file_key].append(issue)
+            file_issues[issue.get("file", "unknown")].append(issue)
 
         for file_path, issues in file_issues.items():
             if len(issues) >= 2:
                 clusters.append(
                     {
-                        "theme": f"Multiple issues in {Path(file_path).name}",
+                        "theme": f"Multiple issues in {os.path.basename(file_path)}",
                         "file": file_path,
                         "issue_count": len(issues),
-                        "tools": list(set(i.get("tool", "") for i in issues)),
+                        "tools": list({i.get("tool", "") for i in issues}),
                         "suggested_action": f"Review and fix {len(issues)} issues in {file_path}",
                     }
                 )
@@ -586,34 +945,26 @@ class CodeQualityChecker:
             )
 
         # Security issues
-        security_issues = [
-            f
-            for f in semgrep.get("findings", [])
-            if f.get("severity") in ["ERROR", "WARNING"]
-        ]
-        if len(security_issues) >= 2:
+        security_issues = index["security_errors"] + index["security_warnings"]
+        if security_issues >= 2:
             clusters.append(
                 {
                     "theme": "Security vulnerabilities",
                     "file": None,
-                    "issue_count": len(security_issues),
+                    "issue_count": security_issues,
                     "tools": ["semgrep"],
                     "suggested_action": "Review and fix security issues before deployment",
                 }
             )
 
         # Complexity hotspots
-        complex_funcs = [
-            h
-            for h in complexipy.get("complexity_hotspots", [])
-            if h.get("grade") in ["F", "D"]
-        ]
-        if len(complex_funcs) >= 2:
+        complex_funcs = index["high_complexity"]
+        if complex_funcs >= 2:
             clusters.append(
                 {
                     "theme": "High cognitive complexity",
                     "file": None,
-                    "issue_count": len(complex_funcs),
+                    "issue_count": complex_funcs,
                     "tools": ["complexipy"],
                     "suggested_action": "Refactor complex functions to improve maintainability",
                 }
@@ -639,18 +990,16 @@ class CodeQualityChecker:
         return clusters[:10]
 
     def _generate_next_steps(
-        self, ruff: Dict, ty: Dict, semgrep: Dict, complexipy: Dict, skylos: Dict
+        self, ty: Dict, skylos: Dict, index: Dict[str, Any]
     ) -> List[str]:
         """Generate next steps recommendations."""
         steps = []
 
         type_cov = ty.get("type_coverage", 0)
-        high_complexity = len(
-            [h for h in complexipy["complexity_hotspots"] if h["grade"] in ["F", "D"]]
-        )
+        high_complexity = index["high_complexity"]
         dead_funcs = len(skylos["dead_functions"])
         unused_imports = len(skylos["unused_imports"])
-        security_warnings = semgrep["severity_counts"].get("WARNING", 0)
+        security_warnings = index["security_warnings"]
 
         if type_cov < 80:
             steps.append(
@@ -705,6 +1054,28 @@ def main():
         action="store_true",
         help="Filter results to top issues (default: unfiltered)",
     )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=0,
+        help="Analyzers to run in parallel (default: 0, one per CPU)",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Re-analyze every file instead of reusing cached per-file results",
+    )
+    parser.add_argument(
+        "--since",
+        metavar="REF",
+        help="Only analyze files changed since a git ref and the files importing them",
+    )
+    parser.add_argument(
+        "--semgrep-config",
+        default="auto",
+        metavar="CONFIG",
+        help="Semgrep rules: registry name or local rule file/directory (default: auto)",
+    )
 
     args = parser.parse_args()
 
@@ -715,30 +1086,33 @@ def main():
         verbose=args.verbose,
         max_issues=args.max_issues,
         filtered=args.filtered,
+        jobs=args.jobs,
+        use_cache=not args.no_cache,
+        since=args.since,
+        semgrep_config=args.semgrep_config,
     )
 
-    try:
-        # Run analysis
-        results = checker.analyze()
-
-        # Determine output file
-        if args.output:
-            output_file = Path(args.output)
-        else:
-            output_file = Path(args.workspace) / "quality_report.toon"
+    # Determine output file
+    if args.output:
+        output_file = Path(args.output)
+    else:
+        output_file = Path(args.workspace) / "quality_report.toon"
 
-        # Write results in TOON format
+    # Run analysis, writing each report section in TOON format as it is
+    # built, into a temporary file that replaces the output once complete
+    tmp_file = f"{output_file}.tmp"
+    try:
         serializer = ToonSerializer(indent_size=2)
-        serializer.dump(results, str(output_file))
+        stats = serializer.dump(checker.iter_analysis(), tmp_file)
+        os.replace(tmp_file, output_file)
+        summary = checker.results["summary"]
 
         print(f"\n✅ Quality check complete! Results written to: {output_file}")
         print("\n📊 Summary:")
-        print(f"  Quality Score: {results['summary']['quality_score']}/100")
-        print(f"  Total Issues: {results['summary']['total_issues']}")
-        print(f"  Critical Issues: {len(results['critical_issues'])}")
-        print(
-            f"  Quality Gates: {sum(1 for g in results['quality_gates'] if g['status'] == 'FAIL')} FAILED"
-        )
+        print(f"  Quality Score: {summary['quality_score']}/100")
+        print(f"  Total Issues: {summary['total_issues']}")
+        print(f"  Critical Issues: {stats['critical_issues']}")
+        print(f"  Quality Gates: {stats['failed_gates']} FAILED")
 
         return 0
 
@@ -752,6 +1126,12 @@ def main():
 
             traceback.print_exc()
         return 1
+    finally:
+        # Left behind only by a failed or interrupted run
+        try:
+            os.remove(tmp_file)
+        except OSError:
+            pass
 
 
 if __name__ == "__main__":
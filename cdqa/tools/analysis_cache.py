@@ -0,0 +1,216 @@
+"""
+Per-file analysis result cache shared by the checkers.
+
+Results are stored in SQLite, one row per (tool, ruleset, key), so a file
+whose content is unchanged is not re-analyzed on later runs. Keys are
+SHA-256 content digests, computed once per run and shared between tools;
+tools whose results depend on the file's location add its path. Rows are
+pruned by last use, so the store stays bounded.
+"""
+
+import hashlib
+import json
+import logging
+import mmap
+import os
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+
+# Default store location, next to the CLI's report cache
+DEFAULT_CACHE_PATH = os.path.join(
+    os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache"),
+    "cdqa",
+    "analysis.sqlite3",
+)
+
+# SQLite limits bound parameters per statement; query digests in chunks
+_QUERY_CHUNK = 500
+
+# Rows not used for this long are removed, and the least recently used
+# beyond the row limit; results of edited files and old rulesets age out
+_MAX_AGE_SECONDS = 30 * 24 * 60 * 60
+_MAX_ROWS = 200_000
+
+# Hits are re-marked as used at most this often, to keep lookups read-mostly
+_TOUCH_INTERVAL = 60 * 60
+
+
+def file_digest(path: str) -> str:
+    """
+    SHA-256 of a file's content, hashed straight from a memory map.
+
+    Args:
+        path: File to hash
+
+    Returns:
+        Hex digest
+    """
+    with open(path, "rb") as f:
+        size = os.fstat(f.fileno()).st_size
+        if size == 0:
+            # Empty files cannot be mapped
+            return hashlib.sha256(b"").hexdigest()
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            return hashlib.sha256(mapped).hexdigest()
+
+
+class AnalysisCache:
+    """Content-addressed store of per-file tool results."""
+
+    def __init__(self, path: str = DEFAULT_CACHE_PATH):
+        """
+        Initialize the cache; the database is opened on first use.
+
+        Args:
+            path: SQLite database file
+        """
+        self.path = path
+        self.logger = logging.getLogger(__name__)
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+        self._pruned = False
+        # (path, mtime_ns, size) -> digest, so each file is hashed once per run
+        self._digests: Dict[Tuple[str, int, int], str] = {}
+
+    def __getstate__(self):
+        # Connections and locks stay in their process; workers reopen lazily
+        state = self.__dict__.copy()
+        state["_conn"] = None
+        state["_lock"] = None
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open the database and create the table if needed."""
+        if self._conn is None:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            conn = sqlite3.connect(self.path, timeout=30, check_same_thread=False)
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS results ("
+                " tool TEXT NOT NULL,"
+                " ruleset TEXT NOT NULL,"
+                " digest TEXT NOT NULL,"
+                " result TEXT NOT NULL,"
+                " last_used INTEGER NOT NULL DEFAULT 0,"
+                " PRIMARY KEY (tool, ruleset, digest))"
+            )
+            # Stores written before rows were pruned lack the column
+            columns = {row[1] for row in conn.execute("PRAGMA table_info(results)")}
+            if "last_used" not in columns:
+                conn.execute(
+                    "ALTER TABLE results ADD COLUMN last_used INTEGER NOT NULL DEFAULT 0"
+                )
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS results_last_used ON results (last_used)"
+            )
+            conn.commit()
+            self._conn = conn
+        return self._conn
+
+    def digest(self, path: str) -> Optional[str]:
+        """
+        Content digest of a file, or None if it cannot be read.
+
+        Args:
+            path: File to hash
+        """
+        try:
+            stat = os.stat(path)
+            key = (path, stat.st_mtime_ns, stat.st_size)
+            digest = self._digests.get(key)
+            if digest is None:
+                digest = file_digest(path)
+                self._digests[key] = digest
+            return digest
+        except (OSError, ValueError):
+            return None
+
+    def get_many(self, tool: str, ruleset: str, digests: Iterable[str]) -> Dict[str, Any]:
+        """
+        Look up stored results and mark the hits as used.
+
+        Args:
+            tool: Tool name
+            ruleset: Tool version and configuration fingerprint
+            digests: Content digests (or the tool's digest-based keys) to look up
+
+        Returns:
+            Mapping of digest to result for the hits
+        """
+        digests = list(dict.fromkeys(digests))
+        hits = {}
+        now = int(time.time())
+        try:
+            with self._lock:
+                conn = self._connect()
+                stale = []
+                for start in range(0, len(digests), _QUERY_CHUNK):
+                    chunk = digests[start:start + _QUERY_CHUNK]
+                    placeholders = ",".join("?" * len(chunk))
+                    rows = conn.execute(
+                        "SELECT digest, result, last_used FROM results"
+                        f" WHERE tool = ? AND ruleset = ? AND digest IN ({placeholders})",
+                        [tool, ruleset, *chunk],
+                    )
+                    for digest, result, last_used in rows:
+                        hits[digest] = json.loads(result)
+                        if now - last_used > _TOUCH_INTERVAL:
+                            stale.append((now, tool, ruleset, digest))
+                if stale:
+                    conn.executemany(
+                        "UPDATE results SET last_used = ?"
+                        " WHERE tool = ? AND ruleset = ? AND digest = ?",
+                        stale,
+                    )
+                    conn.commit()
+        except (sqlite3.Error, OSError, ValueError) as e:
+            self.logger.warning(f"Analysis cache lookup failed: {e}")
+            return {}
+        return hits
+
+    def put_many(self, tool: str, ruleset: str, results: Dict[str, Any]) -> None:
+        """
+        Store results; failures are logged and otherwise ignored.
+
+        Args:
+            tool: Tool name
+            ruleset: Tool version and configuration fingerprint
+            results: Mapping of content digest to JSON-serializable result
+        """
+        if not results:
+            return
+        now = int(time.time())
+        rows = [
+            (tool, ruleset, digest, json.dumps(result), now)
+            for digest, result in results.items()
+        ]
+        try:
+            with self._lock:
+                conn = self._connect()
+                conn.executemany(
+                    "INSERT OR REPLACE INTO results (tool, ruleset, digest, result, last_used)"
+                    " VALUES (?, ?, ?, ?, ?)",
+                    rows,
+                )
+                if not self._pruned:
+                    self._prune(conn, now)
+                    self._pruned = True
+                conn.commit()
+        except (sqlite3.Error, OSError) as e:
+            self.logger.warning(f"Analysis cache write failed: {e}")
+
+    @staticmethod
+    def _prune(conn: sqlite3.Connection, now: int) -> None:
+        """Delete rows unused for too long, then the least recently used over the limit."""
+        conn.execute("DELETE FROM results WHERE last_used < ?", (now - _MAX_AGE_SECONDS,))
+        conn.execute(
+            "DELETE FROM results WHERE rowid IN ("
+            " SELECT rowid FROM results ORDER BY last_used DESC LIMIT -1 OFFSET ?)",
+            (_MAX_ROWS,),
+        )
@@ -7,10 +7,34 @@ path normalization, and error handling to reduce code duplication.
 
 import json
 import subprocess
+import threading
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional
 import logging
 
+try:
+    import orjson
+except ImportError:  # Optional: several times faster on large tool output
+    orjson = None
+
+
+def load_json(text) -> Any:
+    """
+    Parse JSON text or bytes, with orjson when it is installed.
+
+    orjson is stricter than json (no NaN, 64-bit integers only); whatever
+    it rejects is retried with json, so results never depend on the parser.
+
+    Raises:
+        json.JSONDecodeError: If the input is not valid JSON
+    """
+    if orjson is not None:
+        try:
+            return orjson.loads(text)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(text)
+
 
 class BaseToolChecker:
     """Base class for tool checkers with common functionality."""
@@ -26,6 +50,15 @@ class BaseToolChecker:
         self.workspace = Path(workspace)
         self.tool_name = tool_name
         self.logger = logging.getLogger(__name__)
+        # Explicit files to check instead of the whole workspace; an empty
+        # list means nothing to check, not the tool's default of the cwd
+        self.targets: Optional[List[str]] = None
+
+    def _target_args(self) -> List[str]:
+        """Paths to pass to the tool: the explicit targets, or the workspace."""
+        if self.targets is None:
+            return [str(self.workspace)]
+        return list(self.targets)
 
     def _check_tool_version(self, cmd: list) -> tuple[bool, str]:
         """
@@ -89,6 +122,52 @@ class BaseToolChecker:
             self.logger.error(f"{self.tool_name} failed: {e}")
             raise
 
+    def _stream_json_lines(self, cmd: list, timeout: int = 60) -> List[Any]:
+        """
+        Run a tool that prints one JSON object per line, parsing each line
+        as it is read rather than after the tool exits.
+
+        Args:
+            cmd: Command to execute
+            timeout: Timeout in seconds
+
+        Returns:
+            Parsed objects; lines that are not valid JSON are skipped
+
+        Raises:
+            subprocess.TimeoutExpired: If the tool ran past the timeout
+        """
+        try:
+            proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL)
+        except Exception as e:
+            self.logger.error(f"{self.tool_name} failed: {e}")
+            raise
+
+        expired = threading.Event()
+
+        def expire():
+            expired.set()
+            proc.kill()
+
+        timer = threading.Timer(timeout, expire)
+        timer.start()
+        results = []
+        try:
+            with proc:
+                for line in proc.stdout:
+                    if line.strip():
+                        try:
+                            results.append(load_json(line))
+                        except json.JSONDecodeError:
+                            continue
+        finally:
+            timer.cancel()
+
+        if expired.is_set():
+            self.logger.error(f"{self.tool_name} timed out")
+            raise subprocess.TimeoutExpired(cmd, timeout)
+        return results
+
     def _parse_json_output(self, stdout: str, line_by_line: bool = False) -> Any:
         """
         Parse JSON output from tool.
@@ -108,13 +187,13 @@ class BaseToolChecker:
             for line in stdout.strip().split("\n"):
                 if line:
                     try:
-                        results.append(json.loads(line))
+                        results.append(load_json(line))
                     except json.JSONDecodeError:
                         continue
             return results
 
         try:
-            return json.loads(stdout)
+            return load_json(stdout)
         except json.JSONDecodeError as e:
             self.logger.error(f"Failed to parse {self.tool_name} JSON: {e}")
             return []
@@ -5,11 +5,168 @@ Contains common functions used by both run_QA.py and cdqa_cli.py
 to reduce code duplication.
 """
 
+import os
+import re
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Any
+from typing import Callable, Dict, Any, FrozenSet, Iterator, List, Optional
 from toon_serializer import ToonSerializer
 
 
+# Glob metacharacters; segments without them are plain directory names
+_GLOB_MAGIC = re.compile(r"[*?[]")
+
+# Common non-source directories, never descended into when collecting sources
+SOURCE_SKIP_DIRS = frozenset(("venv", ".venv", "node_modules", "__pycache__", ".git"))
+
+
+def _translate_segment(segment: str) -> str:
+    """Translate one path segment of a glob to a regex that never crosses '/'."""
+    out = []
+    i = 0
+    n = len(segment)
+    while i < n:
+        char = segment[i]
+        i += 1
+        if char == "*":
+            out.append("[^/]*")
+        elif char == "?":
+            out.append("[^/]")
+        elif char == "[":
+            j = i
+            if j < n and segment[j] == "!":
+                j += 1
+            if j < n and segment[j] == "]":
+                j += 1
+            j = segment.find("]", j)
+            if j < 0:
+                out.append("\\[")
+                continue
+            body = segment[i:j].replace("\\", "\\\\")
+            i = j + 1
+            if body.startswith("!"):
+                body = "^" + body[1:]
+            elif body.startswith("^"):
+                body = "\\" + body
+            out.append(f"[{body}]")
+        else:
+            out.append(re.escape(char))
+    return "".join(out)
+
+
+@lru_cache(maxsize=None)
+def compile_glob(pattern: str) -> Callable[[str], Optional[re.Match]]:
+    """
+    Compile a pathlib-style glob once into a matcher for relative paths.
+
+    Follows Path.glob semantics: "**" spans zero or more directories,
+    "*", "?" and "[...]" stay within one path segment.
+
+    Args:
+        pattern: Glob pattern relative to the search root
+
+    Returns:
+        Match function taking a '/'-separated path relative to the root
+    """
+    segments = pattern.split("/")
+    parts = []
+    for index, segment in enumerate(segments):
+        last = index == len(segments) - 1
+        if segment == "**":
+            parts.append(".*" if last else "(?:.*/)?")
+        else:
+            parts.append(_translate_segment(segment) + ("" if last else "/"))
+    return re.compile("".join(parts) + r"\Z", re.DOTALL).match
+
+
+def iter_glob_files(
+    root: Path, pattern: str, skip_dirs: FrozenSet[str] = frozenset()
+) -> Iterator[Path]:
+    """
+    Yield files under root matching a glob as the walk discovers them.
+
+    Walks only below the pattern's literal leading directories with
+    os.scandir, in the same order as Path.glob, without following
+    directory symlinks. Nothing is buffered beyond the current directory.
+
+    Args:
+        root: Directory to search
+        pattern: Glob pattern relative to root
+        skip_dirs: Directory names not descended into
+
+    Yields:
+        Matching file paths
+    """
+    match = compile_glob(pattern)
+
+    # Start the walk at the literal prefix, e.g. "src" for "src/**/*.py"
+    segments = pattern.split("/")[:-1]
+    base = []
+    for segment in segments:
+        if _GLOB_MAGIC.search(segment):
+            break
+        base.append(segment)
+    root = Path(root)
+    start = os.path.join(str(root), *base)
+    root_len = len(str(root).rstrip(os.sep)) + 1
+
+    # Depth-first, parents before children, siblings in directory order
+    stack = [start]
+    while stack:
+        dirpath = stack.pop()
+        rel_dir = dirpath[root_len:].replace(os.sep, "/")
+        prefix = rel_dir + "/" if rel_dir else ""
+        subdirs = []
+        try:
+            with os.scandir(dirpath) as entries:
+                for entry in entries:
+                    try:
+                        is_dir = entry.is_dir()
+                    except OSError:
+                        is_dir = False
+                    if is_dir:
+                        if entry.name not in skip_dirs and not entry.is_symlink():
+                            subdirs.append(entry.path)
+                    elif match(prefix + entry.name):
+                        yield root / (prefix + entry.name)
+        except OSError:
+            continue
+        stack.extend(reversed(subdirs))
+
+
+def iter_source_files(root: Path, pattern: str) -> Iterator[Path]:
+    """
+    Yield source files under root matching a glob, skipping non-source trees.
+
+    Files are dropped if any component of their path, root included, is in
+    SOURCE_SKIP_DIRS.
+
+    Args:
+        root: Directory to search
+        pattern: Glob pattern relative to root
+
+    Yields:
+        Matching file paths, in Path.glob order
+    """
+    for path in iter_glob_files(root, pattern, SOURCE_SKIP_DIRS):
+        if not any(part in SOURCE_SKIP_DIRS for part in path.parts):
+            yield path
+
+
+def glob_files(root: Path, pattern: str) -> List[Path]:
+    """
+    List files under root matching a glob, using the compiled matcher.
+
+    Args:
+        root: Directory to search
+        pattern: Glob pattern relative to root
+
+    Returns:
+        Matching file paths, in Path.glob order
+    """
+    return list(iter_glob_files(root, pattern))
+
+
 def run_analysis(
     checker, output_path: str = None, workspace: str = "."
 ) -> tuple[int, Dict[str, Any]]:
@@ -0,0 +1,202 @@
+"""
+Change impact analysis for incremental runs.
+
+Finds the Python files changed since a git ref and every file that
+transitively imports one of them, so checkers can be limited to the
+files a change can affect.
+"""
+
+import ast
+import logging
+import subprocess
+from collections import defaultdict, deque
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Set
+
+from analysis_cache import AnalysisCache
+from cdqa_utils import compile_glob, iter_source_files
+
+
+# Cache ruleset for per-file import lists; bump when _file_imports changes
+_IMPORTS_RULESET = "imports-1"
+
+logger = logging.getLogger(__name__)
+
+
+def _git_lines(workspace: Path, args: List[str]) -> List[str]:
+    """Run a git command in workspace and return its non-empty output lines."""
+    result = subprocess.run(
+        ["git", *args],
+        capture_output=True,
+        text=True,
+        cwd=str(workspace),
+        timeout=60,
+    )
+    if result.returncode != 0:
+        raise RuntimeError(result.stderr.strip() or f"git {args[0]} failed")
+    return [line for line in result.stdout.splitlines() if line]
+
+
+def changed_files(workspace: Path, ref: str) -> Set[str]:
+    """
+    Paths (relative to workspace) changed since ref, including uncommitted
+    and untracked files.
+
+    Args:
+        workspace: Directory inside a git work tree
+        ref: Git ref to compare against, e.g. "origin/main"
+
+    Returns:
+        '/'-separated relative paths, deleted files included
+    """
+    changed = set(_git_lines(workspace, ["diff", "--name-only", "--relative", f"{ref}...HEAD"]))
+    changed.update(_git_lines(workspace, ["diff", "--name-only", "--relative", "HEAD"]))
+    changed.update(_git_lines(workspace, ["ls-files", "--others", "--exclude-standard"]))
+    return changed
+
+
+def _module_name(rel_path: str) -> str:
+    """Dotted module name of a relative .py path; packages map to their __init__."""
+    parts = rel_path[:-3].split("/")
+    if parts[-1] == "__init__":
+        parts.pop()
+    return ".".join(parts)
+
+
+def _file_imports(path: Path, module: str) -> List[str]:
+    """
+    Absolute module names a file imports, with relative imports resolved.
+
+    For "from x import y" both "x.y" (y may be a submodule) and "x" are
+    listed; names that match no file are simply ignored later.
+    """
+    tree = ast.parse(path.read_bytes())
+    is_package = path.name == "__init__.py"
+    package = module.split(".") if is_package else module.split(".")[:-1]
+
+    imports = []
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            imports.extend(alias.name for alias in node.names)
+        elif isinstance(node, ast.ImportFrom):
+            if node.level:
+                base_parts = package[: len(package) - (node.level - 1)] if node.level > 1 else package
+                base = ".".join(base_parts + ([node.module] if node.module else []))
+            else:
+                base = node.module or ""
+            if base:
+                imports.append(base)
+            imports.extend(f"{base}.{alias.name}" if base else alias.name for alias in node.names)
+    return imports
+
+
+def impacted_files(
+    workspace: Path,
+    pattern: str,
+    ref: str,
+    cache: Optional[AnalysisCache] = None,
+) -> List[str]:
+    """
+    Files matching pattern that changed since ref or import a changed file.
+
+    Import lists are cached per file content, so the graph is cheap to
+    rebuild on later runs. Module names are matched by dotted suffix as
+    well, so src/ layouts and partial package roots still link up.
+
+    Args:
+        workspace: Root directory being analyzed
+        pattern: Glob pattern of the files being analyzed
+        ref: Git ref to compare against
+        cache: Optional per-file cache for import lists
+
+    Returns:
+        Absolute paths of the impacted files, sorted
+    """
+    workspace = Path(workspace).resolve()
+    match = compile_glob(pattern)
+
+    files = list(iter_source_files(workspace, "**/*.py"))
+    rel_paths = {path: path.relative_to(workspace).as_posix() for path in files}
+    modules = {path: _module_name(rel) for path, rel in rel_paths.items()}
+
+    # Every dotted suffix of a module name resolves to that file
+    by_name: Dict[str, Set[Path]] = defaultdict(set)
+    for path, module in modules.items():
+        parts = module.split(".")
+        for start in range(len(parts)):
+            by_name[".".join(parts[start:])].add(path)
+
+    imports = _load_imports(files, modules, cache)
+
+    # Reverse edges: imported file -> files importing it
+    importers: Dict[Path, Set[Path]] = defaultdict(set)
+    for path, names in imports.items():
+        for name in names:
+            for target in by_name.get(name, ()):
+                if target != path:
+                    importers[target].add(path)
+
+    seeds = set()
+    deleted = set()
+    for rel in changed_files(workspace, ref):
+        if not rel.endswith(".py"):
+            continue
+        path = workspace / rel
+        if path in rel_paths:
+            seeds.add(path)
+        else:
+            deleted.add(_module_name(rel))
+
+    # Deleted modules have no file; whoever still imports them is impacted
+    if deleted:
+        for path, names in imports.items():
+            if any(
+                name == module or module.endswith("." + name)
+                for name in names for module in deleted
+            ):
+                seeds.add(path)
+
+    impacted = set(seeds)
+    queue = deque(seeds)
+    while queue:
+        for importer in importers.get(queue.popleft(), ()):
+            if importer not in impacted:
+                impacted.add(importer)
+                queue.append(importer)
+
+    return sorted(str(path) for path in impacted if match(rel_paths[path]))
+
+
+def _load_imports(
+    files: Iterable[Path], modules: Dict[Path, str], cache: Optional[AnalysisCache]
+) -> Dict[Path, List[str]]:
+    """Import lists per file, from the cache where the content is unchanged."""
+    files = list(files)
+    digests = {}
+    hits = {}
+    if cache is not None:
+        digests = {path: cache.digest(str(path)) for path in files}
+        hits = cache.get_many("imports", _IMPORTS_RULESET, filter(None, digests.values()))
+
+    # Cached lists are content-keyed; relative imports depend on the module
+    # path too, so the module name is part of the stored value
+    imports = {}
+    stored = {}
+    for path in files:
+        digest = digests.get(path)
+        hit = hits.get(digest) if digest else None
+        if hit is not None and hit[0] == modules[path]:
+            imports[path] = hit[1]
+            continue
+        try:
+            imports[path] = _file_imports(path, modules[path])
+        except (SyntaxError, ValueError, OSError) as e:
+            logger.debug("Skipping imports of %s: %s", path, e)
+            imports[path] = []
+            continue
+        if digest:
+            stored[digest] = [modules[path], imports[path]]
+
+    if cache is not None:
+        cache.put_many("imports", _IMPORTS_RULESET, stored)
+    return imports
@@ -6,7 +6,7 @@ to understand by humans (not machines), based on SonarSource research.
 """
 
 from typing import Dict, Any
-from base_checker import BaseToolChecker
+from base_checker import BaseToolChecker, load_json
 
 
 class ComplexipyMetrics(BaseToolChecker):
@@ -31,13 +31,16 @@ class ComplexipyMetrics(BaseToolChecker):
         Returns:
             Dictionary with complexity metrics
         """
+        if self.targets == []:
+            return self._empty_results()
+
         is_installed, version = self._check_tool_version(["complexipy", "--version"])
         if not is_installed:
             return self._empty_results()
 
         json_file_path = None
         try:
-            cmd = ["complexipy", str(self.workspace), "--output-json", "--quiet"]
+            cmd = ["complexipy", *self._target_args(), "--output-json", "--quiet"]
             self._run_tool(cmd, timeout=60, capture_output=False)
 
             json_files = sorted(
@@ -48,10 +51,9 @@ class ComplexipyMetrics(BaseToolChecker):
 
             if json_files:
                 json_file_path = json_files[0]
-                import json
 
-                with open(json_file_path, "r") as f:
-                    functions_array = json.loads(f.read())
+                with open(json_file_path, "rb") as f:
+                    functions_array = load_json(f.read())
                     data = {"files": functions_array}
             else:
                 self.logger.warning("No complexipy results file found")
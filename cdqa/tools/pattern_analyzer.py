@@ -15,22 +15,44 @@ import ast
 import logging
 import re
 from pathlib import Path
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Optional
 from collections import defaultdict
 
+from analysis_cache import AnalysisCache
+from cdqa_utils import iter_source_files
+
+
+# Cache ruleset; bump whenever the per-file analysis changes
+_CACHE_RULESET = 'pattern-analyzer-1'
+
+# Files looked up in the cache per query while streaming the walk
+_CACHE_CHUNK = 256
+
+# Naming conventions, compiled once for every name checked
+_SNAKE_CASE = re.compile(r'^[a-z][a-z0-9_]*$')
+_CAMEL_CASE = re.compile(r'^[a-z][a-zA-Z0-9]*$')
+_PASCAL_CASE = re.compile(r'^[A-Z][a-zA-Z0-9]*$')
+
+# Logger methods that make a broad except clause count as logged
+_LOGGING_METHODS = frozenset(('error', 'exception', 'warning', 'info', 'debug'))
+
 
 class PatternAnalyzer:
     """Analyzes code patterns for consistency across a codebase."""
 
-    def __init__(self, workspace: str):
+    def __init__(self, workspace: str, cache: Optional[AnalysisCache] = None):
         """
         Initialize pattern analyzer.
 
         Args:
             workspace: Root directory of the project
+            cache: Per-file result cache; unchanged files are not re-parsed
         """
         self.workspace = Path(workspace).resolve()
+        self.cache = cache
         self.logger = logging.getLogger(__name__)
+        # Explicit files to analyze, in order, instead of walking the workspace
+        self.targets: Optional[List[str]] = None
 
     def analyze(self, pattern: str = "**/*.py") -> Dict[str, Any]:
         """
@@ -42,15 +64,8 @@ class PatternAnalyzer:
         Returns:
             Dictionary with pattern analysis results
         """
-        files = list(self.workspace.glob(pattern))
-
-        # Skip common non-source directories
-        files = [f for f in files if not any(
-            p in f.parts for p in ['venv', '.venv', 'node_modules', '__pycache__', '.git']
-        )]
-
         results = {
-            'total_files': len(files),
+            'total_files': 0,
             'consistency_issues': [],
             'total_inconsistencies': 0
         }
@@ -61,18 +76,24 @@ class PatternAnalyzer:
         import_styles = defaultdict(list)
         docstring_styles = defaultdict(list)
 
+        collected = (error_handling, naming_styles, import_styles, docstring_styles)
+
+        # Files are analyzed in small chunks as the walk finds them, never
+        # listed up front; non-source directories are not even entered
+        if self.targets is not None:
+            files = map(Path, self.targets)
+        else:
+            files = iter_source_files(self.workspace, pattern)
+        chunk = []
         for file_path in files:
-            try:
-                self._analyze_file(
-                    file_path,
-                    error_handling,
-                    naming_styles,
-                    import_styles,
-                    docstring_styles
-                )
-            except Exception as e:
-                self.logger.debug(f"Skipping {file_path}: {e}")
-                continue  # Skip files that can't be parsed
+            results['total_files'] += 1
+
+            chunk.append(file_path)
+            if len(chunk) >= _CACHE_CHUNK:
+                self._analyze_chunk(chunk, collected)
+                chunk = []
+        if chunk:
+            self._analyze_chunk(chunk, collected)
 
         # Build consistency issues from collected patterns
         results['consistency_issues'] = self._build_consistency_issues(
@@ -82,6 +103,50 @@ class PatternAnalyzer:
 
         return results
 
+    def _analyze_chunk(self, files: List[Path], collected: tuple):
+        """
+        Analyze files, reusing cached per-file pattern counts where possible.
+
+        Each file's record is a list of {style: count} dicts, one per
+        collector; merging appends the file's path count times per style,
+        exactly as the collectors would.
+        """
+        digests = {}
+        hits = {}
+        if self.cache is not None:
+            digests = {path: self.cache.digest(str(path)) for path in files}
+            hits = self.cache.get_many(
+                'pattern', _CACHE_RULESET, filter(None, digests.values())
+            )
+
+        stored = {}
+        for file_path in files:
+            digest = digests.get(file_path)
+            record = hits.get(digest) if digest else None
+            if record is None:
+                patterns = [defaultdict(list) for _ in collected]
+                try:
+                    self._analyze_file(file_path, *patterns)
+                    complete = True
+                except Exception as e:
+                    self.logger.debug("Skipping %s: %s", file_path, e)
+                    complete = False  # Skip files that can't be parsed
+                record = [
+                    {style: len(paths) for style, paths in part.items()}
+                    for part in patterns
+                ]
+                if complete and digest:
+                    stored[digest] = record
+
+            if any(record):
+                rel_path = str(file_path.relative_to(self.workspace))
+                for target, counts in zip(collected, record):
+                    for style, count in counts.items():
+                        target[style].extend([rel_path] * count)
+
+        if stored:
+            self.cache.put_many('pattern', _CACHE_RULESET, stored)
+
     def _analyze_file(
         self,
         file_path: Path,
@@ -96,67 +161,79 @@ class PatternAnalyzer:
                 content = f.read()
             tree = ast.parse(content)
         except SyntaxError as e:
-            self.logger.debug(f"Syntax error in {file_path}: {e}")
+            self.logger.debug("Syntax error in %s: %s", file_path, e)
             return
 
         rel_path = str(file_path.relative_to(self.workspace))
 
-        # Analyze error handling patterns
-        self._analyze_error_handling(tree, rel_path, error_handling)
-
-        # Analyze naming conventions
-        self._analyze_naming(tree, rel_path, naming_styles)
+        # Error handling, naming and docstrings in a single walk of the tree
+        self._analyze_nodes(tree, rel_path, error_handling, naming_styles, docstring_styles)
 
         # Analyze import styles
         self._analyze_imports(tree, rel_path, import_styles)
 
-        # Analyze docstring styles
-        self._analyze_docstrings(tree, rel_path, docstring_styles)
-
-    def _analyze_error_handling(self, tree: ast.AST, file_path: str, patterns: Dict):
-        """Analyze try/except patterns."""
+    def _analyze_nodes(
+        self,
+        tree: ast.AST,
+        file_path: str,
+        error_handling: Dict,
+        naming_styles: Dict,
+        docstring_styles: Dict
+    ):
+        """Collect the per-node patterns in one pass over the tree."""
         for node in ast.walk(tree):
             if isinstance(node, ast.Try):
-                for handler in node.handlers:
-                    if handler.type is None:
-                        patterns['bare_except'].append(file_path)
-                    elif isinstance(handler.type, ast.Name):
-                        if handler.type.id == 'Exception':
-                            # Check if there's logging in the handler
-                            has_logging = any(
-                                isinstance(n, ast.Call) and
-                                isinstance(n.func, ast.Attribute) and
-                                n.func.attr in ('error', 'exception', 'warning', 'info', 'debug')
-                                for n in ast.walk(handler)
-                            )
-                            if has_logging:
-                                patterns['except_with_logging'].append(file_path)
-                            else:
-                                patterns['except_no_logging'].append(file_path)
-                        else:
-                            patterns['specific_except'].append(file_path)
-
-    def _analyze_naming(self, tree: ast.AST, file_path: str, patterns: Dict):
-        """Analyze naming conventions."""
-        for node in ast.walk(tree):
-            if isinstance(node, ast.FunctionDef):
-                name = node.name
-                if name.startswith('_'):
-                    name = name.lstrip('_')
-                if not name:
-                    continue
-
-                if self._is_snake_case(name):
-                    patterns['func_snake_case'].append(file_path)
-                elif self._is_camel_case(name):
-                    patterns['func_camelCase'].append(file_path)
-
+                self._analyze_error_handling(node, file_path, error_handling)
+            elif isinstance(node, ast.FunctionDef):
+                self._analyze_function_name(node, file_path, naming_styles)
+                self._analyze_docstring(node, file_path, docstring_styles)
+            elif isinstance(node, ast.AsyncFunctionDef):
+                self._analyze_docstring(node, file_path, docstring_styles)
             elif isinstance(node, ast.ClassDef):
-                name = node.name
-                if self._is_pascal_case(name):
-                    patterns['class_PascalCase'].append(file_path)
-                elif self._is_snake_case(name):
-                    patterns['class_snake_case'].append(file_path)
+                self._analyze_class_name(node, file_path, naming_styles)
+                self._analyze_docstring(node, file_path, docstring_styles)
+
+    def _analyze_error_handling(self, node: ast.Try, file_path: str, patterns: Dict):
+        """Analyze the except clauses of a try statement."""
+        for handler in node.handlers:
+            if handler.type is None:
+                patterns['bare_except'].append(file_path)
+            elif isinstance(handler.type, ast.Name):
+                if handler.type.id == 'Exception':
+                    # Check if there's logging in the handler
+                    has_logging = any(
+                        isinstance(n, ast.Call) and
+                        isinstance(n.func, ast.Attribute) and
+                        n.func.attr in _LOGGING_METHODS
+                        for n in ast.walk(handler)
+                    )
+                    if has_logging:
+                        patterns['except_with_logging'].append(file_path)
+                    else:
+                        patterns['except_no_logging'].append(file_path)
+                else:
+                    patterns['specific_except'].append(file_path)
+
+    def _analyze_function_name(self, node: ast.FunctionDef, file_path: str, patterns: Dict):
+        """Analyze a function's naming convention."""
+        name = node.name
+        if name.startswith('_'):
+            name = name.lstrip('_')
+        if not name:
+            return
+
+        if self._is_snake_case(name):
+            patterns['func_snake_case'].append(file_path)
+        elif self._is_camel_case(name):
+            patterns['func_camelCase'].append(file_path)
+
+    def _analyze_class_name(self, node: ast.ClassDef, file_path: str, patterns: Dict):
+        """Analyze a class's naming convention."""
+        name = node.name
+        if self._is_pascal_case(name):
+            patterns['class_PascalCase'].append(file_path)
+        elif self._is_snake_case(name):
+            patterns['class_snake_case'].append(file_path)
 
     def _analyze_imports(self, tree: ast.AST, file_path: str, patterns: Dict):
         """Analyze import organization."""
@@ -180,37 +257,35 @@ class PatternAnalyzer:
         else:
             patterns['import_only'].append(file_path)
 
-    def _analyze_docstrings(self, tree: ast.AST, file_path: str, patterns: Dict):
-        """Analyze docstring styles."""
-        for node in ast.walk(tree):
-            if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)):
-                docstring = ast.get_docstring(node)
-                if docstring:
-                    if ':param' in docstring or ':type' in docstring:
-                        patterns['docstring_sphinx'].append(file_path)
-                    elif 'Args:' in docstring or 'Returns:' in docstring:
-                        patterns['docstring_google'].append(file_path)
-                    elif 'Parameters' in docstring and '----------' in docstring:
-                        patterns['docstring_numpy'].append(file_path)
-                    else:
-                        patterns['docstring_plain'].append(file_path)
-                else:
-                    if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
-                        # Only flag public functions without docstrings
-                        if not node.name.startswith('_'):
-                            patterns['no_docstring'].append(file_path)
+    def _analyze_docstring(self, node: ast.AST, file_path: str, patterns: Dict):
+        """Analyze the docstring style of a function or class."""
+        docstring = ast.get_docstring(node)
+        if docstring:
+            if ':param' in docstring or ':type' in docstring:
+                patterns['docstring_sphinx'].append(file_path)
+            elif 'Args:' in docstring or 'Returns:' in docstring:
+                patterns['docstring_google'].append(file_path)
+            elif 'Parameters' in docstring and '----------' in docstring:
+                patterns['docstring_numpy'].append(file_path)
+            else:
+                patterns['docstring_plain'].append(file_path)
+        else:
+            if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+                # Only flag public functions without docstrings
+                if not node.name.startswith('_'):
+                    patterns['no_docstring'].append(file_path)
 
     def _is_snake_case(self, name: str) -> bool:
         """Check if name is snake_case."""
-        return bool(re.match(r'^[a-z][a-z0-9_]*$', name))
+        return bool(_SNAKE_CASE.match(name))
 
     def _is_camel_case(self, name: str) -> bool:
         """Check if name is camelCase."""
-        return bool(re.match(r'^[a-z][a-zA-Z0-9]*$', name)) and any(c.isupper() for c in name)
+        return bool(_CAMEL_CASE.match(name)) and any(c.isupper() for c in name)
 
     def _is_pascal_case(self, name: str) -> bool:
         """Check if name is PascalCase."""
-        return bool(re.match(r'^[A-Z][a-zA-Z0-9]*$', name))
+        return bool(_PASCAL_CASE.match(name))
 
     def _build_consistency_issues(
         self,
@@ -1,24 +1,43 @@
 """
 Ruff linter integration for Python code quality checking.
 
-Runs ruff with JSON output and parses linting issues.
+Runs ruff with JSON-lines output and parses linting issues as they stream.
 """
 
-from typing import Dict, Any
+import hashlib
+import os
+from pathlib import Path
+from typing import Dict, Any, List, Optional
+from analysis_cache import AnalysisCache
 from base_checker import BaseToolChecker
+from cdqa_utils import iter_source_files
+
+try:
+    import tomllib
+except ImportError:
+    tomllib = None
+
+
+# Ruff config file names; every one that can apply is part of the cache ruleset
+_CONFIG_FILES = ("pyproject.toml", "ruff.toml", ".ruff.toml")
+
+# Files per ruff invocation when linting cache misses; keeps argv small
+_BATCH_SIZE = 256
 
 
 class RuffChecker(BaseToolChecker):
     """Wrapper for ruff linter."""
 
-    def __init__(self, workspace: str):
+    def __init__(self, workspace: str, cache: Optional[AnalysisCache] = None):
         """
         Initialize ruff checker.
 
         Args:
             workspace: Root directory to analyze
+            cache: Per-file result cache; only changed files are linted
         """
         super().__init__(workspace, "ruff")
+        self.cache = cache
 
     def check(self, pattern: str = "**/*.py") -> Dict[str, Any]:
         """
@@ -30,20 +49,141 @@ class RuffChecker(BaseToolChecker):
         Returns:
             Dictionary with linting results
         """
+        if self.targets == []:
+            return self._empty_results()
+
         is_installed, version = self._check_tool_version(["ruff", "--version"])
         if not is_installed:
             return self._empty_results()
 
         try:
-            cmd = ["ruff", "check", str(self.workspace), "--output-format=json"]
-            result = self._run_tool(cmd, timeout=120)
-
-            issues = self._parse_json_output(result.stdout) if result.stdout else []
+            issues = None
+            if self.cache is not None:
+                issues = self._check_cached(version)
+            if issues is None:
+                cmd = ["ruff", "check", *self._target_args(), "--output-format=json-lines"]
+                issues = self._stream_json_lines(cmd, timeout=120)
             return self._process_results(issues, version)
 
         except Exception:
             return self._empty_results()
 
+    def _check_cached(self, version: str) -> Optional[List[Dict[str, Any]]]:
+        """
+        Lint only files whose content has no cached result.
+
+        Returns:
+            Raw ruff issues for the checked files, or None to fall back
+            to a plain full run
+        """
+        # Same file set a full run would lint, exclusions included
+        listing = self._run_tool(["ruff", "check", "--show-files", *self._target_args()])
+        if listing.returncode != 0:
+            return None
+        files = [line for line in listing.stdout.splitlines() if line]
+
+        # Findings depend on the path too (per-file-ignores, __init__.py
+        # rules, package checks), so the key is content digest and path
+        root = self.workspace.resolve()
+        ruleset = self._ruleset(version, root)
+        keys = {}
+        for path in files:
+            digest = self.cache.digest(path)
+            if digest is not None:
+                keys[path] = f"{digest}:{Path(os.path.relpath(path, root)).as_posix()}"
+        hits = self.cache.get_many("ruff", ruleset, keys.values())
+
+        misses = [path for path in files if keys.get(path) not in hits]
+        fresh: Dict[str, List[Dict[str, Any]]] = {path: [] for path in misses}
+        for start in range(0, len(misses), _BATCH_SIZE):
+            cmd = ["ruff", "check", "--output-format=json-lines", "--force-exclude"]
+            cmd.extend(misses[start:start + _BATCH_SIZE])
+            for issue in self._stream_json_lines(cmd, timeout=120):
+                fresh.setdefault(issue.get("filename", ""), []).append(issue)
+
+        # The key carries the path; results are stored without the filename
+        stored = {}
+        for path in misses:
+            if path in keys:
+                stored[keys[path]] = [
+                    {key: value for key, value in issue.items() if key != "filename"}
+                    for issue in fresh[path]
+                ]
+        self.cache.put_many("ruff", ruleset, stored)
+
+        issues = []
+        for path in files:
+            if path in fresh:
+                issues.extend(fresh[path])
+            else:
+                issues.extend({**issue, "filename": path} for issue in hits[keys[path]])
+        issues.sort(key=lambda issue: (
+            issue.get("filename", ""),
+            issue.get("location", {}).get("row", 0),
+            issue.get("location", {}).get("column", 0),
+        ))
+        return issues
+
+    def _ruleset(self, version: str, root: Path) -> str:
+        """
+        Fingerprint of the ruff version and every configuration that can apply.
+
+        Covers config files nested in the workspace, in its parents and in
+        the user config directory, the files they extend, and the
+        workspace's top-level modules, which decide first-party imports.
+        Config paths are hashed relative to the workspace, since
+        per-file-ignores match paths relative to their config file.
+        """
+        config_home = os.environ.get("XDG_CONFIG_HOME") or os.path.join(
+            os.path.expanduser("~"), ".config"
+        )
+        queue = [path for path in iter_source_files(root, "**/*.toml") if path.name in _CONFIG_FILES]
+        queue.extend(parent / name for parent in root.parents for name in _CONFIG_FILES)
+        queue.extend(Path(config_home) / "ruff" / name for name in _CONFIG_FILES)
+
+        hasher = hashlib.sha256(version.encode("utf-8"))
+        seen = set()
+        while queue:
+            path = queue.pop(0)
+            if path in seen:
+                continue
+            seen.add(path)
+            try:
+                content = path.read_bytes()
+            except OSError:
+                continue
+            hasher.update(os.path.relpath(path, root).encode("utf-8") + b"\0" + content)
+            extended = self._extended_config(path, content)
+            if extended is not None:
+                queue.append(extended)
+
+        for source_root in (root, root / "src"):
+            try:
+                names = sorted(
+                    entry.name for entry in os.scandir(source_root)
+                    if entry.name.endswith(".py") or entry.is_dir()
+                )
+            except OSError:
+                continue
+            hasher.update(repr((source_root.name, names)).encode("utf-8"))
+        return hasher.hexdigest()
+
+    @staticmethod
+    def _extended_config(path: Path, content: bytes) -> Optional[Path]:
+        """The config file that a ruff config's "extend" setting points to, if any."""
+        if tomllib is None:
+            return None
+        try:
+            data = tomllib.loads(content.decode("utf-8"))
+        except (UnicodeDecodeError, tomllib.TOMLDecodeError):
+            return None
+        if path.name == "pyproject.toml":
+            data = data.get("tool", {}).get("ruff", {})
+        extend = data.get("extend")
+        if not isinstance(extend, str):
+            return None
+        return (path.parent / os.path.expanduser(extend)).resolve()
+
     def _process_results(self, issues: list, version: str) -> Dict[str, Any]:
         """Process raw ruff results into structured format."""
         severity_counts = {"error": 0, "warning": 0, "info": 0}
@@ -4,21 +4,170 @@ Semgrep security scanner integration for pattern-based analysis.
 Runs semgrep with security rules and parses findings.
 """
 
-from typing import Dict, Any
+import hashlib
+import json
+import keyword
+import mmap
+import os
+import re
+from pathlib import Path
+from typing import Dict, Any, Iterable, List, Optional, Set
+from analysis_cache import AnalysisCache
 from base_checker import BaseToolChecker
+from cdqa_utils import iter_glob_files
+
+
+# Rule file suffixes read from a local --config file or directory
+_RULE_SUFFIXES = (".yml", ".yaml", ".json")
+
+# Languages whose rules are prefiltered; other rules disable the prefilter
+_PYTHON_LANGUAGES = frozenset(("python", "py", "python2", "python3"))
+
+# Identifiers in a pattern; string literals are blanked out first
+_IDENTIFIER = re.compile(r"\$(?:\.\.\.)?[A-Za-z_][A-Za-z0-9_]*|[A-Za-z_][A-Za-z0-9_]*")
+_STRING_LITERAL = re.compile(r"\"(?:\\.|[^\"\\])*\"|'(?:\\.|[^'\\])*'")
+
+# Typed metavariables name types that need not appear in the source
+_TYPED_METAVARIABLE = re.compile(r"\(\s*\$[A-Z_][A-Z0-9_]*\s*:")
+
+# Workspace ignore files whose content is part of the cache ruleset
+_IGNORE_FILES = (".semgrepignore",)
+
+# Glob metacharacters escaped when an --include must match one exact path
+_GLOB_SPECIAL = re.compile(r"([\\*?\[\]!#])")
+
+# Positive operators inside "patterns"; any one of them is required
+_REQUIRED_OPERATORS = ("pattern", "pattern-either", "patterns", "pattern-inside")
+
+
+def rule_files(config: str) -> List[Path]:
+    """
+    Local rule files behind a semgrep --config value.
+
+    Args:
+        config: A rule file, a directory of rule files, or a registry name
+
+    Returns:
+        The rule files, sorted; empty for registry configs such as "auto"
+    """
+    path = Path(config)
+    if path.is_file():
+        return [path]
+    if path.is_dir():
+        return sorted(
+            rule for rule in path.rglob("*")
+            if rule.suffix in _RULE_SUFFIXES and rule.is_file()
+        )
+    return []
+
+
+def _pattern_needles(pattern: Any) -> Optional[Set[str]]:
+    """
+    A literal a file must contain for the pattern to match it.
+
+    Uses the longest identifier that is neither a metavariable nor a
+    keyword; None if the pattern has no such identifier.
+    """
+    if not isinstance(pattern, str) or _TYPED_METAVARIABLE.search(pattern):
+        return None
+    names = [
+        name for name in _IDENTIFIER.findall(_STRING_LITERAL.sub(" ", pattern))
+        if not name.startswith("$") and not keyword.iskeyword(name)
+    ]
+    if not names:
+        return None
+    return {max(names, key=len)}
+
+
+def _formula_needles(formula: Any) -> Optional[Set[str]]:
+    """
+    Literals of which a file must contain at least one to match the formula.
+
+    Returns None when the formula cannot be reduced to literals, in which
+    case no file may be skipped on its account.
+    """
+    if not isinstance(formula, dict):
+        return None
+    if "pattern" in formula:
+        return _pattern_needles(formula["pattern"])
+    if "pattern-inside" in formula:
+        return _pattern_needles(formula["pattern-inside"])
+    if "pattern-either" in formula:
+        needles = set()
+        for branch in formula["pattern-either"] or ():
+            branch_needles = _formula_needles(branch)
+            if branch_needles is None:
+                return None
+            needles |= branch_needles
+        return needles or None
+    if "patterns" in formula:
+        # A conjunction: any one required operand's literals will do
+        for operand in formula["patterns"] or ():
+            if isinstance(operand, dict) and any(op in operand for op in _REQUIRED_OPERATORS):
+                needles = _formula_needles(operand)
+                if needles is not None:
+                    return needles
+    return None
+
+
+def rule_needles(rules: Iterable[Any]) -> Optional[Set[str]]:
+    """
+    Literals of which a file must contain at least one to match any rule.
+
+    Args:
+        rules: Parsed semgrep rules
+
+    Returns:
+        The literals, or None when some rule cannot be prefiltered (taint
+        mode, regex patterns, non-Python languages, ...)
+    """
+    needles = set()
+    for rule in rules:
+        if not isinstance(rule, dict) or rule.get("mode", "search") != "search":
+            return None
+        languages = rule.get("languages") or ()
+        if not languages or not all(str(lang).lower() in _PYTHON_LANGUAGES for lang in languages):
+            return None
+        rule_literals = _formula_needles(rule)
+        if rule_literals is None:
+            return None
+        needles |= rule_literals
+    return needles
+
+
+def _contains_any(path: str, needles: "re.Pattern[bytes]") -> bool:
+    """Whether a file contains any literal; unreadable files are kept."""
+    try:
+        with open(path, "rb") as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                return False
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                return needles.search(mapped) is not None
+    except (OSError, ValueError):
+        return True
 
 
 class SemgrepScanner(BaseToolChecker):
     """Wrapper for semgrep security scanner."""
 
-    def __init__(self, workspace: str):
+    def __init__(
+        self, workspace: str, config: str = "auto", cache: Optional[AnalysisCache] = None
+    ):
         """
         Initialize semgrep scanner.
 
         Args:
             workspace: Root directory to analyze
+            config: Semgrep --config value; local rule files also enable
+                skipping files that contain none of the rules' literals
+            cache: Per-file result cache; with local rules, only changed
+                files are scanned
         """
         super().__init__(workspace, "semgrep")
+        self.config = config
+        self.cache = cache
+        # Semgrep --jobs; None leaves semgrep's default of one per CPU
+        self.jobs: Optional[int] = None
 
     def scan(self, pattern: str = "**/*.py") -> Dict[str, Any]:
         """
@@ -30,6 +179,9 @@ class SemgrepScanner(BaseToolChecker):
         Returns:
             Dictionary with security findings
         """
+        if self.targets == []:
+            return self._empty_results()
+
         is_installed, version = self._check_tool_version(["semgrep", "--version"])
         if not is_installed:
             return self._empty_results()
@@ -38,11 +190,26 @@ class SemgrepScanner(BaseToolChecker):
             cmd = [
                 "semgrep",
                 "scan",
-                "--config=auto",
+                f"--config={self.config}",
                 "--json",
                 "--quiet",
-                str(self.workspace),
             ]
+            if self.jobs is not None:
+                cmd.append(f"--jobs={self.jobs}")
+            survivors = self._prefilter(pattern)
+            if survivors is not None and not survivors:
+                return self._process_results([], version)
+            # Registry rules can change between runs; only local ones are cached
+            if self.cache is not None and rule_files(self.config):
+                if survivors is None:
+                    survivors = list(self._candidates(pattern))
+                findings = self._scan_cached(cmd, survivors, version)
+                return self._process_results(findings, version)
+
+            if survivors is None:
+                cmd.extend(self._target_args())
+            else:
+                cmd.extend(self._file_args(survivors))
             result = self._run_tool(cmd, timeout=300)
 
             data = self._parse_json_output(result.stdout) if result.stdout else {}
@@ -53,6 +220,152 @@ class SemgrepScanner(BaseToolChecker):
         except Exception:
             return self._empty_results()
 
+    def _prefilter(self, pattern: str) -> Optional[List[str]]:
+        """
+        Candidate files containing at least one literal the rules require.
+
+        Files are memory-mapped and searched with one compiled regex of all
+        literals, so each is read once at C speed.
+
+        Returns:
+            The surviving files, or None when the rules cannot be prefiltered
+        """
+        needles = self._load_needles()
+        if not needles:
+            return None
+
+        regex = re.compile(b"|".join(
+            re.escape(needle.encode("utf-8"))
+            for needle in sorted(needles, key=len, reverse=True)
+        ))
+        survivors = [path for path in self._candidates(pattern) if _contains_any(path, regex)]
+        self.logger.debug(f"semgrep prefilter kept {len(survivors)} files")
+        return survivors
+
+    def _candidates(self, pattern: str) -> Iterable[str]:
+        """Files the scan may cover: the explicit targets, or the pattern's matches."""
+        if self.targets is not None:
+            return self.targets
+        return (
+            str(path) for path in iter_glob_files(self.workspace, pattern, frozenset((".git",)))
+        )
+
+    def _file_args(self, paths: List[str]) -> List[str]:
+        """Arguments limiting a scan to the given files."""
+        if self.targets is not None:
+            return list(paths)
+        # Semgrep still walks the workspace, so its ignores apply. Each
+        # --include is a glob, so it is escaped and anchored to the scan root
+        args = [
+            "--include=/" + _GLOB_SPECIAL.sub(r"\\\1", self._normalize_path(path))
+            for path in paths
+        ]
+        args.append(str(self.workspace))
+        return args
+
+    def _scan_cached(self, cmd: list, paths: List[str], version: str) -> List[Dict[str, Any]]:
+        """
+        Scan only files whose content has no cached result.
+
+        Results are only stored from a scan that completed, and not for
+        files semgrep reported errors on.
+
+        Returns:
+            Raw semgrep findings for all paths
+        """
+        # Rules can include or exclude paths, so the key is content digest
+        # and workspace-relative path
+        ruleset = self._ruleset(version)
+        keys = {}
+        for path in paths:
+            digest = self.cache.digest(path)
+            if digest is not None:
+                keys[path] = f"{digest}:{self._normalize_path(path)}"
+        hits = self.cache.get_many("semgrep", ruleset, keys.values())
+
+        misses = [path for path in paths if keys.get(path) not in hits]
+        fresh: Dict[str, List[Dict[str, Any]]] = {path: [] for path in misses}
+        if misses:
+            result = self._run_tool([*cmd, *self._file_args(misses)], timeout=300)
+            data = self._parse_json_output(result.stdout) if result.stdout else {}
+            if not isinstance(data, dict):
+                data = {}
+            by_relative = {self._normalize_path(path): path for path in misses}
+            for finding in data.get("results", []):
+                reported = finding.get("path", "")
+                path = by_relative.get(self._normalize_path(reported), reported)
+                fresh.setdefault(path, []).append(finding)
+
+            if "results" in data:
+                failed = {
+                    by_relative.get(self._normalize_path(error.get("path", "")))
+                    for error in data.get("errors", [])
+                    if isinstance(error, dict)
+                }
+                # The key carries the path; findings are stored without it
+                stored = {}
+                for path in misses:
+                    if path in keys and path not in failed:
+                        stored[keys[path]] = [
+                            {key: value for key, value in finding.items() if key != "path"}
+                            for finding in fresh[path]
+                        ]
+                self.cache.put_many("semgrep", ruleset, stored)
+
+        findings = []
+        for path in paths:
+            if path in fresh:
+                findings.extend(fresh.pop(path))
+            else:
+                findings.extend({**finding, "path": path} for finding in hits[keys[path]])
+        # Findings on files semgrep reported under another name
+        for extra in fresh.values():
+            findings.extend(extra)
+        findings.sort(key=lambda finding: (
+            self._normalize_path(finding.get("path", "")),
+            finding.get("start", {}).get("line", 0),
+            finding.get("start", {}).get("col", 0),
+        ))
+        return findings
+
+    def _ruleset(self, version: str) -> str:
+        """Fingerprint of the semgrep version, the local rules and the ignore files."""
+        hasher = hashlib.sha256(version.encode("utf-8"))
+        for path in rule_files(self.config):
+            hasher.update(str(path).encode("utf-8") + path.read_bytes())
+        for name in _IGNORE_FILES:
+            try:
+                hasher.update(name.encode("utf-8") + (self.workspace / name).read_bytes())
+            except OSError:
+                continue
+        return hasher.hexdigest()
+
+    def _load_needles(self) -> Optional[Set[str]]:
+        """Required literals of the local rules, or None if unavailable."""
+        files = rule_files(self.config)
+        if not files:
+            return None
+        try:
+            import yaml
+        except ImportError:
+            return None
+
+        rules = []
+        try:
+            for path in files:
+                with open(path, "r", encoding="utf-8") as f:
+                    if path.suffix == ".json":
+                        document = json.load(f)
+                    else:
+                        document = yaml.safe_load(f)
+                if not isinstance(document, dict) or not isinstance(document.get("rules"), list):
+                    return None
+                rules.extend(document["rules"])
+        except (OSError, ValueError, yaml.YAMLError) as e:
+            self.logger.debug(f"Cannot prefilter semgrep rules: {e}")
+            return None
+        return rule_needles(rules)
+
     def _process_results(self, findings: list, version: str) -> Dict[str, Any]:
         """Process raw semgrep results into structured format."""
         severity_counts = {"ERROR": 0, "WARNING": 0, "INFO": 0}
@@ -13,11 +13,35 @@ TOON Specification v3.0 Compliance:
 - Numbers: canonical decimal form, no exponents
 """
 
-from typing import Any, Dict, List
+from typing import Any, BinaryIO, Dict, Iterator, List, Tuple
 from datetime import datetime
 import re
 
 
+# Output buffer for dump(); chunks are batched into few large writes
+_WRITE_BUFFER_SIZE = 1 << 20
+
+# Lines encoded and written together by dump_to_stream()
+_LINE_BATCH = 1024
+
+# Quoting rules, compiled once instead of looked up on every value
+_BARE_KEY = re.compile(r"^[A-Za-z_][A-Za-z0-9_.]*$")
+_NUMERIC_LIKE = re.compile(r"^-?\d+(?:\.\d+)?(?:e[+-]?\d+)?$")
+_LEADING_ZERO = re.compile(r"^0\d+$")
+# Structural characters and control characters that force quoting
+_QUOTE_CHARS = re.compile(r'[:"\\\[\]{}\n\r\t]')
+
+
+def _at_least_one_line(lines: Iterator[str]) -> Iterator[str]:
+    """Yield lines, or one empty line if there are none, as joining them would."""
+    empty = True
+    for line in lines:
+        empty = False
+        yield line
+    if empty:
+        yield ""
+
+
 class ToonSerializer:
     """Serializes Python data structures to TOON format (spec v3.0 compliant)."""
 
@@ -42,7 +66,7 @@ class ToonSerializer:
         Returns:
             Quoted or unquoted key
         """
-        if re.match(r"^[A-Za-z_][A-Za-z0-9_.]*$", key):
+        if _BARE_KEY.match(key):
             return key
         return f'"{key}"'
 
@@ -99,15 +123,12 @@ class ToonSerializer:
             return True
 
         # Numeric-like patterns
-        if re.match(r"^-?\d+(?:\.\d+)?(?:e[+-]?\d+)?$", lower_val):
+        if _NUMERIC_LIKE.match(lower_val):
             return True
-        if re.match(r"^0\d+$", value):
+        if _LEADING_ZERO.match(value):
             return True
 
-        if any(char in value for char in [":", '"', "\\", "[", "]", "{", "}"]):
-            return True
-
-        if any(char in value for char in ["\n", "\r", "\t"]):
+        if _QUOTE_CHARS.search(value):
             return True
 
         # Delimiter checking (comma is default)
@@ -177,7 +198,10 @@ class ToonSerializer:
 
     def _serialize_dict(self, data: Dict, indent_level: int) -> str:
         """Serialize dictionary to TOON format."""
-        lines = []
+        return "\n".join(self._iter_dict_lines(data, indent_level))
+
+    def _iter_dict_lines(self, data: Dict, indent_level: int) -> Iterator[str]:
+        """Yield the lines of a serialized dictionary one at a time."""
         indent = " " * (indent_level * self.indent_size)
 
         for key, value in data.items():
@@ -187,21 +211,17 @@ class ToonSerializer:
                 and self._is_uniform_list(value)
             ):
                 # Use tabular TOON format for uniform lists
-                lines.append(self._serialize_uniform_list(value, indent_level, key))
+                yield from self._iter_uniform_list_lines(value, indent_level, key)
             elif isinstance(value, list):
                 # Use regular format for small/non-uniform lists
-                lines.append(self._serialize_list(value, indent_level, key))
+                yield from self._iter_list_lines(value, indent_level, key)
             elif isinstance(value, dict):
                 # Nested dictionary
-                lines.append(f"{indent}{self._quote_key(key)}:")
-                lines.append(self._serialize_dict(value, indent_level + 1))
+                yield f"{indent}{self._quote_key(key)}:"
+                yield from _at_least_one_line(self._iter_dict_lines(value, indent_level + 1))
             else:
                 # Simple key-value pair
-                lines.append(
-                    f"{indent}{self._quote_key(key)}: {self._serialize_primitive(value)}"
-                )
-
-        return "\n".join(lines)
+                yield f"{indent}{self._quote_key(key)}: {self._serialize_primitive(value)}"
 
     def _serialize_list(self, data: List, indent_level: int, key: str = "") -> str:
         """
@@ -212,46 +232,41 @@ class ToonSerializer:
             indent_level: Current indentation level
             key: Key name for array (optional)
         """
-        if not data:
-            return " " * (indent_level * self.indent_size) + "[]"
+        return "\n".join(self._iter_list_lines(data, indent_level, key))
 
+    def _iter_list_lines(self, data: List, indent_level: int, key: str = "") -> Iterator[str]:
+        """Yield the lines of a serialized list one at a time."""
         indent = " " * (indent_level * self.indent_size)
+        if not data:
+            yield indent + "[]"
+            return
+
+        key_prefix = f"{self._quote_key(key)}" if key else ""
 
         # If all items are strings, use simplified format
         if all(isinstance(item, str) for item in data):
-            key_prefix = f"{self._quote_key(key)}" if key else ""
-            header_line = f"{indent}{key_prefix}[{len(data)}]:"
-            return (
-                header_line
-                + "\n"
-                + "\n".join(
-                    [f"{indent}{self._serialize_primitive(item)}" for item in data]
-                )
-            )
+            yield f"{indent}{key_prefix}[{len(data)}]:"
+            for item in data:
+                yield f"{indent}{self._serialize_primitive(item)}"
+            return
 
         # Check if this is a uniform list suitable for tabular format
         if len(data) >= 5 and self._is_uniform_list(data):
-            return self._serialize_uniform_list(data, indent_level, key)
+            yield from self._iter_uniform_list_lines(data, indent_level, key)
+            return
 
         # Otherwise, serialize as regular list
-        lines = []
-        key_prefix = f"{self._quote_key(key)}" if key else ""
-        header_line = f"{indent}{key_prefix}[{len(data)}]:"
-        lines.append(header_line)
+        yield f"{indent}{key_prefix}[{len(data)}]:"
 
         for item in data:
             if isinstance(item, dict):
                 # Multi-line dict item
-                lines.append(f"{indent}-")
-                lines.append(self._serialize_dict(item, indent_level + 1))
+                yield f"{indent}-"
+                yield from _at_least_one_line(self._iter_dict_lines(item, indent_level + 1))
             elif isinstance(item, list):
-                lines.append(
-                    f"{indent}- {self._serialize_list(item, indent_level + 1)}"
-                )
+                yield f"{indent}- {self._serialize_list(item, indent_level + 1)}"
             else:
-                lines.append(f"{indent}- {self._serialize_primitive(item)}")
-
-        return "\n".join(lines)
+                yield f"{indent}- {self._serialize_primitive(item)}"
 
     def _is_uniform_list(self, data: List) -> bool:
         """
@@ -285,10 +300,15 @@ class ToonSerializer:
         Returns:
             TOON tabular format string
         """
+        return "\n".join(self._iter_uniform_list_lines(data, indent_level, key))
+
+    def _iter_uniform_list_lines(
+        self, data: List[Dict], indent_level: int, key: str = ""
+    ) -> Iterator[str]:
+        """Yield the header and rows of a tabular list one at a time."""
         if not data:
-            return ""
+            return
 
-        lines = []
         indent = " " * (indent_level * self.indent_size)
 
         # Get column headers from first item
@@ -296,17 +316,14 @@ class ToonSerializer:
 
         # Write header: key[N] {field1, field2, ...}:
         key_prefix = f"{self._quote_key(key)}" if key else ""
-        header_line = f"{indent}{key_prefix}[{len(data)}] {{{', '.join(headers)}}}:"
-        lines.append(header_line)
+        yield f"{indent}{key_prefix}[{len(data)}] {{{', '.join(headers)}}}:"
 
         # Write data rows using comma delimiter (default) at depth + 1
         row_indent = " " * ((indent_level + 1) * self.indent_size)
         for item in data:
             values = [self._serialize_cell_value(item[key]) for key in headers]
             row = ", ".join(values)
-            lines.append(f"{row_indent}{row}")
-
-        return "\n".join(lines)
+            yield f"{row_indent}{row}"
 
     def _serialize_cell_value(self, value: Any) -> str:
         """
@@ -448,17 +465,93 @@ class ToonSerializer:
         """
         return self.serialize(data, indent_level=0)
 
-    def dump(self, data: Any, file_path: str):
+    def _iter_entries(self, data: Any) -> Iterator[Tuple[Any, Any, Iterator[str]]]:
+        """
+        Yield (key, value, lines) per top-level entry; key is None for non-dicts.
+
+        An iterator of (key, value) pairs is serialized like the dict it
+        would build, one pair at a time as the iterator produces them. The
+        lines of an entry are produced lazily, so a long list is never held
+        as one string.
+        """
+        if isinstance(data, dict):
+            data = iter(data.items())
+        if isinstance(data, Iterator):
+            for key, value in data:
+                yield key, value, self._iter_dict_lines({key: value}, 0)
+        else:
+            yield None, data, iter((self.serialize(data, indent_level=0),))
+
+    def iter_chunks(self, data: Any) -> Iterator[str]:
+        """
+        Serialize data to TOON format one top-level entry at a time.
+
+        Joining the chunks with newlines gives exactly dumps(data).
+
+        Args:
+            data: Data to serialize
+
+        Yields:
+            TOON-formatted chunks
+        """
+        for _, _, lines in self._iter_entries(data):
+            yield "\n".join(lines)
+
+    def dump_to_stream(self, data: Any, stream: BinaryIO) -> Dict[str, int]:
+        """
+        Serialize data to TOON format and write it to a binary stream.
+
+        Lines are written in batches as they are produced, so neither the
+        document nor any one section is held in memory as a whole.
+        With an iterator of (key, value) pairs, each top-level entry is
+        written as soon as it is yielded.
+
+        Args:
+            data: Data to serialize, or an iterator of top-level (key, value) pairs
+            stream: Writable binary stream
+
+        Returns:
+            Report counts gathered while writing: critical_issues (length of
+            the top-level critical_issues list) and failed_gates (entries of
+            quality_gates with status FAIL)
+        """
+        stats = {"critical_issues": 0, "failed_gates": 0}
+        separator = b""
+        for key, value, lines in self._iter_entries(data):
+            batch = []
+            for line in lines:
+                batch.append(line)
+                if len(batch) >= _LINE_BATCH:
+                    stream.write(separator + "\n".join(batch).encode("utf-8"))
+                    separator = b"\n"
+                    batch = []
+            if batch:
+                stream.write(separator + "\n".join(batch).encode("utf-8"))
+            separator = b"\n"
+
+            # Count while the entry is fresh rather than in a later pass
+            if key == "critical_issues" and isinstance(value, list):
+                stats["critical_issues"] = len(value)
+            elif key == "quality_gates" and isinstance(value, list):
+                stats["failed_gates"] = sum(
+                    isinstance(gate, dict) and gate.get("status") == "FAIL"
+                    for gate in value
+                )
+        return stats
+
+    def dump(self, data: Any, file_path: str) -> Dict[str, int]:
         """
         Serialize data to TOON format and write to file.
 
         Args:
             data: Data to serialize
             file_path: Output file path
+
+        Returns:
+            Report counts, as from dump_to_stream()
         """
-        toon_str = self.dumps(data)
-        with open(file_path, "w", encoding="utf-8") as f:
-            f.write(toon_str)
+        with open(file_path, "wb", buffering=_WRITE_BUFFER_SIZE) as f:
+            return self.dump_to_stream(data, f)
 
 
 def dumps(data: Any, indent: int = 2) -> str:
@@ -6,8 +6,9 @@ Runs ty with JSON output and parses type checking errors.
 """
 
 from pathlib import Path
-from typing import Dict, Any
+from typing import Dict, Any, List, Optional
 from base_checker import BaseToolChecker
+from cdqa_utils import iter_source_files
 
 
 class TyChecker(BaseToolChecker):
@@ -21,6 +22,9 @@ class TyChecker(BaseToolChecker):
             workspace: Root directory to analyze
         """
         super().__init__(workspace, "ty")
+        # Python files of the workspace when the caller has already walked
+        # it; counted instead of walking it again
+        self.source_files: Optional[List[str]] = None
 
     def analyze(self, pattern: str = "**/*.py") -> Dict[str, Any]:
         """
@@ -32,12 +36,15 @@ class TyChecker(BaseToolChecker):
         Returns:
             Dictionary with type checking results
         """
+        if self.targets == []:
+            return self._empty_results()
+
         is_installed, version = self._check_tool_version(["ty", "--version"])
         if not is_installed:
             return self._empty_results()
 
         try:
-            cmd = ["ty", "check", str(self.workspace), "--output-format", "json"]
+            cmd = ["ty", "check", *self._target_args(), "--output-format", "json"]
             result = self._run_tool(cmd, timeout=60)
 
             errors = (
@@ -56,8 +63,13 @@ class TyChecker(BaseToolChecker):
         all_errors = []
         files_with_errors = set()
 
-        python_files = list(self.workspace.rglob("*.py"))
-        total_files = len(python_files)
+        if self.targets is not None:
+            total_files = len(self.targets)
+        elif self.source_files is not None:
+            total_files = len(self.source_files)
+        else:
+            # ty does not check virtualenvs, .git and the like either
+            total_files = sum(1 for _ in iter_source_files(self.workspace, "**/*.py"))
 
         for error in errors:
             code = error.get("code", error.get("rule", "general"))
@@ -102,7 +114,7 @@ class TyChecker(BaseToolChecker):
             if total_files > 0
             else 0
         )
-        total_errors = len([e for e in all_errors if e["severity"] == "error"])
+        total_errors = sum(1 for e in all_errors if e["severity"] == "error")
 
         return {
             "version": version,